@@ -0,0 +1,202 @@
+# bronze/batch_ids.py
+"""
+Consulta em lote de cervejarias por ID (endpoint ``by_ids``).
+
+Aceita qualquer iterável de IDs (inclusive milhões, lidos de um arquivo ou de
+uma tabela Silver), divide em lotes respeitando o máximo de IDs por
+requisição e o tamanho máximo da URL, dispara os lotes em paralelo e devolve
+os registros em streaming, na mesma ordem dos IDs de entrada, junto com a
+lista de IDs não encontrados.
+
+Uso (a partir de ``src/``):
+    python -m bronze.batch_ids ids.txt
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from bronze.extractor import BASE_URL, OUTPUT_DIR, save_raw_data
+from bronze.writer import NDJSONWriter, ndjson_path
+from utils.http_client import get_json
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+MAX_IDS_PER_REQUEST = 50    # IDs por requisição (per_page máximo da API é 200)
+MAX_URL_LENGTH = 2000       # caracteres
+MAX_IN_FLIGHT = 8           # lotes buscados simultaneamente
+PAGE_SIZE = 10_000          # IDs por página de leitura do arquivo
+SEPARATOR_LENGTH = 3        # "," é codificada como %2C na query string
+
+
+def chunk_ids(ids: Iterable[str], chunk_size: int = MAX_IDS_PER_REQUEST,
+              max_url_length: int = MAX_URL_LENGTH) -> Iterator[List[str]]:
+    """
+    Divide os IDs em lotes sem ultrapassar o limite de IDs nem o da URL
+
+    Args:
+        ids: IDs de entrada (qualquer iterável, lido sob demanda)
+        chunk_size: Máximo de IDs por lote
+        max_url_length: Tamanho máximo da URL gerada
+
+    Returns:
+        Iterador de lotes, na ordem de entrada
+    """
+    base_length = len(f"{BASE_URL}?by_ids=&per_page={chunk_size}")
+    chunk: List[str] = []
+    length = base_length
+
+    for brewery_id in ids:
+        brewery_id = str(brewery_id).strip()
+        if not brewery_id:
+            continue
+        extra = len(brewery_id) + (SEPARATOR_LENGTH if chunk else 0)
+        if chunk and (len(chunk) >= chunk_size or length + extra > max_url_length):
+            yield chunk
+            chunk, length = [], base_length
+            extra = len(brewery_id)
+        chunk.append(brewery_id)
+        length += extra
+
+    if chunk:
+        yield chunk
+
+
+def fetch_chunk(chunk: List[str], use_cache: bool = True) -> Dict[str, Dict]:
+    """Busca um lote de IDs e indexa o resultado por ID (use_cache=False força a API)"""
+    unique = list(dict.fromkeys(chunk))
+    data = get_json(BASE_URL, {"by_ids": ",".join(unique), "per_page": len(unique)}, use_cache=use_cache)
+    if not isinstance(data, list):
+        raise ValueError(f"Resposta inesperada da API: {data}")
+    return {brewery["id"]: brewery for brewery in data}
+
+
+def lookup_breweries(ids: Iterable[str], chunk_size: int = MAX_IDS_PER_REQUEST,
+                     max_in_flight: int = MAX_IN_FLIGHT,
+                     missing: Optional[List[str]] = None,
+                     use_cache: bool = True) -> Iterator[Dict]:
+    """
+    Busca cervejarias por ID em lotes paralelos
+
+    Args:
+        ids: IDs de entrada (qualquer iterável, lido sob demanda)
+        chunk_size: Máximo de IDs por requisição
+        max_in_flight: Lotes buscados simultaneamente
+        missing: Lista que recebe os IDs não encontrados na API
+        use_cache: False ignora o cache de respostas (TTL de by_ids é longo)
+
+    Returns:
+        Iterador de cervejarias na ordem dos IDs de entrada
+
+    Exemplo:
+        missing = []
+        for brewery in lookup_breweries(read_ids("ids.txt"), missing=missing):
+            ...
+    """
+    chunks = chunk_ids(ids, chunk_size)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append((chunk, executor.submit(fetch_chunk, chunk, use_cache)))
+            return True
+
+        # Mantém no máximo 2x max_in_flight lotes à frente do consumidor
+        for _ in range(max_in_flight * 2):
+            if not submit_next():
+                break
+
+        while pending:
+            chunk, future = pending.popleft()
+            found = future.result()
+            submit_next()
+            for brewery_id in chunk:
+                brewery = found.get(brewery_id)
+                if brewery is not None:
+                    yield brewery
+                elif missing is not None:
+                    missing.append(brewery_id)
+
+
+def read_ids(path: str, column: str = "id") -> Iterator[str]:
+    """
+    Lê IDs de um arquivo sob demanda
+
+    Args:
+        path: Arquivo texto (um ID por linha) ou Parquet (ex: tabela Silver)
+        column: Coluna de IDs quando o arquivo é Parquet
+
+    Returns:
+        Iterador de IDs
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=PAGE_SIZE, columns=[column]):
+            yield from (value for value in batch.column(0).to_pylist() if value)
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield line.strip()
+
+
+def run_extraction(ids_path: str, compression: Optional[str] = "gzip") -> Optional[Path]:
+    """
+    Atualiza as cervejarias listadas em um arquivo de IDs
+
+    A atualização sempre consulta a API: o cache de respostas de by_ids tem
+    TTL de dias e devolveria os registros da execução anterior.
+
+    Args:
+        ids_path: Arquivo de IDs (texto ou Parquet)
+        compression: None, 'gzip' ou 'zstd'
+
+    Returns:
+        Caminho do arquivo NDJSON gerado ou None em caso de erro
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = ndjson_path(OUTPUT_DIR, f"breweries_by_ids_{timestamp}", compression)
+    missing: List[str] = []
+
+    try:
+        with NDJSONWriter(filepath, params={"source": str(ids_path)}) as writer:
+            batch = []
+            for brewery in lookup_breweries(read_ids(ids_path), missing=missing, use_cache=False):
+                batch.append(brewery)
+                if len(batch) >= PAGE_SIZE:
+                    writer.write_records(batch)
+                    batch = []
+            writer.write_records(batch)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Falha na consulta por IDs: {e}")
+        return None
+
+    if missing:
+        missing_path = save_raw_data(
+            missing, ndjson_path(OUTPUT_DIR, f"breweries_by_ids_missing_{timestamp}"),
+            {"source": str(ids_path)})
+        logger.warning(f"{len(missing)} ID(s) não encontrados: {missing_path}")
+    return filepath
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Uso: python -m bronze.batch_ids <arquivo_de_ids>")
+        sys.exit(1)
+
+    if not run_extraction(sys.argv[1]):
+        sys.exit(1)
@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_ID
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configurações básicas - AGORA COM A NOVA URL POR IDs
 BREWERY_IDS = "701239cb-5319-4d2e-92c1-129ab0b3b440,06e9fffb-e820-45c9-b107-b52b51013e8f"
 API_URL = f"https://api.openbrewerydb.org/v1/breweries?by_ids={BREWERY_IDS}"
@@ -11,9 +14,7 @@ OUTPUT_DIR = "data/bronze/breweries_raw"
 def fetch_breweries():
     """Busca dados básicos da API"""
     try:
-        response = requests.get(API_URL)  # Agora usamos a URL completa já com os IDs
-        response.raise_for_status()  # Verifica se houve erro
-        return response.json()
+        return get_json(API_URL)  # Agora usamos a URL completa já com os IDs
     except requests.exceptions.RequestException as e:
         print(f"Erro ao acessar a API: {e}")
         return None
@@ -1,17 +1,17 @@
 # bronze/by_autocomplete.py
-import requests
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_autocompleted
 import json
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
 
+from utils.http_client import get_json
+
 def fetch_autocomplete(query):
     """Busca cervejarias usando o endpoint de autocomplete"""
     url = f"https://api.openbrewerydb.org/v1/breweries/autocomplete?query={query}"
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Verifica erros HTTP
-        return response.json()
+        return get_json(url)
     except Exception as e:
         print(f"Erro ao buscar autocomplete: {str(e)}")
         return None
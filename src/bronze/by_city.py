@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_city
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configurações básicas
 CITY = "san_diego"  # Cidade para filtrar (usar _ no lugar de espaços)
 PER_PAGE = 3        # Número de cervejarias por requisição
@@ -12,9 +15,7 @@ OUTPUT_DIR = "data/bronze/breweries_raw"
 def fetch_breweries():
     """Busca dados básicos da API"""
     try:
-        response = requests.get(API_URL)
-        response.raise_for_status()  # Verifica se houve erro
-        return response.json()
+        return get_json(API_URL)
     except requests.exceptions.RequestException as e:
         print(f"Erro ao acessar a API: {e}")
         return None
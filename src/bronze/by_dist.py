@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_dist
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configurações básicas
 LATITUDE = "32.88313237"
 LONGITUDE = "-117.1649842"
@@ -13,9 +16,7 @@ OUTPUT_DIR = "data/bronze/breweries_raw"
 def fetch_breweries():
     """Busca dados básicos da API"""
     try:
-        response = requests.get(API_URL)
-        response.raise_for_status()  # Verifica se houve erro
-        return response.json()
+        return get_json(API_URL)
     except requests.exceptions.RequestException as e:
         print(f"Erro ao acessar a API: {e}")
         return None
@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_metadate
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configuration
 BASE_URL = "https://api.openbrewerydb.org/v1/breweries/meta"
 OUTPUT_DIR = "data/bronze/breweries_metadata"
@@ -10,9 +13,7 @@ OUTPUT_DIR = "data/bronze/breweries_metadata"
 def fetch_breweries_metadata():
     """Fetch metadata about breweries from the API"""
     try:
-        response = requests.get(BASE_URL)
-        response.raise_for_status()
-        return response.json()
+        return get_json(BASE_URL)
     except requests.exceptions.RequestException as e:
         print(f"Error accessing API: {e}")
         return None
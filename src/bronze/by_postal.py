@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_postal
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configuration
 BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
 POSTAL_CODE = "92101"  # San Diego downtown zip code
@@ -17,9 +20,7 @@ def fetch_breweries():
     }
     
     try:
-        response = requests.get(BASE_URL, params=params)
-        response.raise_for_status()
-        return response.json()
+        return get_json(BASE_URL, params=params)
     except requests.exceptions.RequestException as e:
         print(f"Error accessing API: {e}")
         return None
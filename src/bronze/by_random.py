@@ -1,12 +1,14 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_random
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict
 
+from utils.http_client import get_json
+
 # Configurações
 DEFAULT_SIZE = 3  # Número padrão de cervejarias aleatórias
-MAX_RETRIES = 3   # Máximo de tentativas em caso de falha
 OUTPUT_DIR = "data/bronze/breweries_raw"
 
 def fetch_random_breweries(size: int = DEFAULT_SIZE) -> Optional[List[Dict]]:
@@ -21,23 +23,19 @@ def fetch_random_breweries(size: int = DEFAULT_SIZE) -> Optional[List[Dict]]:
     """
     url = f"https://api.openbrewerydb.org/v1/breweries/random?size={size}"
     
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Verifica se a resposta está no formato esperado
-            data = response.json()
-            if not isinstance(data, list):
-                print(f"Resposta inesperada da API: {data}")
-                return None
-                
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Tentativa {attempt + 1} falhou: {str(e)}")
-            if attempt == MAX_RETRIES - 1:
-                return None
+    # Novas tentativas (com backoff) ficam a cargo do cliente compartilhado
+    try:
+        data = get_json(url)
+    except requests.exceptions.RequestException as e:
+        print(f"Falha ao acessar a API: {str(e)}")
+        return None
+    
+    # Verifica se a resposta está no formato esperado
+    if not isinstance(data, list):
+        print(f"Resposta inesperada da API: {data}")
+        return None
+        
+    return data
 
 def save_raw_data(data: List[Dict], prefix: str = "random") -> Path:
     """
@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_size
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configurações básicas
 SIZE = 3  # Número de cervejarias aleatórias para retornar
 API_URL = f"https://api.openbrewerydb.org/v1/breweries/random?size={SIZE}"
@@ -11,9 +14,7 @@ OUTPUT_DIR = "data/bronze/breweries_raw"
 def fetch_random_breweries():
     """Busca dados de cervejarias aleatórias da API"""
     try:
-        response = requests.get(API_URL)
-        response.raise_for_status()  # Verifica se houve erro
-        return response.json()
+        return get_json(API_URL)
     except requests.exceptions.RequestException as e:
         print(f"Erro ao acessar a API: {e}")
         return None
@@ -1,9 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): python -m bronze.by_sort
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
-import time
+
+from utils.http_client import get_json
 
 # Configurações
 STATE = "california"
@@ -11,8 +13,6 @@ SORT = "type,name:asc"
 PER_PAGE = 3
 BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
 OUTPUT_DIR = "data/bronze/breweries_raw"
-MAX_RETRIES = 3
-RETRY_DELAY = 2  # segundos
 
 def build_api_url(page: int = 1) -> str:
     """Constrói a URL da API com os parâmetros especificados"""
@@ -36,27 +36,21 @@ def fetch_breweries_page(page: int = 1) -> Optional[Tuple[List[Dict], bool]]:
     """
     url = build_api_url(page)
     
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not isinstance(data, list):
-                print(f"Resposta inesperada da API: {data}")
-                return None
-                
-            # Verifica se há mais páginas (heurística simples)
-            has_more = len(data) == PER_PAGE
-            
-            return data, has_more
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Tentativa {attempt + 1} falhou: {str(e)}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
-            else:
-                return None
+    # Novas tentativas e limite de taxa ficam a cargo do cliente compartilhado
+    try:
+        data = get_json(url)
+    except requests.exceptions.RequestException as e:
+        print(f"Falha ao buscar página {page}: {str(e)}")
+        return None
+    
+    if not isinstance(data, list):
+        print(f"Resposta inesperada da API: {data}")
+        return None
+        
+    # Verifica se há mais páginas (heurística simples)
+    has_more = len(data) == PER_PAGE
+    
+    return data, has_more
 
 def save_raw_data(data: List[Dict], page: int = None) -> Path:
     """
@@ -113,7 +107,6 @@ def fetch_all_breweries(max_pages: int = None) -> List[Dict]:
             break
             
         current_page += 1
-        time.sleep(1)  # Delay para evitar rate limiting
     
     return all_breweries
 
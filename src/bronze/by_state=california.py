@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): PYTHONPATH=. python "bronze/by_state=california.py"
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configuration
 BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
 PARAMS = {
@@ -15,9 +18,7 @@ OUTPUT_DIR = "data/bronze/breweries_raw"
 def fetch_breweries():
     """Fetch breweries from California sorted by type and name"""
     try:
-        response = requests.get(BASE_URL, params=PARAMS)
-        response.raise_for_status()
-        return response.json()
+        return get_json(BASE_URL, params=PARAMS)
     except requests.exceptions.RequestException as e:
         print(f"Error accessing API: {e}")
         return None
@@ -0,0 +1,195 @@
+# bronze/cli.py
+"""
+Ponto de entrada único da camada Bronze, guiado por arquivo de jobs.
+
+Lê um arquivo YAML ou TOML com várias consultas, executa todas em um único
+lote (mesma sessão HTTP, mesmo limite de taxa), mostra o progresso e imprime
+um resumo de registros, bytes e latência por consulta.
+
+Exemplo de arquivo (YAML):
+    settings:
+      max_in_flight: 16
+      rate_limit: 10
+    jobs:
+      - kind: by_city
+        values: [san_diego, austin, portland]
+        per_page: 50
+      - kind: meta
+    incremental:            # consultas da extração incremental (bronze.incremental)
+      - {by_state: california}
+
+Uso (a partir de ``src/``):
+    python -m bronze.cli bronze/jobs.example.yaml [--max-in-flight 16] [--rate-limit 10] [--cas]
+                         [--full-sweep]
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from bronze.extractor import MAX_IN_FLIGHT, ExtractionResult, QuerySpec, run_extraction
+from bronze.incremental import run_incremental
+from bronze.writer import NDJSONWriter
+from utils.http_client import RATE_LIMIT, set_rate_limit
+from utils.logger import get_logger
+from utils.storage import ObjectStore
+
+logger = get_logger(__name__)
+
+SPEC_FIELDS = {"kind", "value", "values", "per_page", "page", "params", "name"}
+
+
+def load_job_file(path: str) -> Dict[str, Any]:
+    """
+    Carrega um arquivo de jobs em YAML (.yaml/.yml) ou TOML (.toml)
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Dicionário com as chaves 'settings', 'jobs' e 'incremental' (opcional)
+    """
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Arquivos YAML requerem o pacote 'PyYAML' (pip install PyYAML)")
+        with open(path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    elif path.suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        raise ValueError(f"Formato de arquivo não suportado: {path.suffix}")
+
+    if "incremental" in config:
+        config.setdefault("jobs", [])
+        if not isinstance(config["incremental"], list):
+            raise ValueError(f"{path}: a chave 'incremental' deve ser uma lista de filtros")
+    if not isinstance(config.get("jobs"), list):
+        raise ValueError(f"{path}: a chave 'jobs' deve ser uma lista de consultas")
+    return config
+
+
+def expand_jobs(jobs: List[Dict[str, Any]]) -> List[QuerySpec]:
+    """
+    Converte os jobs do arquivo em QuerySpecs
+
+    Um job com ``values`` gera uma consulta por valor.
+    """
+    specs = []
+    for i, job in enumerate(jobs, start=1):
+        unknown = set(job) - SPEC_FIELDS
+        if unknown:
+            raise ValueError(f"Job {i}: campos desconhecidos {sorted(unknown)}")
+
+        job = dict(job)
+        values = job.pop("values", None)
+        if values is None:
+            specs.append(QuerySpec(**job))
+            continue
+        for value in values:
+            specs.append(QuerySpec(**{**job, "value": value}))
+    return specs
+
+
+class ProgressReporter:
+    """Registra o andamento do lote a cada consulta concluída"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+
+    def __call__(self, result: ExtractionResult):
+        self.done += 1
+        status = "ok" if result.ok else f"ERRO: {result.error}"
+        logger.info(
+            f"[{self.done}/{self.total}] {result.spec.label}: {result.rows} registro(s), "
+            f"{result.bytes} bytes, {result.seconds:.2f}s - {status}"
+        )
+
+
+def summarize(results: List[ExtractionResult]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Monta o resumo do lote
+
+    Returns:
+        Tupla com (tabela em texto, resumo em dicionário)
+    """
+    rows = [
+        {
+            "spec": r.spec.label,
+            "rows": r.rows,
+            "bytes": r.bytes,
+            "seconds": round(r.seconds, 3),
+            "path": str(r.path) if r.path else None,
+            "error": r.error,
+        }
+        for r in results
+    ]
+    totals = {
+        "specs": len(results),
+        "failed": sum(1 for r in results if not r.ok),
+        "rows": sum(r.rows for r in results),
+        "bytes": sum(r.bytes for r in results),
+        "seconds": round(sum(r.seconds for r in results), 3),
+    }
+
+    width = max([len(row["spec"]) for row in rows] + [8])
+    lines = [f"{'Consulta':<{width}}  {'Registros':>9}  {'Bytes':>10}  {'Latência':>9}  Status"]
+    for row in rows:
+        status = "ok" if row["error"] is None else "falha"
+        lines.append(
+            f"{row['spec']:<{width}}  {row['rows']:>9}  {row['bytes']:>10}  "
+            f"{row['seconds']:>8.2f}s  {status}"
+        )
+    lines.append(
+        f"{'TOTAL':<{width}}  {totals['rows']:>9}  {totals['bytes']:>10}  "
+        f"{totals['seconds']:>8.2f}s  {totals['failed']} falha(s)"
+    )
+    return "\n".join(lines), {"totals": totals, "specs": rows}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extração em lote da Open Brewery DB")
+    parser.add_argument("job_file", help="Arquivo de jobs (.yaml, .yml ou .toml)")
+    parser.add_argument("--max-in-flight", type=int, help="Máximo de requisições simultâneas")
+    parser.add_argument("--rate-limit", type=float, help="Requisições por segundo")
+    parser.add_argument("--cas", action="store_true", help="Grava no repositório de objetos deduplicado")
+    parser.add_argument("--summary", help="Grava o resumo do lote em NDJSON (uma linha por consulta) neste caminho")
+    parser.add_argument("--full-sweep", action="store_true",
+                        help="Varre todos os IDs das consultas incrementais para detectar exclusões")
+    args = parser.parse_args(argv)
+
+    config = load_job_file(args.job_file)
+    settings = config.get("settings", {})
+    specs = expand_jobs(config["jobs"])
+
+    max_in_flight = args.max_in_flight or settings.get("max_in_flight", MAX_IN_FLIGHT)
+    set_rate_limit(args.rate_limit or settings.get("rate_limit", RATE_LIMIT))
+    store = ObjectStore() if args.cas or settings.get("cas") else None
+
+    results = run_extraction(specs, max_in_flight, object_store=store,
+                             on_result=ProgressReporter(len(specs))) if specs else []
+
+    full_sweep = args.full_sweep or settings.get("full_sweep", False)
+    incremental = [run_incremental(params, full_sweep=full_sweep) for params in config.get("incremental", [])]
+
+    table, summary = summarize(results)
+    print(table)
+    summary["totals"]["failed"] += sum(1 for result in incremental if result is None)
+    if args.summary:
+        # Totais do lote ficam no manifesto do resumo
+        with NDJSONWriter(Path(args.summary), params=summary["totals"]) as writer:
+            writer.write_records(summary["specs"])
+
+    return 1 if summary["totals"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+# bronze/crawler.py
+"""
+Crawler paginado do catálogo completo da Open Brewery DB.
+
+Consulta ``/breweries/meta`` para descobrir o total de cervejarias, calcula o
+número de páginas com ``per_page=200`` (máximo da API) e busca as páginas em
+paralelo, respeitando um limite de requisições por segundo próprio da coleta
+(o limite global do cliente HTTP não é alterado). As páginas são
+gravadas à medida que chegam em um único arquivo NDJSON consolidado
+(com manifesto), sem acumular o catálogo em memória.
+
+Uso (a partir de ``src/``):
+    python -m bronze.crawler [requisicoes_por_segundo]
+"""
+import asyncio
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from bronze.extractor import BASE_URL, OUTPUT_DIR
+from bronze.writer import NDJSONWriter, ndjson_path
+from utils.http_client import TokenBucket, get_json, make_limiter
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+PER_PAGE = 200          # Máximo permitido pela API
+MAX_IN_FLIGHT = 8       # Máximo de páginas buscadas simultaneamente
+RATE_LIMIT = 10.0       # Requisições por segundo
+COMPRESSION = "gzip"    # None, 'gzip' ou 'zstd'
+
+
+def fetch_total(params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> int:
+    """
+    Consulta o endpoint de metadados para descobrir o total de cervejarias
+
+    Args:
+        params: Filtros opcionais (ex: {'by_state': 'california'})
+        use_cache: False força a consulta à API
+
+    Returns:
+        Total de cervejarias que atendem aos filtros
+    """
+    metadata = get_json(f"{BASE_URL}/meta", params, use_cache=use_cache)
+    return int(metadata.get("total", 0))
+
+
+def _limiter(rate_limit: Optional[float], limiter: Optional[TokenBucket]) -> Optional[TokenBucket]:
+    """Limitador da coleta: o informado, um novo para rate_limit ou None (o compartilhado)"""
+    if limiter is not None or rate_limit is None:
+        return limiter
+    return make_limiter(rate_limit)
+
+
+async def _fetch_page(page: int, params: Dict[str, Any], semaphore: asyncio.Semaphore,
+                      use_cache: bool = True, limiter: Optional[TokenBucket] = None) -> List[Dict]:
+    """Busca uma página (novas tentativas e limite de taxa ficam no cliente HTTP)"""
+    page_params = {**params, "per_page": PER_PAGE, "page": page}
+
+    async with semaphore:
+        data = await asyncio.to_thread(get_json, BASE_URL, page_params, use_cache=use_cache,
+                                       limiter=limiter)
+    if not isinstance(data, list):
+        raise ValueError(f"Resposta inesperada da API na página {page}: {data}")
+    return data
+
+
+async def crawl_pages(total_pages: int, params: Optional[Dict[str, Any]] = None,
+                      rate_limit: Optional[float] = None,
+                      max_in_flight: int = MAX_IN_FLIGHT,
+                      use_cache: bool = True,
+                      limiter: Optional[TokenBucket] = None) -> List[Dict]:
+    """
+    Busca todas as páginas em paralelo
+
+    Args:
+        total_pages: Número de páginas a buscar
+        params: Filtros opcionais repassados à API
+        rate_limit: Requisições por segundo desta coleta (padrão: limite compartilhado)
+        max_in_flight: Máximo de páginas buscadas simultaneamente
+        use_cache: False força a consulta à API em todas as páginas
+        limiter: Limitador já criado (ex: compartilhado entre várias coletas)
+
+    Returns:
+        Lista de cervejarias na ordem das páginas, sem IDs repetidos
+    """
+    params = params or {}
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limiter = _limiter(rate_limit, limiter)
+
+    pages = await asyncio.gather(*(
+        _fetch_page(page, params, semaphore, use_cache, limiter)
+        for page in range(1, total_pages + 1)
+    ))
+
+    # Registros podem mudar de página se o catálogo for alterado durante a coleta
+    seen = set()
+    breweries = []
+    for page in pages:
+        for brewery in page:
+            if brewery.get("id") in seen:
+                continue
+            seen.add(brewery.get("id"))
+            breweries.append(brewery)
+    return breweries
+
+
+async def crawl_to_writer(total_pages: int, writer: NDJSONWriter,
+                          params: Optional[Dict[str, Any]] = None,
+                          rate_limit: Optional[float] = None,
+                          max_in_flight: int = MAX_IN_FLIGHT,
+                          limiter: Optional[TokenBucket] = None) -> int:
+    """
+    Busca todas as páginas em paralelo gravando cada uma assim que chega
+
+    Args:
+        total_pages: Número de páginas a buscar
+        writer: Gravador NDJSON de destino
+        params: Filtros opcionais repassados à API
+        rate_limit: Requisições por segundo desta coleta (padrão: limite compartilhado)
+        max_in_flight: Máximo de páginas buscadas simultaneamente
+        limiter: Limitador já criado (ex: compartilhado entre várias coletas)
+
+    Returns:
+        Número de cervejarias gravadas (sem IDs repetidos)
+    """
+    params = params or {}
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limiter = _limiter(rate_limit, limiter)
+
+    seen = set()
+    tasks = [_fetch_page(page, params, semaphore, limiter=limiter) for page in range(1, total_pages + 1)]
+    for task in asyncio.as_completed(tasks):
+        page = await task
+        new = [brewery for brewery in page if brewery.get("id") not in seen]
+        seen.update(brewery.get("id") for brewery in new)
+        writer.write_records(new)
+    return len(seen)
+
+
+def run_extraction(params: Optional[Dict[str, Any]] = None, rate_limit: float = RATE_LIMIT,
+                   max_in_flight: int = MAX_IN_FLIGHT,
+                   compression: Optional[str] = COMPRESSION) -> Optional[Path]:
+    """
+    Executa a extração completa do catálogo
+
+    Args:
+        params: Filtros opcionais (ex: {'by_country': 'south_korea'})
+        rate_limit: Requisições por segundo
+        max_in_flight: Máximo de páginas buscadas simultaneamente
+        compression: None, 'gzip' ou 'zstd'
+
+    Returns:
+        Caminho do arquivo consolidado ou None em caso de erro
+    """
+    start = time.perf_counter()
+    try:
+        total = fetch_total(params)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Falha ao consultar metadados: {e}")
+        return None
+
+    total_pages = math.ceil(total / PER_PAGE)
+    logger.info(f"{total} cervejarias em {total_pages} página(s) de {PER_PAGE}")
+    if not total_pages:
+        return None
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = ndjson_path(OUTPUT_DIR, f"breweries_full_{timestamp}", compression)
+    manifest_params = {**(params or {}), "per_page": PER_PAGE, "pages": total_pages}
+
+    try:
+        with NDJSONWriter(filepath, params=manifest_params) as writer:
+            count = asyncio.run(crawl_to_writer(total_pages, writer, params, rate_limit, max_in_flight))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Falha na coleta das páginas: {e}")
+        return None
+
+    logger.info(
+        f"{count} cervejarias salvas em {filepath} "
+        f"({time.perf_counter() - start:.1f}s)"
+    )
+    return filepath
+
+
+if __name__ == "__main__":
+    import sys
+
+    try:
+        rate = float(sys.argv[1]) if len(sys.argv) > 1 else RATE_LIMIT
+    except ValueError:
+        print("Uso: python -m bronze.crawler [requisicoes_por_segundo]")
+        sys.exit(1)
+
+    if not run_extraction(rate_limit=rate):
+        sys.exit(1)
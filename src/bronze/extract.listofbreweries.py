@@ -1,8 +1,11 @@
+# Uso (a partir de src/, que contém o pacote utils): PYTHONPATH=. python "bronze/extract.listofbreweries.py"
 import requests
 import json
 from datetime import datetime
 from pathlib import Path
 
+from utils.http_client import get_json
+
 # Configurações básicas
 API_URL = "https://api.openbrewerydb.org/v1/breweries?by_city=san_diego&per_page=3"
 OUTPUT_DIR = "data/bronze/breweries_raw"
@@ -11,9 +14,7 @@ PER_PAGE = 3  # Número de cervejarias por requisição
 def fetch_breweries():
     """Busca dados básicos da API"""
     try:
-        response = requests.get(f"{API_URL}?per_page={PER_PAGE}")
-        response.raise_for_status()  # Verifica se houve erro
-        return response.json()
+        return get_json(f"{API_URL}?per_page={PER_PAGE}")
     except requests.exceptions.RequestException as e:
         print(f"Erro ao acessar a API: {e}")
         return None
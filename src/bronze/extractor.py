@@ -0,0 +1,346 @@
+# bronze/extractor.py
+"""
+Motor de extração concorrente da camada Bronze.
+
+Substitui a execução serial dos scripts ``by_*.py``: recebe uma lista de
+``QuerySpec`` e dispara as requisições em paralelo (com limite de
+requisições simultâneas), gravando cada resposta em NDJSON
+(``bronze.writer``, um registro por linha, com manifesto), com os mesmos
+nomes dos arquivos que os scripts individuais gravam.
+
+As requisições passam pelo cliente compartilhado (``utils.http_client``),
+que aplica pool de conexões, limite de taxa e novas tentativas.
+
+Os diretórios de saída ficam sob a raiz do projeto, lida da variável de
+ambiente ``BREWERY_PIPELINE_HOME`` (padrão: o diretório acima de ``src/``),
+e não dependem do diretório de onde o comando é executado.
+
+Uso (a partir de ``src/``):
+    python -m bronze.extractor [--cas]
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import requests
+
+from bronze.writer import NDJSONWriter, ndjson_path
+from utils.http_client import get_json
+from utils.logger import get_logger
+from utils.storage import ObjectStore
+
+logger = get_logger(__name__)
+
+# Configurações
+BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
+BASE_PATH_ENV = "BREWERY_PIPELINE_HOME"
+base_path = Path(os.environ.get(BASE_PATH_ENV, Path(__file__).resolve().parents[2]))
+OUTPUT_DIR = str(base_path / "data" / "bronze" / "breweries_raw")
+METADATA_DIR = str(base_path / "data" / "bronze" / "breweries_metadata")
+AUTOCOMPLETE_DIR = str(base_path / "data" / "bronze" / "autocomplete")
+MAX_IN_FLIGHT = 8   # Máximo de requisições simultâneas
+
+# Tipos de consulta suportados -> (endpoint, parâmetro do filtro)
+QUERY_KINDS: Dict[str, Tuple[str, Optional[str]]] = {
+    "by_city": ("", "by_city"),
+    "by_state": ("", "by_state"),
+    "by_type": ("", "by_type"),
+    "by_postal": ("", "by_postal"),
+    "by_name": ("", "by_name"),
+    "by_country": ("", "by_country"),
+    "by_dist": ("", "by_dist"),
+    "by_ids": ("", "by_ids"),
+    "list": ("", None),
+    "search": ("/search", "query"),
+    "autocomplete": ("/autocomplete", "query"),
+    "meta": ("/meta", None),
+    "random": ("/random", "size"),
+}
+
+# Nome dos arquivos gerados (sem extensão), no mesmo padrão dos scripts by_*.py
+FILENAME_TEMPLATES = {
+    "by_city": "breweries_{value}_{timestamp}",
+    "by_state": "breweries_in_{value}_{timestamp}",
+    "by_type": "{value}_breweries_{timestamp}",
+    "by_postal": "breweries_near_zip_{value}_{timestamp}",
+    "by_name": "breweries_by_name_{value}_{timestamp}",
+    "by_country": "breweries_{value}_{timestamp}",
+    "by_dist": "breweries_near_{value}_{timestamp}",
+    "by_ids": "breweries_{timestamp}",
+    "list": "breweries_{timestamp}",
+    "search": "breweries_search_{timestamp}",
+    "autocomplete": "autocomplete_{value}_{timestamp}",
+    "meta": "breweries_metadata_{timestamp}",
+    "random": "breweries_random_{timestamp}",
+}
+
+
+@dataclass
+class QuerySpec:
+    """
+    Descrição de uma consulta à Open Brewery DB API
+
+    Args:
+        kind: Tipo da consulta (ver QUERY_KINDS)
+        value: Valor do filtro (cidade, estado, termo de busca, lista de IDs...)
+        per_page: Número de cervejarias por requisição (max 200 pela API)
+        page: Página a ser buscada
+        params: Parâmetros extras repassados à API (ex: sort, by_state na meta)
+        name: Rótulo opcional usado no nome do arquivo e nos logs
+    """
+    kind: str
+    value: Optional[Any] = None
+    per_page: Optional[int] = None
+    page: Optional[int] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    def __post_init__(self):
+        if self.kind not in QUERY_KINDS:
+            raise ValueError(f"Tipo de consulta desconhecido: {self.kind}")
+
+    @property
+    def label(self) -> str:
+        """Rótulo legível da consulta"""
+        if self.name:
+            return self.name
+        if self.value is None:
+            return self.kind
+        return f"{self.kind}={self.value}"
+
+
+@dataclass
+class ExtractionResult:
+    """Resultado da execução de uma QuerySpec"""
+    spec: QuerySpec
+    path: Optional[Path] = None
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build_request(spec: QuerySpec) -> Tuple[str, Dict[str, Any]]:
+    """
+    Monta a URL e os parâmetros de uma consulta
+
+    Args:
+        spec: Consulta a ser montada
+
+    Returns:
+        Tupla com (url, parâmetros)
+    """
+    endpoint, filter_param = QUERY_KINDS[spec.kind]
+    params: Dict[str, Any] = {}
+
+    if filter_param and spec.value is not None:
+        value = spec.value
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        params[filter_param] = value
+    if spec.per_page is not None:
+        params["per_page"] = spec.per_page
+    if spec.page is not None:
+        params["page"] = spec.page
+    params.update(spec.params)
+
+    return f"{BASE_URL}{endpoint}", params
+
+
+def output_path(spec: QuerySpec, timestamp: Optional[str] = None,
+                reserved: Optional[Set[Path]] = None) -> Path:
+    """
+    Gera o caminho do arquivo bruto de uma consulta
+
+    Args:
+        spec: Consulta executada
+        timestamp: Timestamp do nome do arquivo (padrão: agora)
+        reserved: Caminhos já atribuídos na mesma execução e ainda não
+            gravados; o caminho gerado é acrescentado ao conjunto
+
+    Returns:
+        Caminho do arquivo NDJSON (ainda não criado)
+    """
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    if spec.kind == "meta":
+        output_dir = METADATA_DIR
+    elif spec.kind == "autocomplete":
+        output_dir = AUTOCOMPLETE_DIR
+    else:
+        output_dir = OUTPUT_DIR
+
+    value = spec.name or spec.value
+    if isinstance(value, (list, tuple)):
+        value = "_".join(str(v) for v in value)
+    value = str(value or "").replace(" ", "_").replace(",", "_")
+
+    stem = FILENAME_TEMPLATES[spec.kind].format(value=value, timestamp=timestamp)
+    filepath = ndjson_path(output_dir, stem)
+
+    # Consultas concorrentes podem gerar o mesmo nome no mesmo segundo
+    reserved = reserved if reserved is not None else set()
+    counter = 1
+    while filepath.exists() or filepath in reserved:
+        counter += 1
+        filepath = ndjson_path(output_dir, f"{stem}_{counter}")
+    reserved.add(filepath)
+    return filepath
+
+
+def save_raw_data(data: Any, filepath: Path, params: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    Salva os dados brutos em NDJSON (um registro por linha) com manifesto
+
+    Args:
+        data: Lista de registros ou um único objeto (ex: resposta da meta)
+        filepath: Caminho do arquivo de saída (ver ndjson_path)
+        params: Parâmetros da consulta registrados no manifesto
+
+    Returns:
+        Caminho completo do arquivo salvo
+    """
+    with NDJSONWriter(filepath, params=params) as writer:
+        writer.write_records(data if isinstance(data, list) else [data])
+    return filepath
+
+
+def run_name(spec: QuerySpec) -> str:
+    """Nome da execução usado nos manifestos do repositório de objetos"""
+    value = spec.name or spec.value
+    if isinstance(value, (list, tuple)):
+        value = f"{len(value)}_ids"
+    if value is None:
+        return spec.kind
+    return f"{spec.kind}_{str(value).replace(' ', '_').replace(',', '_')}"
+
+
+async def _run_spec(spec: QuerySpec, semaphore: asyncio.Semaphore,
+                    object_store: Optional[ObjectStore] = None,
+                    reserved: Optional[Set[Path]] = None) -> ExtractionResult:
+    """Executa uma consulta respeitando o limite de requisições simultâneas"""
+    result = ExtractionResult(spec=spec)
+    url, params = build_request(spec)
+
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            data = await asyncio.to_thread(get_json, url, params)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            result.error = str(e)
+            result.seconds = time.perf_counter() - start
+            logger.error(f"Falha na consulta {spec.label}: {e}")
+            return result
+        result.seconds = time.perf_counter() - start
+
+    if not data:
+        result.error = "Resposta vazia da API"
+        logger.warning(f"Consulta {spec.label} não retornou dados")
+        return result
+
+    try:
+        if object_store is not None:
+            records = data if isinstance(data, list) else [data]
+            filepath = await asyncio.to_thread(
+                object_store.write_manifest, run_name(spec), records, build_request(spec)[1])
+        else:
+            filepath = await asyncio.to_thread(save_raw_data, data, output_path(spec, reserved=reserved), params)
+    except IOError as e:
+        result.error = str(e)
+        logger.error(f"Erro ao salvar {spec.label}: {e}")
+        return result
+
+    result.path = filepath
+    result.rows = len(data) if isinstance(data, list) else 1
+    result.bytes = filepath.stat().st_size
+    logger.info(f"{spec.label}: {result.rows} registro(s) salvos em {filepath}")
+    return result
+
+
+async def run_specs(specs: Sequence[QuerySpec], max_in_flight: int = MAX_IN_FLIGHT,
+                    object_store: Optional[ObjectStore] = None,
+                    on_result: Optional[Callable[[ExtractionResult], None]] = None) -> List[ExtractionResult]:
+    """
+    Executa as consultas concorrentemente
+
+    Args:
+        specs: Consultas a executar
+        max_in_flight: Máximo de requisições simultâneas
+        object_store: Se informado, grava os registros no repositório de
+            objetos (deduplicado) e um manifesto por consulta, em vez do JSON
+        on_result: Callback chamado a cada consulta concluída (progresso)
+
+    Returns:
+        Lista de resultados, na mesma ordem das consultas
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    reserved: Set[Path] = set()   # caminhos atribuídos nesta execução
+
+    async def run_one(spec: QuerySpec) -> ExtractionResult:
+        result = await _run_spec(spec, semaphore, object_store, reserved)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    return await asyncio.gather(*(run_one(spec) for spec in specs))
+
+
+def run_extraction(specs: Sequence[QuerySpec], max_in_flight: int = MAX_IN_FLIGHT,
+                   object_store: Optional[ObjectStore] = None,
+                   on_result: Optional[Callable[[ExtractionResult], None]] = None) -> List[ExtractionResult]:
+    """
+    Executa o pipeline completo de extração para várias consultas
+
+    Args:
+        specs: Consultas a executar
+        max_in_flight: Máximo de requisições simultâneas
+        object_store: Repositório de objetos opcional (ver run_specs)
+        on_result: Callback de progresso (ver run_specs)
+
+    Returns:
+        Lista de resultados, na mesma ordem das consultas
+    """
+    logger.info(f"Iniciando extração de {len(specs)} consulta(s) (max {max_in_flight} simultâneas)")
+    start = time.perf_counter()
+
+    results = asyncio.run(run_specs(specs, max_in_flight, object_store, on_result))
+
+    failures = [r for r in results if not r.ok]
+    logger.info(
+        f"Extração concluída em {time.perf_counter() - start:.2f}s: "
+        f"{len(results) - len(failures)} ok, {len(failures)} falha(s)"
+    )
+    return results
+
+
+# Consultas equivalentes aos scripts individuais de src/bronze
+DEFAULT_SPECS = [
+    QuerySpec("by_city", "san_diego", per_page=3),
+    QuerySpec("by_state", "california", per_page=3),
+    QuerySpec("by_type", "micro", per_page=3),
+    QuerySpec("by_postal", "92101", per_page=3),
+    QuerySpec("by_name", "san_diego", per_page=3),
+    QuerySpec("by_country", "south korea", per_page=3, name="korea"),
+    QuerySpec("by_dist", "32.88313237,-117.1649842", per_page=3, name="32.88313237_-117.1649842"),
+    QuerySpec("by_ids", ["701239cb-5319-4d2e-92c1-129ab0b3b440", "06e9fffb-e820-45c9-b107-b52b51013e8f"]),
+    QuerySpec("search", "san diego", per_page=3),
+    QuerySpec("autocomplete", "san diego"),
+    QuerySpec("meta"),
+    QuerySpec("random", 3),
+]
+
+if __name__ == "__main__":
+    import sys
+
+    store = ObjectStore() if "--cas" in sys.argv[1:] else None
+    results = run_extraction(DEFAULT_SPECS, object_store=store)
+    if not all(r.ok for r in results):
+        sys.exit(1)
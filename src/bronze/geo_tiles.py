@@ -0,0 +1,246 @@
+# bronze/geo_tiles.py
+"""
+Cobertura geográfica completa de uma região usando o endpoint ``by_dist``.
+
+A região (retângulo ou polígono de um país) é coberta por uma grade
+adaptativa: cada célula consulta as ``PER_PAGE`` cervejarias mais próximas do
+seu centro. Se a mais distante retornada ainda está dentro do raio que cobre
+a célula, pode haver mais cervejarias ali e a célula é dividida em quatro;
+caso contrário a célula está completa. As células de cada nível são
+consultadas em paralelo e cervejarias vistas em células sobrepostas são
+gravadas uma única vez.
+
+Uso (a partir de ``src/``):
+    python -m bronze.geo_tiles <lat_min> <lon_min> <lat_max> <lon_max>
+"""
+import asyncio
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import requests
+
+from bronze.extractor import BASE_URL, OUTPUT_DIR
+from bronze.writer import NDJSONWriter, ndjson_path
+from utils.http_client import get_json
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+PER_PAGE = 200          # Máximo permitido pela API
+MAX_IN_FLIGHT = 8       # Células consultadas simultaneamente
+MAX_DEPTH = 10          # Níveis máximos de subdivisão
+EARTH_RADIUS_KM = 6371.0
+
+# (lat_min, lon_min, lat_max, lon_max)
+Cell = Tuple[float, float, float, float]
+# Vértices (lon, lat)
+Polygon = Sequence[Tuple[float, float]]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Distância em km entre dois pontos"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def cell_center(cell: Cell) -> Tuple[float, float]:
+    return (cell[0] + cell[2]) / 2, (cell[1] + cell[3]) / 2
+
+
+def cell_radius_km(cell: Cell) -> float:
+    """Raio do círculo, centrado na célula, que contém toda a célula"""
+    lat, lon = cell_center(cell)
+    return max(haversine_km(lat, lon, corner_lat, corner_lon)
+               for corner_lat in (cell[0], cell[2]) for corner_lon in (cell[1], cell[3]))
+
+
+def split_cell(cell: Cell) -> List[Cell]:
+    """Divide a célula em quatro quadrantes"""
+    lat_mid, lon_mid = cell_center(cell)
+    return [
+        (cell[0], cell[1], lat_mid, lon_mid),
+        (cell[0], lon_mid, lat_mid, cell[3]),
+        (lat_mid, cell[1], cell[2], lon_mid),
+        (lat_mid, lon_mid, cell[2], cell[3]),
+    ]
+
+
+def _coordinates(brewery: Dict) -> Optional[Tuple[float, float]]:
+    try:
+        return float(brewery["latitude"]), float(brewery["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _in_cell(lat: float, lon: float, cell: Cell) -> bool:
+    return cell[0] <= lat <= cell[2] and cell[1] <= lon <= cell[3]
+
+
+def point_in_polygon(lat: float, lon: float, polygon: Polygon) -> bool:
+    """Teste de ponto no polígono (ray casting)"""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _segments_cross(p1, p2, q1, q2) -> bool:
+    def orient(a, b, c):
+        return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return (orient(p1, p2, q1) * orient(p1, p2, q2) < 0
+            and orient(q1, q2, p1) * orient(q1, q2, p2) < 0)
+
+
+def cell_intersects_polygon(cell: Cell, polygon: Polygon) -> bool:
+    """Verifica se a célula tem alguma área dentro do polígono"""
+    corners = [(cell[1], cell[0]), (cell[3], cell[0]), (cell[3], cell[2]), (cell[1], cell[2])]
+    if any(point_in_polygon(lat, lon, polygon) for lon, lat in corners):
+        return True
+    if any(_in_cell(lat, lon, cell) for lon, lat in polygon):
+        return True
+    cell_edges = list(zip(corners, corners[1:] + corners[:1]))
+    polygon_edges = list(zip(polygon, list(polygon[1:]) + [polygon[0]]))
+    return any(_segments_cross(a, b, c, d) for a, b in cell_edges for c, d in polygon_edges)
+
+
+def fetch_cell(cell: Cell) -> Tuple[List[Dict], bool]:
+    """
+    Consulta as cervejarias mais próximas do centro da célula
+
+    Returns:
+        Tupla com (cervejarias retornadas, True se a célula está completa)
+    """
+    lat, lon = cell_center(cell)
+    data = get_json(BASE_URL, {"by_dist": f"{lat},{lon}", "per_page": PER_PAGE})
+    if not isinstance(data, list):
+        raise ValueError(f"Resposta inesperada da API: {data}")
+
+    if len(data) < PER_PAGE:
+        return data, True
+
+    # Resultados vêm ordenados por distância: basta olhar o último com coordenadas
+    for brewery in reversed(data):
+        coords = _coordinates(brewery)
+        if coords:
+            return data, haversine_km(lat, lon, *coords) > cell_radius_km(cell)
+    return data, False
+
+
+async def crawl_region(bbox: Cell, writer: NDJSONWriter, polygon: Optional[Polygon] = None,
+                       max_in_flight: int = MAX_IN_FLIGHT, max_depth: int = MAX_DEPTH) -> Dict[str, int]:
+    """
+    Percorre a região com a grade adaptativa gravando as cervejarias encontradas
+
+    Args:
+        bbox: Retângulo (lat_min, lon_min, lat_max, lon_max)
+        writer: Gravador NDJSON de destino
+        polygon: Polígono opcional [(lon, lat), ...] que restringe a região
+        max_in_flight: Células consultadas simultaneamente
+        max_depth: Níveis máximos de subdivisão
+
+    Returns:
+        Estatísticas (requisições, células, cervejarias gravadas)
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    seen: Set[str] = set()
+    stats = {"requests": 0, "cells": 0, "breweries": 0, "truncated": 0}
+
+    async def visit(cell: Cell) -> Tuple[List[Dict], bool]:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_cell, cell)
+
+    level = [bbox]
+    for depth in range(max_depth + 1):
+        if polygon is not None:
+            level = [cell for cell in level if cell_intersects_polygon(cell, polygon)]
+        if not level:
+            break
+
+        results = await asyncio.gather(*(visit(cell) for cell in level))
+        stats["requests"] += len(level)
+        next_level = []
+
+        for cell, (data, complete) in zip(level, results):
+            new = []
+            for brewery in data:
+                coords = _coordinates(brewery)
+                if coords is None or brewery["id"] in seen or not _in_cell(*coords, cell):
+                    continue
+                if polygon is not None and not point_in_polygon(*coords, polygon):
+                    continue
+                seen.add(brewery["id"])
+                new.append(brewery)
+            writer.write_records(new)
+
+            if complete:
+                stats["cells"] += 1
+            elif depth == max_depth:
+                stats["cells"] += 1
+                stats["truncated"] += 1
+            else:
+                next_level.extend(split_cell(cell))
+
+        logger.info(f"Nível {depth}: {len(level)} célula(s), {len(seen)} cervejaria(s) até agora")
+        level = next_level
+
+    if stats["truncated"]:
+        logger.warning(f"{stats['truncated']} célula(s) atingiram MAX_DEPTH e podem estar incompletas")
+    stats["breweries"] = len(seen)
+    return stats
+
+
+def run_extraction(bbox: Cell, polygon: Optional[Polygon] = None, name: str = "region",
+                   compression: Optional[str] = "gzip") -> Optional[Path]:
+    """
+    Extrai todas as cervejarias de uma região
+
+    Args:
+        bbox: Retângulo (lat_min, lon_min, lat_max, lon_max)
+        polygon: Polígono opcional [(lon, lat), ...] (ex: contorno de um país)
+        name: Rótulo usado no nome do arquivo
+        compression: None, 'gzip' ou 'zstd'
+
+    Returns:
+        Caminho do arquivo NDJSON gerado ou None em caso de erro
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = ndjson_path(OUTPUT_DIR, f"breweries_geo_{name}_{timestamp}", compression)
+
+    try:
+        with NDJSONWriter(filepath, params={"bbox": list(bbox), "polygon": polygon}) as writer:
+            stats = asyncio.run(crawl_region(bbox, writer, polygon))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Falha na extração geográfica: {e}")
+        return None
+
+    logger.info(
+        f"{stats['breweries']} cervejarias em {stats['cells']} célula(s) "
+        f"com {stats['requests']} requisição(ões)"
+    )
+    return filepath
+
+
+if __name__ == "__main__":
+    import sys
+
+    try:
+        region = tuple(float(v) for v in sys.argv[1:5])
+        if len(region) != 4:
+            raise ValueError
+    except ValueError:
+        print("Uso: python -m bronze.geo_tiles <lat_min> <lon_min> <lat_max> <lon_max>")
+        sys.exit(1)
+
+    if not run_extraction(region):
+        sys.exit(1)
@@ -0,0 +1,228 @@
+# bronze/incremental.py
+"""
+Extração incremental da camada Bronze guiada por ``updated_at``.
+
+Para cada consulta (ex: ``{'by_state': 'california'}``) é mantida uma marca
+d'água com o maior ``updated_at`` já extraído, os IDs que têm exatamente esse
+``updated_at`` (já gravados, não voltam no próximo delta) e o conjunto de IDs
+conhecidos. A cada execução as páginas são lidas em ordem decrescente de
+``updated_at`` apenas até alcançar a marca d'água, gerando um arquivo delta
+(NDJSON).
+
+Exclusões só aparecem comparando o conjunto de IDs: a varredura completa roda
+quando o total da API diverge, quando a última varredura tem mais de
+``SWEEP_INTERVAL`` (uma exclusão somada a uma inclusão não muda o total) ou
+com ``full_sweep``. IDs que deixaram de existir na API são gravados em uma
+lista de exclusões (tombstones).
+
+Uso (a partir de ``src/``):
+    python -m bronze.incremental [--full-sweep] [by_state=california ...]
+"""
+import asyncio
+import json
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import requests
+
+from bronze.crawler import PER_PAGE, crawl_pages, fetch_total
+from bronze.extractor import BASE_URL, OUTPUT_DIR, base_path, save_raw_data
+from bronze.writer import NDJSONWriter, ndjson_path
+from utils.http_client import get_json
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+STATE_PATH = str(base_path / "data" / "bronze" / "watermarks.json")
+SORT = "updated_at:desc"
+SWEEP_INTERVAL = timedelta(days=1)   # varredura de IDs ao menos uma vez por intervalo
+
+
+def query_key(params: Optional[Dict[str, Any]] = None) -> str:
+    """Identificador estável de uma consulta (ex: 'by_state=california')"""
+    if not params:
+        return "all"
+    return "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    """Converte o updated_at da API (ISO 8601, com 'Z') para datetime"""
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def load_state(path: str = STATE_PATH) -> Dict[str, Dict[str, Any]]:
+    """Carrega as marcas d'água persistidas"""
+    if not Path(path).exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state: Dict[str, Dict[str, Any]], path: str = STATE_PATH):
+    """Persiste as marcas d'água (escrita atômica)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def fetch_changes(params: Dict[str, Any], watermark: datetime,
+                  seen_at_watermark: Iterable[str] = ()) -> List[Dict]:
+    """
+    Busca os registros alterados desde a marca d'água
+
+    As páginas vêm ordenadas por updated_at decrescente, então a leitura para
+    na primeira página que contém um registro mais antigo que a marca d'água.
+    Registros com updated_at igual à marca d'água já gravados na execução
+    anterior (seen_at_watermark) são ignorados.
+
+    Args:
+        params: Filtros da consulta
+        watermark: Maior updated_at já extraído
+        seen_at_watermark: IDs já extraídos com updated_at == watermark
+
+    Returns:
+        Registros com updated_at >= watermark ainda não extraídos
+    """
+    seen_at_watermark = set(seen_at_watermark)
+    changes = []
+    page = 1
+    while True:
+        data = get_json(BASE_URL, {**params, "sort": SORT, "per_page": PER_PAGE, "page": page},
+                        use_cache=False)
+        if not isinstance(data, list):
+            raise ValueError(f"Resposta inesperada da API: {data}")
+
+        reached_watermark = False
+        for brewery in data:
+            updated_at = _parse_ts(brewery.get("updated_at"))
+            if updated_at is not None and updated_at < watermark:
+                reached_watermark = True
+                break
+            if updated_at == watermark and brewery.get("id") in seen_at_watermark:
+                continue
+            changes.append(brewery)
+
+        if reached_watermark or len(data) < PER_PAGE:
+            return changes
+        page += 1
+
+
+def sweep_ids(params: Dict[str, Any], total: int) -> Set[str]:
+    """Varre todas as páginas da consulta (em paralelo) e retorna os IDs atuais"""
+    total_pages = math.ceil(total / PER_PAGE)
+    breweries = asyncio.run(crawl_pages(total_pages, params, use_cache=False)) if total_pages else []
+    return {brewery["id"] for brewery in breweries}
+
+
+def run_incremental(params: Optional[Dict[str, Any]] = None, full_sweep: bool = False,
+                    state_path: str = STATE_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Executa uma extração incremental
+
+    Args:
+        params: Filtros da consulta (ex: {'by_country': 'south_korea'})
+        full_sweep: Força a varredura de IDs para detectar exclusões (sem isso
+            ela roda se o total divergir ou após SWEEP_INTERVAL)
+        state_path: Arquivo das marcas d'água
+
+    Returns:
+        Resumo da execução (arquivos gerados, contagens) ou None em caso de erro
+    """
+    params = dict(params or {})
+    key = query_key(params)
+    state = load_state(state_path)
+    previous = state.get(key, {})
+    known_ids = set(previous.get("ids", []))
+    watermark = _parse_ts(previous.get("watermark"))
+    last_sweep = _parse_ts(previous.get("last_sweep"))
+    now = datetime.now(timezone.utc)
+
+    try:
+        if watermark is None:
+            # Primeira execução: carga completa (em paralelo)
+            logger.info(f"[{key}] sem marca d'água; executando carga completa")
+            total = fetch_total(params, use_cache=False)
+            pages = math.ceil(total / PER_PAGE)
+            delta = asyncio.run(crawl_pages(pages, params, use_cache=False)) if pages else []
+            current_ids = {brewery["id"] for brewery in delta}
+            last_sweep = now
+        else:
+            delta = fetch_changes(params, watermark, previous.get("watermark_ids", []))
+            total = fetch_total(params, use_cache=False)
+            current_ids = known_ids | {brewery["id"] for brewery in delta}
+            # Total igual não garante os mesmos IDs (exclusão + inclusão): varre
+            # também quando a última varredura ficou velha
+            if total != len(current_ids):
+                reason = f"total da API ({total}) diverge de {len(current_ids)}"
+            elif full_sweep:
+                reason = "varredura solicitada"
+            elif last_sweep is None or now - last_sweep >= SWEEP_INTERVAL:
+                reason = f"última varredura há mais de {SWEEP_INTERVAL}"
+            else:
+                reason = None
+            if reason:
+                logger.info(f"[{key}] {reason}; varrendo IDs")
+                current_ids = sweep_ids(params, total)
+                last_sweep = now
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"[{key}] falha na extração incremental: {e}")
+        return None
+
+    tombstones = sorted(known_ids - current_ids)
+    timestamps = [ts for ts in (_parse_ts(b.get("updated_at")) for b in delta) if ts]
+    new_watermark = max(timestamps + ([watermark] if watermark else []), default=None)
+    watermark_ids = {b["id"] for b in delta if _parse_ts(b.get("updated_at")) == new_watermark}
+    if new_watermark == watermark:
+        watermark_ids |= set(previous.get("watermark_ids", []))
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    label = key.replace("&", "_").replace("=", "_").replace(" ", "_")
+    summary: Dict[str, Any] = {
+        "query": key,
+        "changed": len(delta),
+        "deleted": len(tombstones),
+        "swept": last_sweep == now,
+        "delta_path": None,
+        "tombstones_path": None,
+    }
+
+    if delta:
+        delta_path = ndjson_path(OUTPUT_DIR, f"breweries_delta_{label}_{timestamp}")
+        with NDJSONWriter(delta_path, params={**params, "since": previous.get("watermark")}) as writer:
+            writer.write_records(delta)
+        summary["delta_path"] = delta_path
+    if tombstones:
+        summary["tombstones_path"] = save_raw_data(
+            tombstones, ndjson_path(OUTPUT_DIR, f"breweries_tombstones_{label}_{timestamp}"), params)
+
+    state[key] = {
+        "watermark": new_watermark.isoformat() if new_watermark else None,
+        "watermark_ids": sorted(watermark_ids),
+        "ids": sorted(current_ids),
+        "last_run": now.isoformat(),
+        "last_sweep": last_sweep.isoformat() if last_sweep else None,
+    }
+    save_state(state, state_path)
+
+    logger.info(f"[{key}] {len(delta)} alterada(s), {len(tombstones)} excluída(s)")
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+
+    query = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    if run_incremental(query, full_sweep="--full-sweep" in sys.argv[1:]) is None:
+        sys.exit(1)
@@ -0,0 +1,164 @@
+# bronze/writer.py
+"""
+Escrita em streaming de arquivos brutos no formato NDJSON.
+
+Cada registro vira uma linha JSON, gravada (e descarregada em disco) página
+a página, opcionalmente com compressão gzip ou zstd. A escrita acontece em
+``<arquivo>.tmp``; só ao fechar sem erro o arquivo é renomeado para o nome
+final e é gravado o manifesto ``<arquivo>.manifest.json`` com contagem de
+registros, tamanho, checksum e os parâmetros da consulta. Uma falha no meio
+remove o temporário, então um arquivo NDJSON com manifesto está sempre
+completo (``is_complete``).
+"""
+import gzip
+import hashlib
+import io
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SUFFIXES = {None: ".ndjson", "gzip": ".ndjson.gz", "zstd": ".ndjson.zst"}
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def ndjson_path(directory: str, stem: str, compression: Optional[str] = None) -> Path:
+    """Monta o caminho do arquivo NDJSON com a extensão da compressão"""
+    if compression not in SUFFIXES:
+        raise ValueError(f"Compressão não suportada: {compression}")
+    return Path(directory) / f"{stem}{SUFFIXES[compression]}"
+
+
+def manifest_path(path: Path) -> Path:
+    """Caminho do manifesto de um arquivo NDJSON"""
+    path = Path(path)
+    return path.with_name(f"{path.name}{MANIFEST_SUFFIX}")
+
+
+def is_complete(path: Path) -> bool:
+    """Arquivo NDJSON gravado até o fim (o manifesto só é criado depois do arquivo)"""
+    return manifest_path(path).exists()
+
+
+def _open_binary(path: Path, mode: str, suffix: Optional[str] = None):
+    """Abre o arquivo com a compressão indicada pela extensão (ou por ``suffix``)"""
+    suffix = suffix or path.suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode)
+    if suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Compressão zstd requer o pacote 'zstandard' (pip install zstandard)")
+        raw = open(path, mode)
+        if "w" in mode:
+            return zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return open(path, mode)
+
+
+class NDJSONWriter:
+    """
+    Gravador NDJSON em streaming com manifesto
+
+    Args:
+        path: Caminho do arquivo (extensão define a compressão: .gz / .zst)
+        params: Parâmetros da consulta registrados no manifesto
+
+    Exemplo:
+        with NDJSONWriter(ndjson_path(OUTPUT_DIR, "breweries_full", "gzip")) as writer:
+            for page in pages:
+                writer.write_records(page)
+    """
+
+    def __init__(self, path: Path, params: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.params = params or {}
+        self.record_count = 0
+        self.uncompressed_bytes = 0
+        self._sha256 = hashlib.sha256()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        self._file = _open_binary(self._tmp_path, "wb", self.path.suffix)
+
+    def write_records(self, records: Iterable[Dict]):
+        """Grava um lote de registros (ex: uma página da API) e descarrega em disco"""
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            self._file.write(line)
+            self._sha256.update(line)
+            self.uncompressed_bytes += len(line)
+            self.record_count += 1
+        self._file.flush()
+
+    def close(self) -> Dict[str, Any]:
+        """Fecha o arquivo, move para o nome final e grava o manifesto"""
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        compression = {".gz": "gzip", ".zst": "zstd"}.get(self.path.suffix)
+        manifest = {
+            "file": self.path.name,
+            "format": "ndjson",
+            "compression": compression,
+            "record_count": self.record_count,
+            "bytes": self.path.stat().st_size,
+            "uncompressed_bytes": self.uncompressed_bytes,
+            "sha256": self._sha256.hexdigest(),
+            "params": self.params,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp_manifest = manifest_path(self._tmp_path)
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_manifest, manifest_path(self.path))
+        logger.info(f"{self.record_count} registro(s) gravados em {self.path} ({manifest['bytes']} bytes)")
+        return manifest
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def abort(self):
+        """Descarta o arquivo parcial (nada aparece com o nome final)"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            # Falha durante a escrita: o arquivo incompleto não chega ao nome final
+            self.abort()
+            return
+        self.close()
+
+
+def iter_records(path: Path) -> Iterator[Dict]:
+    """
+    Lê um arquivo bruto registro a registro
+
+    Aceita NDJSON (com ou sem compressão) e os arquivos JSON em lista gravados
+    pelos scripts by_*.py.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        yield from (data if isinstance(data, list) else [data])
+        return
+
+    with _open_binary(path, "rb") as raw:
+        for line in io.TextIOWrapper(raw, encoding="utf-8"):
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """Carrega o manifesto de um arquivo NDJSON, se existir"""
+    manifest = manifest_path(path)
+    if not manifest.exists():
+        return None
+    with open(manifest, 'r', encoding='utf-8') as f:
+        return json.load(f)
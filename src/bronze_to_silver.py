@@ -1,17 +1,222 @@
 # src/bronze_to_silver.py
 import pandas as pd
-import pyarrow.parquet as pq
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pj
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import glob
 import logging
+import os
+import time
+
+from bronze.writer import MANIFEST_SUFFIX, is_complete, iter_records
+from silver.ledger import LEDGER_PATH, ProcessedFileLedger
+from silver.parquet_layout import BREWERY_LAYOUT, LayoutSpec, write_table
+from silver.quality import QUARANTINE_DIR, QualityReport, quarantine, validate
+from silver.schemas import stamp
+from utils.storage import ObjectStore, is_store, store_of_manifest
 
 logger = logging.getLogger(__name__)
 
+# Esquema explícito dos registros de cervejarias na Bronze
+BREWERY_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('name', pa.string()),
+    ('brewery_type', pa.string()),
+    ('address_1', pa.string()),
+    ('address_2', pa.string()),
+    ('address_3', pa.string()),
+    ('city', pa.string()),
+    ('state_province', pa.string()),
+    ('postal_code', pa.string()),
+    ('country', pa.string()),
+    ('longitude', pa.float64()),
+    ('latitude', pa.float64()),
+    ('phone', pa.string()),
+    ('website_url', pa.string()),
+    ('state', pa.string()),
+    ('street', pa.string()),
+    ('created_at', pa.string()),
+    ('updated_at', pa.string()),
+])
+# Colunas de baixa cardinalidade gravadas com dictionary encoding (nomes da Silver)
+DICTIONARY_COLUMNS = ['tipos_cervejaria', 'estado_provincia', 'country']
+
+# Regras de limpeza comuns a todos os endpoints de cervejarias
+FILL_VALUES = {
+    'address_2': '',
+    'address_3': '',
+    'phone': 'N/A',
+    'website_url': 'N/A',
+    'longitude': 0.0,
+    'latitude': 0.0
+}
+LOCATION_COLUMNS = ['city', 'state_province', 'country']
+RENAME_MAP = {
+    'brewery_type': 'tipos_cervejaria',
+    'state_province': 'estado_provincia',
+    'postal_code': 'codigo_postal',
+    'website_url': 'site'
+}
+# Arquivos JSON antigos (lista de registros), gravados sem manifesto
+LEGACY_PATTERN = '*.json'
+# Arquivos auxiliares da Bronze que não contêm cervejarias (manifestos, listas de IDs)
+NON_BREWERY_MARKERS = ['.manifest.json', '_tombstones_', '_missing_']
+
+
+def _set_column(table: pa.Table, name: str, values) -> pa.Table:
+    return table.set_column(table.schema.get_field_index(name), name, values)
+
+
+def conform(table: pa.Table) -> pa.Table:
+    """
+    Ajusta uma tabela lida da Bronze ao BREWERY_SCHEMA
+
+    Colunas ausentes viram nulas, tipos são convertidos (coordenadas vindas
+    como texto viram float64, IDs numéricos viram string) e colunas extras
+    são mantidas no final.
+    """
+    columns, fields = [], []
+    for schema_field in BREWERY_SCHEMA:
+        if schema_field.name not in table.column_names:
+            column = pa.nulls(table.num_rows, schema_field.type)
+        else:
+            column = table[schema_field.name]
+            if pa.types.is_floating(schema_field.type) and pa.types.is_string(column.type):
+                column = pc.if_else(pc.equal(pc.utf8_trim_whitespace(column), ''),
+                                    pa.scalar(None, column.type), column)
+            if column.type != schema_field.type:
+                column = pc.cast(column, schema_field.type)
+        columns.append(column)
+        fields.append(schema_field)
+
+    for name in table.column_names:
+        if name not in BREWERY_SCHEMA.names:
+            columns.append(table[name])
+            fields.append(table.schema.field(name))
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+
+def read_bronze_table(path: Path) -> pa.Table:
+    """
+    Lê um arquivo Bronze direto para Arrow
+
+    NDJSON (inclusive .gz/.zst) é lido pelo leitor JSON do pyarrow, sem passar
+    por objetos Python; arquivos JSON antigos (lista de registros) e
+    manifestos do repositório de objetos (``utils.storage``) são convertidos
+    com ``Table.from_pylist``.
+    """
+    path = Path(path)
+    store = store_of_manifest(path)
+    if store is not None:
+        table = pa.Table.from_pylist(list(store.iter_records(store.read_manifest(path))))
+    elif ".ndjson" in path.suffixes:
+        parse_options = pj.ParseOptions(
+            explicit_schema=pa.schema([f for f in BREWERY_SCHEMA if pa.types.is_string(f.type)]),
+            unexpected_field_behavior="infer",
+        )
+        with pa.input_stream(path, compression="detect") as stream:
+            table = pj.read_json(stream, parse_options=parse_options)
+    else:
+        table = pa.Table.from_pylist(list(iter_records(path)))
+    return conform(table)
+
+
+def list_bronze_files(source: Union[str, Path, Iterable[str]]) -> List[str]:
+    """
+    Resolve a entrada de process_many em uma lista de arquivos
+
+    Em um diretório, os arquivos NDJSON são descobertos pelos manifestos (só
+    existem para arquivos gravados até o fim); em um ObjectStore
+    (``utils.storage``), cada manifesto de execução é uma entrada.
+
+    Args:
+        source: Diretório, ObjectStore, padrão glob ou lista de arquivos
+
+    Returns:
+        Arquivos Bronze ordenados, sem manifestos, listas de IDs e arquivos
+        NDJSON ainda sem manifesto (gravação incompleta)
+    """
+    if isinstance(source, (str, Path)):
+        if is_store(Path(source)):
+            files = [str(p) for p in ObjectStore(str(source)).manifests()]
+        elif Path(source).is_dir():
+            files = [str(p)[:-len(MANIFEST_SUFFIX)] for p in Path(source).glob(f"*{MANIFEST_SUFFIX}")]
+            files += [str(p) for p in Path(source).glob(LEGACY_PATTERN)]
+        else:
+            files = glob.glob(str(source))
+    else:
+        files = [str(p) for p in source]
+    files = {f for f in files if not any(marker in Path(f).name for marker in NON_BREWERY_MARKERS)}
+    incomplete = {f for f in files if ".ndjson" in Path(f).suffixes and not is_complete(Path(f))}
+    for path in sorted(incomplete):
+        logger.warning(f"Arquivo sem manifesto ignorado (gravação incompleta?): {path}")
+    return sorted(files - incomplete)
+
+
+def shard_files(files: List[str], shards: int) -> List[List[str]]:
+    """Distribui os arquivos entre os shards equilibrando o total de bytes"""
+    buckets: List[List[str]] = [[] for _ in range(shards)]
+    sizes = [0] * shards
+    for path in sorted(files, key=os.path.getsize, reverse=True):
+        target = sizes.index(min(sizes))
+        buckets[target].append(path)
+        sizes[target] += os.path.getsize(path)
+    return [sorted(bucket) for bucket in buckets if bucket]
+
+
+def next_part_index(output_dir: Path) -> int:
+    """Próximo número livre de ``part-NNNNN.parquet`` no diretório"""
+    indexes = [int(p.stem.split("-")[1]) for p in output_dir.glob("part-*.parquet")
+               if p.stem.split("-")[1].isdigit()]
+    return max(indexes) + 1 if indexes else 0
+
+
+@dataclass
+class FileReport:
+    """Resultado do processamento de um arquivo Bronze"""
+    path: str
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    part: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class RunReport:
+    """Relatório de uma execução de process_many"""
+    output_dir: str
+    parts: List[str] = field(default_factory=list)
+    files: List[FileReport] = field(default_factory=list)
+    seconds: float = 0.0
+    quality: QualityReport = field(default_factory=QualityReport)
+
+    @property
+    def totals(self) -> Dict[str, Union[int, float]]:
+        return {
+            "files": len(self.files),
+            "failed": sum(1 for f in self.files if not f.ok),
+            "rows": sum(f.rows for f in self.files),
+            "bytes": sum(f.bytes for f in self.files),
+            "seconds": round(self.seconds, 3),
+        }
+
+
 class SilverTransformer:
     def __init__(self, silver_dir: str):
         self.silver_dir = silver_dir
         Path(self.silver_dir).mkdir(parents=True, exist_ok=True)
     
-    def process_file(self, bronze_file_path: str) -> bool:
+    def process_file(self, bronze_file_path: str, output_name: str = "breweries.parquet") -> bool:
         try:
             logger.info(f"Processing {bronze_file_path}")
             df = pd.read_json(bronze_file_path)
@@ -20,10 +225,335 @@ class SilverTransformer:
             df["process_date"] = pd.to_datetime("today")
             
             # Salva em Parquet
-            output_path = f"{self.silver_dir}/breweries.parquet"
+            output_path = f"{self.silver_dir}/{output_name}"
             df.to_parquet(output_path)
             
             return True
         except Exception as e:
             logger.error(f"Failed to process {bronze_file_path}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class BreweriesSilverTransformer(SilverTransformer):
+    """
+    Transforma qualquer número de arquivos Bronze de cervejarias (JSON ou
+    NDJSON de by_city, by_state, by_ids, search, autocomplete...) em um único
+    dataset Silver.
+
+    Os arquivos são lidos direto para uma única tabela Arrow no
+    ``BREWERY_SCHEMA`` e as regras de limpeza (fillna, coluna ``location``,
+    renomeação, ``processed_at``) são aplicadas uma vez com kernels do
+    ``pyarrow.compute``, sem colunas ``object`` do pandas. Tipo, estado e país
+    são gravados com dictionary encoding.
+
+    Os Parquets são gravados com o ``layout`` (``silver.parquet_layout``):
+    ordenados por país/estado/cidade/id, com row groups de tamanho fixo,
+    estatísticas e Bloom filters em ``id`` e ``codigo_postal`` para buscas
+    pontuais.
+
+    Antes da limpeza, os registros passam pela validação de qualidade
+    (``silver.quality``): linhas reprovadas vão para
+    ``<silver_dir>/quarantine/`` e o relatório fica em ``quality_report``.
+
+    Exemplo:
+        transformer = BreweriesSilverTransformer("data/silver")
+        transformer.process_files(list_bronze_files("data/bronze/breweries_raw"),
+                                  "breweries_daily.parquet")
+    """
+
+    def __init__(self, silver_dir: str, add_source_file: bool = False,
+                 layout: LayoutSpec = BREWERY_LAYOUT, check_quality: bool = True):
+        super().__init__(silver_dir)
+        self.add_source_file = add_source_file
+        self.layout = layout
+        self.check_quality = check_quality
+        self.quality_report = QualityReport()
+
+    def process_file(self, bronze_file_path: str, output_name: str = "breweries.parquet") -> bool:
+        return self.process_files([bronze_file_path], output_name) is not None
+
+    def read_bronze(self, bronze_files: Iterable[str],
+                    reports: Optional[List[FileReport]] = None) -> pa.Table:
+        """
+        Lê os arquivos Bronze para uma única tabela Arrow no BREWERY_SCHEMA
+
+        Args:
+            bronze_files: Arquivos JSON/NDJSON da camada Bronze
+            reports: Lista que recebe um FileReport por arquivo; quando
+                informada, um arquivo com erro é registrado e ignorado em vez
+                de interromper a leitura
+        """
+        tables = []
+        for path in bronze_files:
+            path = Path(path)
+            if path.name.endswith(".manifest.json"):
+                continue
+            start = time.perf_counter()
+            report = FileReport(str(path), bytes=path.stat().st_size)
+            try:
+                table = read_bronze_table(path)
+            except Exception as e:
+                if reports is None:
+                    raise
+                report.error = str(e)
+                logger.error(f"Failed to read {path}: {e}")
+                table = None
+            report.seconds = time.perf_counter() - start
+            if reports is not None:
+                reports.append(report)
+            if table is None:
+                continue
+
+            report.rows = table.num_rows
+            if table.num_rows == 0:
+                logger.warning(f"Arquivo sem registros: {path}")
+                continue
+            if self.add_source_file:
+                table = table.append_column(
+                    'source_file', pa.repeat(pa.scalar(path.name), table.num_rows))
+            tables.append(table)
+            logger.info(f"Lido {path}: {table.num_rows} registro(s)")
+
+        if not tables:
+            return BREWERY_SCHEMA.empty_table()
+        return pa.concat_tables(tables, promote_options="default")
+
+    def validate(self, table: pa.Table, quarantine_name: str) -> Tuple[pa.Table, QualityReport]:
+        """
+        Separa as linhas reprovadas na validação de qualidade
+
+        Args:
+            table: Registros lidos da Bronze (antes da limpeza)
+            quarantine_name: Caminho do Parquet de quarentena, relativo a
+                ``<silver_dir>/quarantine``
+
+        Returns:
+            Tupla com (linhas aprovadas, relatório)
+        """
+        if not self.check_quality:
+            return table, QualityReport(rows=table.num_rows, passed=table.num_rows)
+        passed, failed, report = validate(table)
+        path = quarantine(failed, Path(self.silver_dir) / QUARANTINE_DIR / quarantine_name)
+        if path is not None:
+            report.quarantine_paths.append(str(path))
+        return passed, report
+
+    @staticmethod
+    def clean(table: pa.Table) -> pa.Table:
+        """Aplica as regras de limpeza da camada Silver com kernels do pyarrow.compute"""
+        for column, value in FILL_VALUES.items():
+            table = _set_column(table, column, pc.fill_null(table[column], value))
+
+        # Coluna de localização consolidada (para particionamento futuro)
+        location = pc.binary_join_element_wise(*(table[c] for c in LOCATION_COLUMNS), ', ')
+        table = table.append_column('location', location)
+
+        table = table.rename_columns([RENAME_MAP.get(name, name) for name in table.column_names])
+        for column in DICTIONARY_COLUMNS:
+            table = _set_column(table, column, pc.dictionary_encode(table[column]))
+
+        processed_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        table = table.append_column('processed_at', pa.repeat(pa.scalar(processed_at), table.num_rows))
+        return stamp(table, "breweries")
+
+    def process_files(self, bronze_files: Iterable[str],
+                      output_name: str = "breweries.parquet") -> Optional[Path]:
+        """
+        Processa vários arquivos Bronze em um único Parquet Silver
+
+        Args:
+            bronze_files: Arquivos JSON/NDJSON da camada Bronze
+            output_name: Nome do arquivo gerado em silver_dir
+
+        Returns:
+            Caminho do Parquet gerado ou None em caso de erro
+        """
+        bronze_files: List[str] = [str(path) for path in bronze_files]
+        try:
+            table = self.read_bronze(bronze_files)
+            if table.num_rows == 0:
+                logger.warning("Nenhum registro encontrado nos arquivos Bronze")
+                return None
+
+            stem = Path(output_name).stem
+            table, self.quality_report = self.validate(
+                table, f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet")
+            if table.num_rows == 0:
+                logger.warning("Nenhum registro aprovado na validação de qualidade")
+                return None
+
+            table = self.clean(table)
+
+            output_path = write_table(table, Path(self.silver_dir) / output_name, self.layout)
+
+            logger.info(f"{table.num_rows} registro(s) de {len(bronze_files)} arquivo(s) -> {output_path}")
+            return output_path
+        except Exception as e:
+            logger.error(f"Failed to process {len(bronze_files)} file(s): {e}")
+            return None
+
+    def _process_shard(self, files: List[str],
+                       output_path: str) -> Tuple[List[FileReport], QualityReport]:
+        """Processa um shard de arquivos em um Parquet (executado no pool de processos)"""
+        reports: List[FileReport] = []
+        table = self.read_bronze(files, reports)
+        start = time.perf_counter()
+        output_path = Path(output_path)
+        table, quality = self.validate(table, f"{output_path.parent.name}/{output_path.name}")
+        if table.num_rows:
+            write_table(self.clean(table), output_path, self.layout)
+
+        # Tempo de limpeza/gravação é rateado entre os arquivos pelo número de linhas
+        elapsed = time.perf_counter() - start
+        total_rows = sum(r.rows for r in reports) or 1
+        for report in reports:
+            report.seconds += elapsed * report.rows / total_rows
+            if report.ok and table.num_rows:
+                report.part = str(output_path)
+        return reports, quality
+
+    def process_many(self, source: Union[str, Path, Iterable[str]],
+                     output_name: str = "breweries_parts",
+                     max_workers: Optional[int] = None,
+                     ledger: Optional[ProcessedFileLedger] = None) -> RunReport:
+        """
+        Processa vários arquivos Bronze em paralelo, um Parquet por shard
+
+        Os arquivos são divididos em shards de tamanho equilibrado (um por
+        núcleo disponível) e cada shard é processado em um processo separado,
+        gravando ``<silver_dir>/<output_name>/part-00000.parquet``,
+        ``part-00001.parquet``... Partes de execuções anteriores são mantidas;
+        a numeração continua a partir da última.
+
+        Com um ledger, apenas arquivos novos, alterados ou interrompidos são
+        processados e o resultado de cada arquivo é registrado assim que o
+        seu shard termina, permitindo retomar a execução após uma queda. A
+        parte gravada antes para um arquivo alterado é removida; como uma
+        parte guarda vários arquivos, os demais arquivos dela são
+        reprocessados junto.
+
+        Args:
+            source: Diretório, padrão glob ou lista de arquivos Bronze
+            output_name: Diretório do dataset gerado em silver_dir
+            max_workers: Número de processos (padrão: os.cpu_count())
+            ledger: Ledger de arquivos processados (processamento incremental)
+
+        Returns:
+            RunReport com linhas, bytes e segundos por arquivo
+        """
+        start = time.perf_counter()
+        files = list_bronze_files(source)
+        output_dir = Path(self.silver_dir) / output_name
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report = RunReport(str(output_dir))
+        stale_parts: List[str] = []
+        if ledger is not None:
+            pending = ledger.pending(files)
+            stale_parts = [part for part in ledger.parts_of(pending)
+                           if Path(part).resolve().parent == output_dir.resolve()]
+            shared = set(ledger.files_in_parts(files, stale_parts)) - set(pending)
+            files = pending + sorted(shared)
+        if not files:
+            logger.warning(f"Nenhum arquivo Bronze novo encontrado em {source}")
+            return report
+
+        # Numeração calculada antes da remoção: nomes de partes não são reutilizados
+        first_part = next_part_index(output_dir)
+        if ledger is not None:
+            ledger.mark_running(files)
+        # Depois de mark_running: se a execução cair, os arquivos voltam como pendentes
+        for part in stale_parts:
+            if os.path.exists(part):
+                os.remove(part)
+                logger.info(f"Parte obsoleta removida: {part}")
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(files)))
+        shards = shard_files(files, workers)
+        logger.info(f"{len(files)} arquivo(s) em {len(shards)} shard(s) com {workers} processo(s)")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._process_shard, shard,
+                                str(output_dir / f"part-{first_part + index:05d}.parquet")): index
+                for index, shard in enumerate(shards)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    shard_reports, quality = future.result()
+                    report.quality.merge(quality)
+                except Exception as e:
+                    logger.error(f"Failed to process shard {index}: {e}")
+                    shard_reports = [FileReport(path, error=str(e)) for path in shards[index]]
+                report.files.extend(shard_reports)
+
+                if ledger is not None:
+                    for file_report in shard_reports:
+                        if file_report.ok:
+                            ledger.mark_done(file_report.path, file_report.rows, file_report.part)
+                        else:
+                            ledger.mark_failed(file_report.path, file_report.error)
+
+        report.parts = sorted({f.part for f in report.files if f.part})
+        report.seconds = time.perf_counter() - start
+        totals = report.totals
+        logger.info(
+            f"{totals['rows']} registro(s) de {totals['files']} arquivo(s) em "
+            f"{len(report.parts)} parte(s), {totals['seconds']}s, {totals['failed']} falha(s), "
+            f"{report.quality.quarantined} em quarentena"
+        )
+        return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import dataclasses
+    import json
+    import sys
+    from dataclasses import asdict
+
+    from silver.quality import write_report
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Bronze -> Silver para arquivos de cervejarias")
+    parser.add_argument("inputs", nargs="+", help="Arquivos, diretórios ou padrões glob da camada Bronze")
+    parser.add_argument("--silver-dir", default="data/silver", help="Diretório de saída")
+    parser.add_argument("--output", default="breweries.parquet",
+                        help="Nome do Parquet gerado (com --workers/--ledger, nome do diretório do dataset)")
+    parser.add_argument("--source-file", action="store_true", help="Adiciona a coluna source_file")
+    parser.add_argument("--workers", type=int, help="Processa em paralelo com N processos, um Parquet por shard")
+    parser.add_argument("--row-group-size", type=int, default=BREWERY_LAYOUT.row_group_size,
+                        help="Linhas por row group nos Parquets gerados (padrão: %(default)s)")
+    parser.add_argument("--skip-quality", action="store_true",
+                        help="Não executa a validação de qualidade (sem quarentena)")
+    parser.add_argument("--report", help="Grava o relatório da execução em JSON neste caminho")
+    parser.add_argument("--ledger", nargs="?", const=LEDGER_PATH,
+                        help="Processa apenas arquivos novos/alterados (ledger SQLite, padrão: %(const)s)")
+    args = parser.parse_args()
+
+    files = sorted({path for source in args.inputs for path in list_bronze_files(source)})
+    layout = dataclasses.replace(BREWERY_LAYOUT, row_group_size=args.row_group_size)
+    transformer = BreweriesSilverTransformer(args.silver_dir, add_source_file=args.source_file,
+                                             layout=layout, check_quality=not args.skip_quality)
+
+    if not args.workers and not args.ledger:
+        output_path = transformer.process_files(files, args.output)
+        if args.report:
+            write_report(transformer.quality_report, args.report)
+        sys.exit(0 if output_path else 1)
+
+    output_name = args.output[:-len(".parquet")] if args.output.endswith(".parquet") else args.output
+    ledger = ProcessedFileLedger(args.ledger) if args.ledger else None
+    try:
+        report = transformer.process_many(files, output_name, max_workers=args.workers, ledger=ledger)
+    finally:
+        if ledger is not None:
+            ledger.close()
+    if args.report:
+        Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"totals": report.totals, "parts": report.parts,
+                       "files": [asdict(r) for r in report.files],
+                       "quality": report.quality.to_dict()}, f, indent=2, ensure_ascii=False)
+    sys.exit(1 if report.totals["failed"] else 0)
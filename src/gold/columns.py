@@ -1,13 +1,7 @@
-import duckdb
+from gold.warehouse import connect
 
-# Conectar ao DuckDB (cria um banco em memória)
-con = duckdb.connect()
-
-# 1. LER OS DADOS DA SILVER (arquivo consolidado) - usando raw string
-con.execute(r"""
-    CREATE TABLE silver_breweries AS
-    SELECT * FROM 'C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated.parquet';
-""")
+# Conectar ao warehouse da Gold (silver_breweries é uma view sobre a Silver consolidada)
+con = connect()
 
 # Verificar colunas disponíveis
 print("Colunas disponíveis na silver_breweries:")
@@ -1,97 +1,421 @@
-import duckdb
-from pathlib import Path
 import os
 
-# Configurar caminhos
-base_path = Path(r"C:\Users\55349\brewery-data-pipeline")
+from gold.warehouse import base_path, connect, table_exists
+
+# Configurar caminhos (raiz em gold.warehouse, via BREWERY_PIPELINE_HOME)
 gold_path = base_path / "data" / "gold"
-gold_path.mkdir(parents=True, exist_ok=True)
-
-# Conectar ao DuckDB
-con = duckdb.connect()
-
-# 1. Carregar dados da Silver
-con.execute(r"""
-    CREATE TABLE silver_breweries AS
-    SELECT * FROM 'C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated.parquet';
-""")
-
-# 2. Criar dimensões 
-con.execute("""
-    CREATE TABLE dim_localizacao AS
-    SELECT 
-        row_number() OVER () AS localizacao_id,
-        city AS cidade,
-        estado_provincia AS estado,
-        country AS pais,
-        codigo_postal AS cep,
-        longitude,
-        latitude,
-        location
-    FROM silver_breweries
-    GROUP BY city, estado_provincia, country, codigo_postal, longitude, latitude, location;
-""")
-
-con.execute("""
-    CREATE TABLE dim_tipo_cervejaria AS
-    SELECT 
-        row_number() OVER () AS tipo_id,
-        tipos_cervejaria AS tipo,
-        site
-    FROM silver_breweries
-    WHERE tipos_cervejaria IS NOT NULL
-    GROUP BY tipos_cervejaria, site
-""")
-
-# Adicionando a nova dimensão de status
-con.execute("""
-    CREATE TABLE dim_status AS
-    SELECT DISTINCT
-        ROW_NUMBER() OVER (ORDER BY CASE WHEN phone = 'N/A' THEN 'Inativo' ELSE 'Ativo' END) AS status_id,
-        CASE 
-            WHEN phone = 'N/A' THEN 'Inativo'
-            ELSE 'Ativo'
-        END AS status,
-        CASE 
-            WHEN phone = 'N/A' THEN 'Cervejaria não operacional'
-            ELSE 'Cervejaria operacional'
-        END AS status_description
-    FROM silver_breweries;
-""")
-
-# 3. Criar tabela fato SEM JOINs (apenas dados brutos)
-con.execute("""
-    CREATE TABLE fato_cervejarias AS
-    SELECT
-        id,
-        name AS nome,
-        tipos_cervejaria,  -- Mantido como texto (depois podemos mapear para dim_tipo)
-        address_1 AS endereco,
-        address_2 AS endereco_2,
-        phone AS telefone,
-        site,
-        street AS rua,
-        city,              -- Dados brutos (depois podemos associar a dim_localizacao)
-        estado_provincia,
-        country,
-        codigo_postal,
-        longitude,
-        latitude,
-        location,
-        CURRENT_TIMESTAMP AS data_carga,
-        CASE WHEN phone = 'N/A' THEN 'Inativo' ELSE 'Ativo' END AS status  -- Adicionando status para possível join depois
-    FROM silver_breweries;
-""")
-
-# 4. Exportar para Parquet (atualizado com a nova dimensão)
-tables = ["dim_localizacao", "dim_tipo_cervejaria", "dim_status", "fato_cervejarias"]
-
-for table in tables:
-    output_file = gold_path / f"{table}.parquet"
+
+# Dimensões: chave substituta, colunas (nome na dimensão -> expressão sobre a
+# Silver) e filtro opcional dos membros. A chave natural é o conjunto de
+# colunas; um membro recebe a chave uma única vez e a mantém nas execuções
+# seguintes.
+DIMENSIONS = {
+    "dim_localizacao": {
+        "key": "localizacao_id",
+        "columns": {
+            "cidade": "city",
+            "estado": "estado_provincia",
+            "pais": "country",
+            "cep": "codigo_postal",
+            "longitude": "longitude",
+            "latitude": "latitude",
+            "location": "location",
+        },
+        "where": None,
+    },
+    "dim_tipo_cervejaria": {
+        "key": "tipo_id",
+        "columns": {
+            "tipo": "tipos_cervejaria",
+            "site": "site",
+        },
+        "where": "tipo IS NOT NULL",
+    },
+    "dim_status": {
+        "key": "status_id",
+        "columns": {
+            "status": "CASE WHEN phone = 'N/A' THEN 'Inativo' ELSE 'Ativo' END",
+            "status_description": "CASE WHEN phone = 'N/A' THEN 'Cervejaria não operacional' "
+                                  "ELSE 'Cervejaria operacional' END",
+        },
+        "where": None,
+    },
+}
+
+# Datas da fato: nome em fato_atual -> (expressão sobre a Silver, FK para dim_data)
+DATE_COLUMNS = {
+    "data_criacao": ("TRY_CAST(left(CAST(created_at AS VARCHAR), 10) AS DATE)", "data_criacao_id"),
+    "data_atualizacao": ("TRY_CAST(left(CAST(updated_at AS VARCHAR), 10) AS DATE)", "data_atualizacao_id"),
+}
+
+# Fato estreita: id/nome da cervejaria, FKs inteiras para as dimensões e controle de carga
+FACT_DDL = """
+    CREATE TABLE fato_cervejarias (
+        id VARCHAR,
+        nome VARCHAR,
+        localizacao_id BIGINT,
+        tipo_id BIGINT,
+        status_id BIGINT,
+        data_criacao_id INTEGER,
+        data_atualizacao_id INTEGER,
+        data_carga TIMESTAMP WITH TIME ZONE,
+        row_hash VARCHAR
+    )
+"""
+
+DATE_DDL = """
+    CREATE TABLE dim_data (
+        data_id INTEGER,
+        data DATE,
+        ano INTEGER,
+        trimestre INTEGER,
+        mes INTEGER,
+        dia INTEGER,
+        dia_semana INTEGER
+    )
+"""
+
+# Rollup de contagens: hierarquia geográfica x tipo x status (todas as combinações)
+ROLLUP_TABLE = "agg_cervejarias"
+ROLLUP_GEO_LEVELS = [[], ["pais"], ["pais", "estado"], ["pais", "estado", "cidade"]]
+ROLLUP_COLUMNS = ["pais", "estado", "cidade", "tipo", "status"]
+
+
+class JoinCardinalityError(ValueError):
+    """A ligação da fato com uma dimensão multiplicou linhas ou deixou FKs sem membro"""
+
+
+def load_table(con, table, path, create_sql):
+    """
+    Garante a tabela no warehouse
+
+    Na primeira execução com o warehouse, importa o Parquet exportado pelas
+    cargas anteriores (mantendo as chaves); sem ele, cria a tabela vazia.
+    """
+    if table_exists(con, table):
+        return
+    if path.exists():
+        con.execute(f"CREATE TABLE {table} AS SELECT * FROM read_parquet('{path.as_posix()}')")
+    else:
+        con.execute(create_sql)
+
+
+def stage_silver(con):
+    """
+    Lê a Silver uma única vez para fato_atual (temporária)
+
+    Traz id/nome, as colunas naturais de todas as dimensões, as datas e o
+    row_hash (md5 de tudo isso), usado para detectar cervejarias alteradas.
+    """
+    expressions = {"id": "id", "nome": "name"}
+    for dimension in DIMENSIONS.values():
+        expressions.update(dimension["columns"])
+    expressions.update({name: expr for name, (expr, _) in DATE_COLUMNS.items()})
+
+    select = ",\n            ".join(f"{expr} AS {name}" for name, expr in expressions.items())
+    row_hash = ", ".join(f"{name} := {name}" for name in expressions)
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE fato_atual AS
+        SELECT *, md5(CAST(struct_pack({row_hash}) AS VARCHAR)) AS row_hash
+        FROM (
+            SELECT
+            {select}
+            FROM silver_breweries
+        )
+    """)
+
+
+def _members_sql(dimension):
+    columns = ", ".join(dimension["columns"])
+    where = f"WHERE {dimension['where']}" if dimension["where"] else ""
+    return f"SELECT DISTINCT {columns} FROM fato_atual {where}"
+
+
+def _match(dimension, left, right):
+    return " AND ".join(f"{left}.{c} IS NOT DISTINCT FROM {right}.{c}" for c in dimension["columns"])
+
+
+def update_dimension(con, table, dimension):
+    """
+    Insere apenas os membros novos, com chaves a partir do maior id existente
+
+    Returns:
+        Número de membros inseridos
+    """
+    key, members_sql = dimension["key"], _members_sql(dimension)
+    load_table(con, table, gold_path / f"{table}.parquet",
+               f"CREATE TABLE {table} AS SELECT CAST(NULL AS BIGINT) AS {key}, * FROM ({members_sql}) LIMIT 0")
+
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE novos_membros AS
+        SELECT n.* FROM ({members_sql}) n
+        WHERE NOT EXISTS (SELECT 1 FROM {table} d WHERE {_match(dimension, 'd', 'n')})
+    """)
+    con.execute(f"""
+        INSERT INTO {table} BY NAME
+        SELECT
+            (SELECT COALESCE(MAX({key}), 0) FROM {table})
+                + row_number() OVER (ORDER BY {', '.join(dimension['columns'])}) AS {key},
+            *
+        FROM novos_membros
+    """)
+    return con.execute("SELECT COUNT(*) FROM novos_membros").fetchone()[0]
+
+
+def update_date_dimension(con):
+    """
+    Insere as datas novas em dim_data
+
+    A chave é a própria data (AAAAMMDD), estável por construção.
+
+    Returns:
+        Número de datas inseridas
+    """
+    load_table(con, "dim_data", gold_path / "dim_data.parquet", DATE_DDL)
+    dates = " UNION ".join(f"SELECT {name} AS data FROM fato_atual" for name in DATE_COLUMNS)
     con.execute(f"""
-        COPY {table} TO '{output_file.as_posix()}' (FORMAT PARQUET);
+        CREATE OR REPLACE TEMP TABLE novas_datas AS
+        SELECT DISTINCT data FROM ({dates})
+        WHERE data IS NOT NULL AND data NOT IN (SELECT data FROM dim_data)
+    """)
+    con.execute("""
+        INSERT INTO dim_data
+        SELECT
+            CAST(strftime(data, '%Y%m%d') AS INTEGER) AS data_id,
+            data,
+            year(data) AS ano,
+            quarter(data) AS trimestre,
+            month(data) AS mes,
+            day(data) AS dia,
+            isodow(data) AS dia_semana
+        FROM novas_datas
     """)
-    print(f"Tabela {table} exportada para: {output_file}")
+    return con.execute("SELECT COUNT(*) FROM novas_datas").fetchone()[0]
+
+
+def check_unique_members(con, table, dimension):
+    """Falha se a chave natural repete na dimensão (a ligação com a fato multiplicaria linhas)"""
+    columns = ", ".join(dimension["columns"])
+    duplicated = con.execute(f"""
+        SELECT COUNT(*) FROM (
+            SELECT {columns} FROM {table} GROUP BY ALL HAVING COUNT(*) > 1
+        )
+    """).fetchone()[0]
+    if duplicated:
+        raise JoinCardinalityError(
+            f"{table}: {duplicated} chave(s) natural(is) com mais de um {dimension['key']}")
+
+
+def migrate_legacy_fact(con):
+    """
+    Renomeia a fato larga (colunas de texto, sem FKs) para fato_cervejarias_legado
+
+    Returns:
+        True se havia uma fato antiga para migrar
+    """
+    columns = {name for name, *_ in con.execute("DESCRIBE fato_cervejarias").fetchall()}
+    if "localizacao_id" in columns:
+        return False
+    con.execute("DROP TABLE IF EXISTS fato_cervejarias_legado")
+    con.execute("ALTER TABLE fato_cervejarias RENAME TO fato_cervejarias_legado")
+    con.execute(FACT_DDL)
+    return True
+
+
+def merge_fact(con):
+    """
+    Atualiza a fato só com as cervejarias novas ou alteradas (comparando row_hash)
+
+    As linhas alteradas recebem as FKs por hash join com as dimensões, pela
+    chave natural completa. A carga falha (JoinCardinalityError) se alguma
+    ligação multiplicar linhas ou deixar uma FK sem membro. Linhas iguais às
+    da última carga mantêm o data_carga original e cervejarias que saíram da
+    Silver são removidas.
+
+    Returns:
+        Número de linhas inseridas/substituídas/removidas
+    """
+    load_table(con, "fato_cervejarias", gold_path / "fato_cervejarias.parquet", FACT_DDL)
+    legacy = migrate_legacy_fact(con)
+
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE fato_delta AS
+        SELECT n.*
+        FROM fato_atual n
+        LEFT JOIN fato_cervejarias f ON f.id = n.id
+        WHERE f.id IS NULL OR f.row_hash IS DISTINCT FROM n.row_hash
+    """)
+
+    keys = ["n.id", "n.nome"]
+    joins = []
+    for i, (table, dimension) in enumerate(DIMENSIONS.items()):
+        check_unique_members(con, table, dimension)
+        keys.append(f"d{i}.{dimension['key']}")
+        joins.append(f"LEFT JOIN {table} d{i} ON {_match(dimension, f'd{i}', 'n')}")
+    for name, (_, key) in DATE_COLUMNS.items():
+        keys.append(f"{name}.data_id AS {key}")
+        joins.append(f"LEFT JOIN dim_data {name} ON {name}.data = n.{name}")
+    keys.append("n.row_hash")
+
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE fato_chaves AS
+        SELECT {', '.join(keys)}
+        FROM fato_delta n
+        {' '.join(joins)}
+    """)
+
+    # Cardinalidade: exatamente uma linha por cervejaria e nenhuma FK órfã
+    delta_rows = con.execute("SELECT COUNT(*) FROM fato_delta").fetchone()[0]
+    keyed_rows = con.execute("SELECT COUNT(*) FROM fato_chaves").fetchone()[0]
+    if keyed_rows != delta_rows:
+        raise JoinCardinalityError(
+            f"fato_cervejarias: {delta_rows} linha(s) viraram {keyed_rows} nas ligações com as dimensões")
+    for table, dimension in DIMENSIONS.items():
+        condition = f"AND ({dimension['where']})" if dimension["where"] else ""
+        orphans = con.execute(f"""
+            SELECT COUNT(*) FROM fato_chaves k JOIN fato_delta n USING (id)
+            WHERE k.{dimension['key']} IS NULL {condition}
+        """).fetchone()[0]
+        if orphans:
+            raise JoinCardinalityError(f"fato_cervejarias: {orphans} linha(s) sem membro em {table}")
+
+    # Cervejarias que não estão mais na Silver (fato_atual é o retrato completo)
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE fato_removidas AS
+        SELECT f.id FROM fato_cervejarias f
+        WHERE NOT EXISTS (SELECT 1 FROM fato_atual n WHERE n.id = f.id)
+    """)
+    removed_rows = con.execute("SELECT COUNT(*) FROM fato_removidas").fetchone()[0]
+
+    # Variação da fato (-1 para a versão anterior ou removida, +1 para a nova), usada pelo rollup
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE fato_variacao AS
+        SELECT localizacao_id, tipo_id, status_id, -1 AS sinal
+        FROM fato_cervejarias
+        WHERE id IN (SELECT id FROM fato_chaves) OR id IN (SELECT id FROM fato_removidas)
+        UNION ALL
+        SELECT localizacao_id, tipo_id, status_id, 1 AS sinal FROM fato_chaves
+    """)
+
+    con.execute("""
+        DELETE FROM fato_cervejarias
+        WHERE id IN (SELECT id FROM fato_chaves) OR id IN (SELECT id FROM fato_removidas)
+    """)
+    con.execute("""
+        INSERT INTO fato_cervejarias BY NAME
+        SELECT *, CURRENT_TIMESTAMP AS data_carga FROM fato_chaves
+    """)
+
+    if legacy:
+        # Cervejarias que já estavam na fato antiga mantêm a data da carga original
+        con.execute("""
+            UPDATE fato_cervejarias SET data_carga = l.data_carga
+            FROM fato_cervejarias_legado l
+            WHERE fato_cervejarias.id = l.id
+        """)
+        con.execute("DROP TABLE fato_cervejarias_legado")
+        print("fato_cervejarias: fato antiga (colunas de texto) migrada para FKs")
+    return delta_rows + removed_rows
+
+
+def _rollup_sql(source):
+    """Contagens de source (FKs + sinal) em todos os grouping sets do rollup"""
+    sets = [geo + tipo + status
+            for geo in ROLLUP_GEO_LEVELS for tipo in ([], ["tipo"]) for status in ([], ["status"])]
+    grouping_sets = ", ".join(f"({', '.join(columns)})" for columns in sets)
+    columns = ", ".join(ROLLUP_COLUMNS)
+    return f"""
+        SELECT GROUPING({columns}) AS nivel, {columns}, CAST(SUM(sinal) AS BIGINT) AS cervejarias
+        FROM (
+            SELECT l.pais, l.estado, l.cidade, t.tipo, s.status, v.sinal
+            FROM {source} v
+            LEFT JOIN dim_localizacao l USING (localizacao_id)
+            LEFT JOIN dim_tipo_cervejaria t USING (tipo_id)
+            LEFT JOIN dim_status s USING (status_id)
+        )
+        GROUP BY GROUPING SETS ({grouping_sets})
+        HAVING SUM(sinal) <> 0
+    """
+
+
+def update_rollup(con):
+    """
+    Atualiza agg_cervejarias a partir da variação da fato
+
+    Cada linha é uma combinação de (pais, estado, cidade) x tipo x status;
+    ``nivel`` é o GROUPING das colunas (bit 1 = coluna agregada, com valor
+    nulo). Só os grupos tocados pelas cervejarias novas/alteradas são
+    recalculados (contagem atual + variação) e grupos que chegam a zero são
+    removidos. Na primeira execução o rollup é montado a partir da fato inteira.
+
+    Returns:
+        Número de grupos alterados
+    """
+    if not table_exists(con, ROLLUP_TABLE):
+        con.execute(f"""
+            CREATE TABLE {ROLLUP_TABLE} AS
+            {_rollup_sql("(SELECT localizacao_id, tipo_id, status_id, 1 AS sinal FROM fato_cervejarias)")}
+        """)
+        return con.execute(f"SELECT COUNT(*) FROM {ROLLUP_TABLE}").fetchone()[0]
+
+    match = " AND ".join(["a.nivel = d.nivel"] + [f"a.{c} IS NOT DISTINCT FROM d.{c}" for c in ROLLUP_COLUMNS])
+    con.execute(f"CREATE OR REPLACE TEMP TABLE rollup_delta AS {_rollup_sql('fato_variacao')}")
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE rollup_novo AS
+        SELECT nivel, {', '.join(ROLLUP_COLUMNS)}, CAST(SUM(cervejarias) AS BIGINT) AS cervejarias
+        FROM (
+            SELECT a.* FROM {ROLLUP_TABLE} a WHERE EXISTS (SELECT 1 FROM rollup_delta d WHERE {match})
+            UNION ALL
+            SELECT * FROM rollup_delta
+        )
+        GROUP BY ALL
+    """)
+    con.execute(f"DELETE FROM {ROLLUP_TABLE} a WHERE EXISTS (SELECT 1 FROM rollup_delta d WHERE {match})")
+    con.execute(f"INSERT INTO {ROLLUP_TABLE} BY NAME SELECT * FROM rollup_novo WHERE cervejarias <> 0")
+    return con.execute("SELECT COUNT(*) FROM rollup_delta").fetchone()[0]
+
+
+def export(con, table):
+    """Grava a tabela em Parquet (arquivo temporário + rename)"""
+    output_file = gold_path / f"{table}.parquet"
+    tmp_file = gold_path / f"_{table}.parquet.tmp"
+    con.execute(f"COPY {table} TO '{tmp_file.as_posix()}' (FORMAT PARQUET);")
+    os.replace(tmp_file, output_file)
+    return output_file
+
+
+if __name__ == "__main__":
+    gold_path.mkdir(parents=True, exist_ok=True)
+
+    # 1. Warehouse persistente; silver_breweries é uma view sobre a Silver consolidada
+    con = connect(require_silver=True)
+
+    # Dimensões e fato mudam juntas: uma falha no meio não deixa a Gold pela metade
+    con.execute("BEGIN TRANSACTION")
+    try:
+        stage_silver(con)
+
+        # 2. Dimensões: só membros novos, chaves estáveis entre execuções
+        for table, dimension in DIMENSIONS.items():
+            inserted = update_dimension(con, table, dimension)
+            print(f"{table}: {inserted} membro(s) novo(s)")
+        print(f"dim_data: {update_date_dimension(con)} data(s) nova(s)")
+
+        # 3. Fato: só linhas novas ou alteradas, com FKs inteiras
+        changed = merge_fact(con)
+        print(f"fato_cervejarias: {changed} linha(s) nova(s)/alterada(s)/removida(s)")
+
+        # 4. Rollup de contagens (dashboards leem algumas centenas de linhas, não a fato)
+        print(f"{ROLLUP_TABLE}: {update_rollup(con)} grupo(s) atualizado(s)")
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+    # 5. Exportar para Parquet (consumidores fora do DuckDB)
+    for table in [*DIMENSIONS, "dim_data", "fato_cervejarias", ROLLUP_TABLE]:
+        output_file = export(con, table)
+        print(f"Tabela {table} exportada para: {output_file}")
 
-# Fechar conexão
-con.close()
\ No newline at end of file
+    # Fechar conexão
+    con.close()
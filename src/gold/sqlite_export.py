@@ -0,0 +1,202 @@
+# gold/sqlite_export.py
+"""
+Exportação em massa de tabelas Arrow para SQLite.
+
+Substitui o ``fetchall()`` + ``executemany`` linha a linha e o ``df.to_sql``
+por arquivo:
+
+- os dados chegam em lotes Arrow (``RecordBatchReader`` do DuckDB ou de
+  Parquets), sem materializar a tabela inteira em tuplas Python;
+- cada lote é convertido coluna a coluna (datas viram texto ISO, dicionários
+  são decodificados) e inserido com um único INSERT preparado
+  (``executemany``);
+- todas as tabelas são gravadas em uma única transação, com
+  ``journal_mode=WAL`` e ``synchronous=OFF`` durante a carga;
+- os índices são criados depois da carga, de uma vez, e não atualizados
+  linha a linha.
+
+Exemplo:
+    from functools import partial
+    from gold.sqlite_export import duckdb_reader, export_tables
+
+    export_tables("data/gold/brewery_dimensional_model.db",
+                  {"fato_cervejarias": partial(duckdb_reader, con, "fato_cervejarias")},
+                  indexes={"fato_cervejarias": ["id", "localizacao_id"]})
+"""
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+BATCH_SIZE = 50_000
+CACHE_SIZE_KB = 200_000     # cache de páginas do SQLite durante a carga
+
+# Tabela, leitor em lotes ou função que abre o leitor só na hora da carga
+# (um resultado do DuckDB é invalidado pela próxima consulta na mesma conexão)
+Source = Union[pa.Table, pa.RecordBatchReader, Callable[[], pa.RecordBatchReader]]
+
+
+def sqlite_type(arrow_type: pa.DataType) -> str:
+    """Afinidade de tipo do SQLite para um tipo Arrow"""
+    if pa.types.is_dictionary(arrow_type):
+        return sqlite_type(arrow_type.value_type)
+    if pa.types.is_integer(arrow_type) or pa.types.is_boolean(arrow_type):
+        return "INTEGER"
+    if pa.types.is_decimal(arrow_type) and arrow_type.scale == 0:
+        return "INTEGER"     # ex: HUGEINT do DuckDB (SUM de inteiros) chega como decimal(38, 0)
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return "REAL"
+    if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type):
+        return "BLOB"
+    return "TEXT"    # texto, datas/timestamps (ISO 8601) e tipos aninhados (JSON)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_values(column: pa.Array) -> list:
+    """Valores Python de uma coluna, já nos tipos aceitos pelo sqlite3"""
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    if pa.types.is_decimal(column.type) and column.type.scale == 0:
+        column = pc.cast(column, pa.int64())
+    elif pa.types.is_decimal(column.type):
+        column = pc.cast(column, pa.float64())
+    elif pa.types.is_boolean(column.type):
+        column = pc.cast(column, pa.int8())
+    elif pa.types.is_timestamp(column.type) or pa.types.is_date(column.type) or pa.types.is_time(column.type):
+        column = pc.cast(column, pa.string())
+    elif pa.types.is_nested(column.type):
+        return [None if value is None else json.dumps(value, default=str) for value in column.to_pylist()]
+    return column.to_pylist()
+
+
+def _rows(batch: pa.RecordBatch) -> Iterator[tuple]:
+    """Linhas de um lote, convertidas coluna a coluna (sem acessar célula por célula no Arrow)"""
+    return zip(*(_column_values(column) for column in batch.columns))
+
+
+def duckdb_reader(con, table: str, batch_size: int = BATCH_SIZE) -> pa.RecordBatchReader:
+    """Lê uma tabela/view do DuckDB em lotes Arrow"""
+    return con.execute(f"SELECT * FROM {table}").fetch_record_batch(batch_size)
+
+
+def parquet_reader(path: str, batch_size: int = BATCH_SIZE) -> pa.RecordBatchReader:
+    """Lê um Parquet (ou diretório de Parquets) em lotes Arrow"""
+    return ds.dataset(path, format="parquet").scanner(batch_size=batch_size).to_reader()
+
+
+def table_names(paths: Iterable[str], root: str) -> Dict[str, str]:
+    """
+    Nome de tabela para cada Parquet, a partir do caminho relativo à raiz
+
+    ``breweries_parts/part-00000.parquet`` vira ``breweries_parts_part_00000``,
+    então arquivos com o mesmo nome em diretórios diferentes não se
+    sobrescrevem. Nomes que ainda coincidem (ex: ``a-b`` e ``a_b``) recebem
+    um sufixo numérico, com aviso.
+
+    Returns:
+        Nome da tabela -> caminho do Parquet
+    """
+    names: Dict[str, str] = {}
+    for path in sorted(paths):
+        relative = Path(path).relative_to(root).with_suffix("")
+        base = re.sub(r"\W+", "_", "_".join(relative.parts).lower()).strip("_")
+        name, counter = base, 1
+        while name in names:
+            counter += 1
+            name = f"{base}_{counter}"
+        if name != base:
+            logger.warning(f"Tabela {base} já usada por {names[base]}; {path} -> {name}")
+        names[name] = path
+    return names
+
+
+def _load_table(cursor: sqlite3.Cursor, table: str, source: Source) -> int:
+    if callable(source):
+        source = source()
+    reader = source.to_reader() if isinstance(source, pa.Table) else source
+    schema = reader.schema
+    columns = ", ".join(f"{_quote(f.name)} {sqlite_type(f.type)}" for f in schema)
+    placeholders = ", ".join("?" for _ in schema)
+
+    cursor.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+    cursor.execute(f"CREATE TABLE {_quote(table)} ({columns})")
+    insert_sql = f"INSERT INTO {_quote(table)} VALUES ({placeholders})"
+
+    rows = 0
+    for batch in reader:
+        if batch.num_rows:
+            cursor.executemany(insert_sql, _rows(batch))
+            rows += batch.num_rows
+    return rows
+
+
+def export_tables(sqlite_path: str, tables: Dict[str, Source],
+                  indexes: Optional[Dict[str, List[str]]] = None) -> Dict[str, int]:
+    """
+    Grava tabelas Arrow em um banco SQLite (as tabelas existentes são substituídas)
+
+    Args:
+        sqlite_path: Arquivo SQLite de destino
+        tables: Nome da tabela -> pa.Table, RecordBatchReader ou função sem
+            argumentos que devolve o leitor (chamada quando a tabela é gravada)
+        indexes: Nome da tabela -> colunas indexadas (uma coluna ou
+            "col_a, col_b" para índices compostos), criados após a carga
+
+    Returns:
+        Linhas gravadas por tabela
+    """
+    start = time.perf_counter()
+    Path(sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(sqlite_path, isolation_level=None)   # transação controlada abaixo
+    stats: Dict[str, int] = {}
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            for table, source in tables.items():
+                stats[table] = _load_table(cursor, table, source)
+                logger.info(f"Tabela {table}: {stats[table]} registro(s)")
+
+            for table, table_indexes in (indexes or {}).items():
+                if table not in stats:
+                    continue
+                for index in table_indexes:
+                    columns = [c.strip() for c in index.split(",")]
+                    name = _quote(f"idx_{table}_{'_'.join(columns)}")
+                    cursor.execute(f"CREATE INDEX {name} ON {_quote(table)} "
+                                   f"({', '.join(_quote(c) for c in columns)})")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        # Volta à durabilidade padrão do WAL e atualiza as estatísticas do planejador
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+    logger.info(
+        f"{sum(stats.values())} registro(s) em {len(stats)} tabela(s) exportados para "
+        f"{sqlite_path} em {time.perf_counter() - start:.2f}s"
+    )
+    return stats
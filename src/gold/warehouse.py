@@ -0,0 +1,102 @@
+# gold/warehouse.py
+"""
+Warehouse DuckDB persistente da camada Gold.
+
+Todos os scripts da Gold usam o mesmo arquivo
+(``data/gold/brewery_warehouse.duckdb``) em vez de um banco em memória que
+recarregava a Silver inteira a cada execução:
+
+- ``silver_breweries`` é uma view sobre os Parquets da tabela consolidada
+  (nenhuma cópia; o DuckDB lê só as colunas e row groups necessários);
+- as tabelas da Gold (dimensões e fato) são materializadas uma vez no arquivo
+  e atualizadas de forma incremental por ``modelationgold.py``.
+
+O DuckDB permite um único processo escrevendo no arquivo; consultas de
+análise podem abrir com ``read_only=True`` em paralelo entre si.
+
+A raiz do projeto vem da variável de ambiente ``BREWERY_PIPELINE_HOME``
+(padrão: o diretório local usado pelos demais scripts).
+
+Exemplo:
+    from gold.warehouse import connect
+
+    con = connect(read_only=True)
+    con.execute("SELECT COUNT(*) FROM fato_cervejarias").fetchone()
+"""
+import glob
+import os
+from pathlib import Path
+
+import duckdb
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+BASE_PATH_ENV = "BREWERY_PIPELINE_HOME"
+base_path = Path(os.environ.get(BASE_PATH_ENV, r"C:\Users\55349\brewery-data-pipeline"))
+WAREHOUSE_PATH = base_path / "data" / "gold" / "brewery_warehouse.duckdb"
+SILVER_GLOB = base_path / "data" / "silver" / "breweries_consolidated" / "*.parquet"
+SILVER_VIEW = "silver_breweries"     # view sobre os Parquets da Silver consolidada
+
+
+def create_views(con: duckdb.DuckDBPyConnection, silver_glob: Path = SILVER_GLOB) -> bool:
+    """
+    (Re)cria a view da Silver (só o SQL é gravado; os dados continuam nos Parquets)
+
+    Sem nenhum Parquet no glob a view não é criada (o read_parquet falharia)
+    e uma view existente fica como está.
+
+    Returns:
+        True se a view foi criada
+    """
+    silver_glob = Path(silver_glob)
+    if not glob.glob(str(silver_glob)):
+        logger.warning(f"Nenhum Parquet em {silver_glob}: view {SILVER_VIEW} não criada "
+                       f"(execute a consolidação da Silver primeiro)")
+        return False
+    con.execute(f"CREATE OR REPLACE VIEW {SILVER_VIEW} AS "
+                f"SELECT * FROM read_parquet('{silver_glob.as_posix()}', union_by_name = true)")
+    return True
+
+
+def connect(read_only: bool = False, path: Path = WAREHOUSE_PATH,
+            silver_glob: Path = SILVER_GLOB, require_silver: bool = False) -> duckdb.DuckDBPyConnection:
+    """
+    Abre o warehouse da Gold
+
+    Args:
+        read_only: Abre só para leitura (várias consultas em paralelo);
+            as views precisam ter sido criadas por uma conexão de escrita
+        path: Arquivo do warehouse
+        silver_glob: Glob dos Parquets da Silver consolidada
+        require_silver: Falha se a view silver_breweries não puder ser criada
+
+    Returns:
+        Conexão DuckDB com as views da Silver disponíveis
+
+    Raises:
+        FileNotFoundError: Warehouse inexistente (read_only) ou Silver vazia
+            com require_silver
+    """
+    path = Path(path)
+    if read_only:
+        if not path.exists():
+            raise FileNotFoundError(f"Warehouse não encontrado: {path} (execute modelationgold.py)")
+        return duckdb.connect(str(path), read_only=True)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(str(path))
+    if not create_views(con, silver_glob) and require_silver:
+        con.close()
+        raise FileNotFoundError(f"Nenhum Parquet em {silver_glob}: execute a consolidação "
+                                f"da Silver (python -m silver.union_archive) primeiro")
+    return con
+
+
+def table_exists(con: duckdb.DuckDBPyConnection, table: str) -> bool:
+    """Tabela persistida no warehouse (views e tabelas temporárias não contam)"""
+    return con.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE NOT temporary AND table_name = ?", [table]
+    ).fetchone()[0] > 0
@@ -0,0 +1,169 @@
+# silver/ledger.py
+"""
+Registro (ledger) dos arquivos Bronze já processados pela camada Silver.
+
+Cada arquivo é registrado com caminho, tamanho, mtime, SHA-256 e o resultado
+do processamento. Uma execução Silver consulta o ledger e processa apenas os
+arquivos novos ou alterados; arquivos que ficaram em ``running`` (execução
+interrompida) ou ``failed`` são reprocessados na próxima execução.
+
+Estrutura (SQLite):
+    processed_files(path, size, mtime, sha256, status, rows, part, error, updated_at)
+"""
+import hashlib
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LEDGER_PATH = "data/silver/processed_files.db"
+CHUNK_SIZE = 1024 * 1024
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 do conteúdo de um arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ProcessedFileLedger:
+    """
+    Ledger SQLite de arquivos Bronze processados
+
+    Args:
+        db_path: Caminho do banco SQLite
+    """
+
+    def __init__(self, db_path: str = LEDGER_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS processed_files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                sha256 TEXT NOT NULL,
+                status TEXT NOT NULL,
+                rows INTEGER,
+                part TEXT,
+                error TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "ProcessedFileLedger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return str(Path(path).resolve())
+
+    def get(self, path: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT * FROM processed_files WHERE path = ?", (self._key(path),)).fetchone()
+        return dict(row) if row else None
+
+    def pending(self, files: Iterable[str]) -> List[str]:
+        """
+        Filtra os arquivos que precisam ser processados
+
+        Um arquivo é ignorado quando já está ``done`` com o mesmo tamanho e
+        mtime, ou com o mesmo SHA-256 (arquivo apenas tocado/copiado).
+
+        Returns:
+            Arquivos novos, alterados, com falha ou interrompidos
+        """
+        files = list(files)
+        todo = []
+        for path in files:
+            entry = self.get(path)
+            stat = os.stat(path)
+            if entry is None or entry["status"] != STATUS_DONE:
+                todo.append(path)
+                continue
+            if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                continue
+            if entry["size"] == stat.st_size and entry["sha256"] == file_sha256(path):
+                # Conteúdo igual: só atualiza o mtime para a próxima verificação ser barata
+                self.conn.execute("UPDATE processed_files SET mtime = ? WHERE path = ?",
+                                  (stat.st_mtime, self._key(path)))
+                continue
+            todo.append(path)
+        self.conn.commit()
+        logger.info(f"{len(todo)} de {len(files)} arquivo(s) pendente(s)")
+        return todo
+
+    def mark_running(self, files: Iterable[str]):
+        """
+        Registra o início do processamento com tamanho, mtime e hash atuais
+
+        Permite retomar após uma queda: entradas que ficarem em ``running``
+        voltam como pendentes na próxima execução. A parte anterior continua
+        registrada até o fim do processamento, para que uma parte obsoleta
+        ainda possa ser encontrada (parts_of) depois de uma queda.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        for path in files:
+            stat = os.stat(path)
+            self.conn.execute("""
+                INSERT INTO processed_files (path, size, mtime, sha256, status, rows, part, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, NULL, NULL, NULL, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size = excluded.size, mtime = excluded.mtime, sha256 = excluded.sha256,
+                    status = excluded.status, rows = NULL, error = NULL,
+                    updated_at = excluded.updated_at
+            """, (self._key(path), stat.st_size, stat.st_mtime, file_sha256(path),
+                  STATUS_RUNNING, now))
+        self.conn.commit()
+
+    def _finish(self, path: str, status: str, rows: Optional[int],
+                part: Optional[str], error: Optional[str]):
+        self.conn.execute("""
+            UPDATE processed_files SET status = ?, rows = ?, part = ?, error = ?, updated_at = ?
+            WHERE path = ?
+        """, (status, rows, part, error, datetime.now().isoformat(timespec="seconds"),
+              self._key(path)))
+        self.conn.commit()
+
+    def mark_done(self, path: str, rows: int, part: Optional[str] = None):
+        self._finish(path, STATUS_DONE, rows, part, None)
+
+    def mark_failed(self, path: str, error: str):
+        self._finish(path, STATUS_FAILED, None, None, error)
+
+    def parts_of(self, files: Iterable[str]) -> List[str]:
+        """Partes registradas para os arquivos (ex: de um processamento anterior)"""
+        parts = {entry["part"] for entry in map(self.get, files) if entry and entry["part"]}
+        return sorted(parts)
+
+    def files_in_parts(self, files: Iterable[str], parts: Iterable[str]) -> List[str]:
+        """Arquivos (dentre files) cujos registros foram gravados em alguma das partes"""
+        parts = set(parts)
+        return [path for path in files if (self.get(path) or {}).get("part") in parts]
+
+    def summary(self) -> Dict[str, int]:
+        """Quantidade de arquivos por status"""
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM processed_files GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
@@ -0,0 +1,231 @@
+# silver/parquet_layout.py
+"""
+Layout físico dos Parquets da Silver, ajustado para buscas por cervejaria.
+
+Os dados são ordenados por chaves configuráveis e gravados com row groups de
+tamanho definido e estatísticas min/max. Há dois escritores:
+
+- ``pyarrow``: grava também o page index (column/offset index), que permite
+  pular páginas dentro de um row group, e as ``sorting_columns`` nos
+  metadados dos row groups;
+- ``duckdb``: grava Bloom filters nas colunas de alta cardinalidade (``id``,
+  ``codigo_postal``), que descartam row groups em buscas por igualdade mesmo
+  quando min/max não ajudam. O escritor do pyarrow não grava Bloom filters.
+
+O escritor é escolhido pelo ``LayoutSpec`` (``engine``) e cada um só grava o
+que suporta: com o DuckDB não há page index nem ``sorting_columns``
+(``page_index`` é ignorado). A ordenação dos dados e, portanto, o min/max
+seletivo valem para os dois, pois a tabela é ordenada antes da gravação.
+
+``lookup`` faz a busca pontual: com o DuckDB, usa estatísticas e Bloom
+filters; sem ele, o ``pyarrow.dataset`` descarta row groups pelas
+estatísticas.
+
+Exemplo:
+    from silver.parquet_layout import BREWERY_LAYOUT, lookup, write_table
+
+    write_table(table, "data/silver/breweries.parquet", BREWERY_LAYOUT)
+    lookup("data/silver/breweries.parquet", "id", "10-56-brewing-company-oxnard")
+"""
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+ROW_GROUP_SIZE = 64_000
+BLOOM_FILTER_FPP = 0.01     # taxa de falso positivo dos Bloom filters
+
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    """
+    Como gravar um Parquet da Silver
+
+    Args:
+        sort_by: Colunas de ordenação (as primeiras ganham min/max mais seletivos)
+        row_group_size: Linhas por row group
+        bloom_filter_columns: Colunas com Bloom filter (usa o escritor DuckDB,
+            que não grava page index nem sorting_columns)
+        bloom_filter_fpp: Taxa de falso positivo dos Bloom filters
+        page_index: Grava o page index (só no escritor pyarrow)
+        compression: Codec de compressão
+    """
+    sort_by: Tuple[str, ...] = ()
+    row_group_size: int = ROW_GROUP_SIZE
+    bloom_filter_columns: Tuple[str, ...] = ()
+    bloom_filter_fpp: float = BLOOM_FILTER_FPP
+    page_index: bool = True
+    compression: str = "snappy"
+
+    @property
+    def engine(self) -> str:
+        return "duckdb" if self.bloom_filter_columns else "pyarrow"
+
+
+# Silver de cervejarias: agrupada geograficamente, busca por id e CEP
+BREWERY_LAYOUT = LayoutSpec(
+    sort_by=("country", "estado_provincia", "city", "id"),
+    bloom_filter_columns=("id", "codigo_postal"),
+)
+# Tabela consolidada (buckets por id): ordenada pelo id
+CONSOLIDATED_LAYOUT = LayoutSpec(sort_by=("id",), bloom_filter_columns=("id", "codigo_postal"))
+
+
+def sort_table(table: pa.Table, sort_by: Tuple[str, ...]) -> pa.Table:
+    """Ordena pelas chaves existentes na tabela (chaves ausentes são ignoradas)"""
+    columns = [column for column in sort_by if column in table.column_names]
+    if not columns:
+        return table
+    # O Arrow não ordena colunas com dicionário: as chaves são decodificadas
+    # só para calcular a ordem, e a tabela original (com dicionário) é reordenada
+    keys = pa.table({
+        column: (pc.cast(table[column], table[column].type.value_type)
+                 if pa.types.is_dictionary(table[column].type) else table[column])
+        for column in columns
+    })
+    indices = pc.sort_indices(keys, sort_keys=[(column, "ascending") for column in columns])
+    return table.take(indices)
+
+
+def _sorting_columns(table: pa.Table, sort_by: Tuple[str, ...]) -> Optional[List[pq.SortingColumn]]:
+    keys = tuple((column, "ascending") for column in sort_by if column in table.column_names)
+    if not keys:
+        return None
+    return list(pq.SortingColumn.from_ordering(table.schema, keys))
+
+
+def _write_pyarrow(table: pa.Table, path: Path, spec: LayoutSpec):
+    pq.write_table(
+        table, path,
+        row_group_size=spec.row_group_size,
+        compression=spec.compression,
+        write_statistics=True,
+        write_page_index=spec.page_index,
+        sorting_columns=_sorting_columns(table, spec.sort_by),
+    )
+
+
+def _sql_string(value: str) -> str:
+    """Literal de texto SQL (aspas simples duplicadas)"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _kv_metadata(table: pa.Table) -> str:
+    """Marca de esquema (silver.*) no formato KV_METADATA do COPY do DuckDB"""
+    items = [(k.decode(), v.decode()) for k, v in (table.schema.metadata or {}).items()
+             if k.startswith(b"silver.")]
+    if not items:
+        return ""
+    pairs = ", ".join(f"{_sql_string(k)}: {_sql_string(v)}" for k, v in items)
+    return f",\n                KV_METADATA {{{pairs}}}"
+
+
+def _write_duckdb(table: pa.Table, path: Path, spec: LayoutSpec):
+    import duckdb
+
+    # O DuckDB grava Bloom filter nas colunas com dicionário; o limite precisa
+    # comportar todos os valores distintos de um row group (ex: todos os ids).
+    # Os metadados do esquema Arrow não passam pelo COPY: a marca de versão
+    # (silver.dataset/silver.schema_version) é regravada com KV_METADATA.
+    con = duckdb.connect()
+    try:
+        con.register("silver_layout_input", table)
+        con.execute(f"""
+            COPY (SELECT * FROM silver_layout_input) TO {_sql_string(path.as_posix())} (
+                FORMAT parquet,
+                COMPRESSION {spec.compression},
+                ROW_GROUP_SIZE {spec.row_group_size},
+                DICTIONARY_SIZE_LIMIT {spec.row_group_size},
+                BLOOM_FILTER_FALSE_POSITIVE_RATIO {spec.bloom_filter_fpp}{_kv_metadata(table)}
+            )
+        """)
+    finally:
+        con.close()
+
+
+def write_table(table: pa.Table, path: str, spec: LayoutSpec = BREWERY_LAYOUT) -> Path:
+    """
+    Ordena e grava uma tabela com o layout informado
+
+    A gravação é feita em um arquivo temporário e renomeada no final, então um
+    leitor nunca vê um arquivo pela metade.
+
+    Args:
+        table: Dados a gravar
+        path: Arquivo de destino
+        spec: Layout (ordenação, row groups, page index, Bloom filters)
+
+    Returns:
+        Caminho gravado
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = sort_table(table, spec.sort_by)
+    tmp_path = path.with_name(f"_{path.name}.{os.getpid()}.tmp")
+
+    if spec.engine == "duckdb":
+        _write_duckdb(table, tmp_path, spec)
+    else:
+        _write_pyarrow(table, tmp_path, spec)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _parquet_glob(source: str) -> str:
+    source = Path(source)
+    return (source / "**" / "*.parquet").as_posix() if source.is_dir() else source.as_posix()
+
+
+def lookup(source: str, column: str, value, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Busca pontual (ex: uma cervejaria pelo id ou pelo CEP)
+
+    Com o DuckDB, row groups são descartados por min/max e por Bloom filter;
+    sem ele, o pyarrow.dataset descarta row groups pelas estatísticas.
+
+    Args:
+        source: Arquivo Parquet ou diretório (ex: a tabela consolidada)
+        column: Coluna da busca
+        value: Valor procurado
+        columns: Colunas retornadas (padrão: todas)
+    """
+    try:
+        import duckdb
+    except ImportError:
+        dataset = ds.dataset(source, format="parquet")
+        return dataset.to_table(columns=columns, filter=ds.field(column) == value)
+
+    select = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+    con = duckdb.connect()
+    try:
+        return con.execute(
+            f"""SELECT {select} FROM read_parquet(?, union_by_name = true) WHERE "{column}" = ?""",
+            [_parquet_glob(source), value],
+        ).fetch_arrow_table()
+    finally:
+        con.close()
+
+
+def describe(path: str) -> List[dict]:
+    """Resumo dos row groups (linhas e min/max por coluna) para conferir o layout"""
+    metadata = pq.ParquetFile(path).metadata
+    groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        stats = {}
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            if chunk.statistics is not None and chunk.statistics.has_min_max:
+                stats[chunk.path_in_schema] = (chunk.statistics.min, chunk.statistics.max)
+        groups.append({"row_group": i, "rows": row_group.num_rows, "min_max": stats})
+    return groups
@@ -1,21 +1,31 @@
-import pandas as pd
+# silver/partionamento.py
+"""
+Recarrega o dataset particionado (estado_provincia/city) a partir da tabela
+consolidada e compacta as partições.
 
-# Ler o arquivo consolidado da Silver
-df = pd.read_parquet(r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated.parquet")
+Uso (a partir de ``src/``):
+    python -m silver.partionamento
+"""
+import pyarrow.compute as pc
 
-# 1. Criar coluna de localização (usando os nomes das colunas renomeadas)
-df['localizacao'] = df['city'] + ', ' + df['estado_provincia']
+from silver.partitioned import compact, overwrite_partitions
+from silver.upsert import read_consolidated
 
-# 2. Definir colunas de particionamento (usando os nomes renomeados)
-partition_cols = ['estado_provincia', 'city']  # Ou adicione 'country' se relevante
+# Ler a tabela consolidada da Silver
+consolidated_path = r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated"
 
-# 3. Salvar particionado
+# Saída particionada
 output_path = r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_partitioned"
-df.to_parquet(
-    output_path,
-    partition_cols=partition_cols,
-    engine='pyarrow',
-    compression='snappy'  # Opcional: compressão para economizar espaço
-)
-
-print(f"Dados particionados salvos em: {output_path}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    table = read_consolidated(consolidated_path)
+
+    # 1. Criar coluna de localização (usando os nomes das colunas renomeadas)
+    table = table.append_column(
+        'localizacao', pc.binary_join_element_wise(table['city'], table['estado_provincia'], ', '))
+
+    # 2. Substituir só as partições presentes nos dados e juntar arquivos pequenos
+    overwrite_partitions(table, output_path)
+    compact(output_path)
+
+    print(f"Dados particionados salvos em: {output_path}")
@@ -0,0 +1,200 @@
+# silver/partitioned.py
+"""
+Dataset Silver particionado no estilo Hive (``estado_provincia=.../city=...``).
+
+- ``append``: grava novos registros nas partições corretas sem tocar nos
+  arquivos existentes (cada escrita usa um nome de arquivo único).
+- ``overwrite_partitions``: substitui apenas as partições presentes nos dados
+  (ex: recarga a partir da tabela consolidada).
+- ``compact``: junta os arquivos pequenos de cada partição em um único
+  arquivo, com row groups de tamanho alvo; partições já compactadas (poucos
+  arquivos, todos acima do tamanho alvo) não são regravadas.
+- ``read``: lê com filtros; filtros nas colunas de partição abrem só os
+  diretórios correspondentes.
+
+Exemplo:
+    from silver.partitioned import read
+
+    san_diego = read({"estado_provincia": "California", "city": "San Diego"})
+"""
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+PARTITIONED_DIR = "data/silver/breweries_partitioned"
+PARTITION_COLS = ['estado_provincia', 'city']
+ROW_GROUP_SIZE = 128_000        # linhas por row group após a compactação
+MIN_FILES_TO_COMPACT = 2        # mínimo de arquivos pequenos para compactá-los
+MAX_FILES_PER_PARTITION = 16    # acima disso a partição inteira é compactada
+TARGET_FILE_BYTES = 64 * 1024 * 1024   # arquivos menores contam como pequenos
+
+Filters = Union[Dict[str, object], List[tuple], ds.Expression, None]
+
+
+def _partitioning() -> ds.Partitioning:
+    return ds.partitioning(pa.schema([(c, pa.string()) for c in PARTITION_COLS]), flavor="hive")
+
+
+def _prepare(table: pa.Table) -> pa.Table:
+    """Colunas de partição como texto simples (dictionary/nulos não viram diretórios estranhos)"""
+    for column in PARTITION_COLS:
+        if column not in table.column_names:
+            raise ValueError(f"Coluna de partição ausente: {column}")
+        values = table[column]
+        if pa.types.is_dictionary(values.type):
+            values = pc.cast(values, values.type.value_type)
+        table = table.set_column(table.schema.get_field_index(column), column,
+                                 pc.cast(values, pa.string()))
+    return table
+
+
+def _write(table: pa.Table, base_dir: str, existing_data_behavior: str) -> int:
+    table = _prepare(table)
+    ds.write_dataset(
+        table,
+        base_dir,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior=existing_data_behavior,
+        max_rows_per_group=ROW_GROUP_SIZE,
+        file_options=ds.ParquetFileFormat().make_write_options(compression='snappy'),
+    )
+    return table.num_rows
+
+
+def append(table: pa.Table, base_dir: str = PARTITIONED_DIR) -> int:
+    """
+    Acrescenta registros às partições, sem alterar arquivos existentes
+
+    Returns:
+        Número de linhas gravadas
+    """
+    rows = _write(table, base_dir, "overwrite_or_ignore")
+    logger.info(f"{rows} linha(s) acrescentadas em {base_dir}")
+    return rows
+
+
+def overwrite_partitions(table: pa.Table, base_dir: str = PARTITIONED_DIR) -> int:
+    """
+    Substitui as partições presentes nos dados; as demais ficam intactas
+
+    Returns:
+        Número de linhas gravadas
+    """
+    rows = _write(table, base_dir, "delete_matching")
+    logger.info(f"{rows} linha(s) gravadas em {base_dir} (partições substituídas)")
+    return rows
+
+
+def compact(base_dir: str = PARTITIONED_DIR, row_group_size: int = ROW_GROUP_SIZE,
+            min_files: int = MIN_FILES_TO_COMPACT, max_files: int = MAX_FILES_PER_PARTITION,
+            target_file_bytes: int = TARGET_FILE_BYTES) -> Dict[str, int]:
+    """
+    Junta os arquivos pequenos de cada partição em um único Parquet
+
+    Só são regravados, em cada partição, os arquivos menores que
+    ``target_file_bytes`` (se houver ao menos ``min_files`` deles); com mais
+    de ``max_files`` arquivos a partição inteira é regravada. Partições já
+    compactadas ficam como estão, então rodar ``compact`` de novo é barato.
+
+    O novo arquivo é gravado com nome oculto (``_``), renomeado e só então os
+    arquivos antigos são removidos, então uma leitura concorrente nunca vê a
+    partição vazia.
+
+    Args:
+        base_dir: Raiz do dataset particionado
+        row_group_size: Linhas por row group no arquivo compactado
+        min_files: Mínimo de arquivos pequenos para compactá-los
+        max_files: Acima desse número de arquivos a partição inteira é compactada
+        target_file_bytes: Arquivos menores que isso contam como pequenos
+
+    Returns:
+        Estatísticas (partições compactadas, arquivos antes e depois)
+    """
+    stats = {"partitions": 0, "files_before": 0, "files_after": 0}
+    leaves = {path.parent for path in Path(base_dir).rglob("*.parquet")
+              if not path.name.startswith(("_", "."))}
+
+    for leaf in sorted(leaves):
+        all_files = sorted(p for p in leaf.glob("*.parquet") if not p.name.startswith(("_", ".")))
+        if len(all_files) > max_files:
+            files = all_files
+        else:
+            files = [f for f in all_files if f.stat().st_size < target_file_bytes]
+            if len(files) < min_files:
+                continue
+
+        # ParquetFile lê só o arquivo: pq.read_table inferiria as colunas de
+        # partição pelo caminho e as gravaria dentro do Parquet compactado
+        table = pa.concat_tables([pq.ParquetFile(f).read() for f in files],
+                                 promote_options="permissive")
+        name = f"part-{uuid.uuid4().hex}-0.parquet"
+        tmp_path = leaf / f"_{name}"
+        pq.write_table(table, tmp_path, row_group_size=row_group_size, compression='snappy')
+        os.replace(tmp_path, leaf / name)
+        for f in files:
+            f.unlink()
+
+        stats["partitions"] += 1
+        stats["files_before"] += len(all_files)
+        stats["files_after"] += len(all_files) - len(files) + 1
+
+    logger.info(
+        f"Compactação: {stats['partitions']} partição(ões), "
+        f"{stats['files_before']} -> {stats['files_after']} arquivo(s)"
+    )
+    return stats
+
+
+def _expression(filters: Filters) -> Optional[ds.Expression]:
+    """Converte filtros (dict, lista de tuplas estilo pandas ou Expression) em Expression"""
+    if filters is None or isinstance(filters, ds.Expression):
+        return filters
+    if isinstance(filters, dict):
+        filters = [(column, "=", value) for column, value in filters.items()]
+
+    operators = {
+        "=": lambda f, v: f == v, "==": lambda f, v: f == v, "!=": lambda f, v: f != v,
+        "<": lambda f, v: f < v, "<=": lambda f, v: f <= v,
+        ">": lambda f, v: f > v, ">=": lambda f, v: f >= v,
+        "in": lambda f, v: f.isin(list(v)),
+    }
+    expression = None
+    for column, op, value in filters:
+        term = operators[op](ds.field(column), value)
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def dataset(base_dir: str = PARTITIONED_DIR) -> ds.Dataset:
+    """Dataset particionado (as colunas de partição vêm dos nomes dos diretórios)"""
+    return ds.dataset(base_dir, format="parquet", partitioning=_partitioning())
+
+
+def read(filters: Filters = None, columns: Optional[List[str]] = None,
+         base_dir: str = PARTITIONED_DIR) -> pa.Table:
+    """
+    Lê o dataset aplicando filtros
+
+    Filtros em ``estado_provincia``/``city`` são resolvidos pelos nomes dos
+    diretórios (partition pruning): só os arquivos das partições
+    correspondentes são abertos.
+
+    Args:
+        filters: {'coluna': valor}, [('coluna', '=', valor), ...] ou ds.Expression
+        columns: Colunas a ler (padrão: todas)
+        base_dir: Raiz do dataset particionado
+    """
+    return dataset(base_dir).to_table(columns=columns, filter=_expression(filters))
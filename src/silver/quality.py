@@ -0,0 +1,225 @@
+# silver/quality.py
+"""
+Validação de qualidade dos registros de cervejarias antes da limpeza da Silver.
+
+A limpeza preenche e converte valores (coordenadas nulas viram ``0.0``,
+telefones viram ``'N/A'``), o que esconde dados ruins. Aqui os registros
+ainda com os nomes da Bronze passam por regras vetorizadas
+(``pyarrow.compute``, uma passada por coluna, sem laços em Python por
+linha):
+
+- ``id`` ausente ou duplicado no lote;
+- ``brewery_type`` fora dos tipos conhecidos;
+- latitude/longitude fora dos limites ou zeradas;
+- ``postal_code`` fora do formato do país;
+- ``website_url`` sem esquema http(s) ou domínio.
+
+Valores nulos não são falhas (exceto ``id``). Cada regra tem uma severidade:
+linhas com alguma falha ``error`` vão para a quarentena (um Parquet com a
+coluna ``quality_errors``), e falhas ``warn`` são apenas contadas no
+relatório.
+
+Exemplo:
+    from silver.quality import quarantine, validate
+
+    passed, failed, report = validate(table)
+    quarantine(failed, "data/silver/quarantine/breweries_20250101_120000.parquet")
+"""
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+QUARANTINE_DIR = "quarantine"      # subdiretório de silver_dir
+ERRORS_COLUMN = "quality_errors"
+
+# Tipos de cervejaria aceitos pela Open Brewery DB
+BREWERY_TYPES = [
+    'micro', 'nano', 'regional', 'brewpub', 'large', 'planning',
+    'bar', 'contract', 'proprietor', 'closed', 'taproom', 'location',
+]
+
+# Formato do código postal por país (sem diferenciar maiúsculas)
+POSTAL_PATTERNS = {
+    'united states': r'^\d{5}(-?\d{4})?$',
+    'austria': r'^\d{4}$',
+    'france': r'^\d{5}$',
+    'ireland': r'^([A-Z]\d{2}|D6W)\s?[A-Z0-9]{4}$',     # Eircode, com ou sem espaço
+    'poland': r'^\d{2}-\d{3}$',
+    'portugal': r'^\d{4}-\d{3}$',
+    'singapore': r'^\d{6}$',
+    'south korea': r'^\d{5}$',
+    'england': r'^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$',
+    'scotland': r'^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$',
+    'isle of man': r'^IM\d{1,2}\s?\d[A-Z]{2}$',
+}
+# Textos gerados por conversões (ex: astype(str) em NaN), inválidos em qualquer país;
+# texto vazio equivale a nulo (CEP não informado)
+PLACEHOLDERS = ['nan', 'none', 'null', 'n/a']
+
+URL_PATTERN = r'^https?://[^\s/?#]+\.[^\s/?#]+([/?#]\S*)?$'
+
+# Regra -> severidade ('error' vai para a quarentena, 'warn' só é contada)
+CHECKS = {
+    'id_missing': 'error',
+    'id_duplicate': 'warn',             # a tabela consolidada resolve pelo upsert
+    'brewery_type_invalid': 'error',
+    'latitude_out_of_range': 'error',
+    'longitude_out_of_range': 'error',
+    'coordinates_zero': 'warn',
+    'postal_code_invalid': 'error',
+    'website_url_invalid': 'error',
+}
+
+
+@dataclass
+class QualityReport:
+    """Resultado da validação de uma execução"""
+    rows: int = 0
+    passed: int = 0
+    quarantined: int = 0
+    failures: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CHECKS, 0))
+    seconds: float = 0.0
+    quarantine_paths: List[str] = field(default_factory=list)
+
+    def merge(self, other: "QualityReport") -> "QualityReport":
+        """Soma o relatório de outro lote (ex: outro shard) a este"""
+        self.rows += other.rows
+        self.passed += other.passed
+        self.quarantined += other.quarantined
+        for check, count in other.failures.items():
+            self.failures[check] = self.failures.get(check, 0) + count
+        self.seconds += other.seconds
+        self.quarantine_paths.extend(other.quarantine_paths)
+        return self
+
+    def to_dict(self) -> dict:
+        result = asdict(self)
+        result["seconds"] = round(self.seconds, 3)
+        return result
+
+
+def _present(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Valor informado (não nulo e não vazio)"""
+    if pa.types.is_string(values.type):
+        return pc.and_kleene(pc.is_valid(values), pc.not_equal(pc.utf8_trim_whitespace(values), ''))
+    return pc.is_valid(values)
+
+
+def _duplicates(ids: pa.ChunkedArray) -> pa.Array:
+    """Marca as repetições de um id (a primeira ocorrência não é marcada)"""
+    rows = pc.subtract(pc.cumulative_sum(pa.repeat(pa.scalar(1, pa.int64()), len(ids))), 1)
+    firsts = (pa.table({"id": ids, "row": rows})
+              .group_by("id", use_threads=False)
+              .aggregate([("row", "min")]))
+    is_first = pc.is_in(rows, value_set=firsts["row_min"].combine_chunks())
+    return pc.and_(pc.invert(is_first), pc.is_valid(ids))
+
+
+def _postal_invalid(postal: pa.ChunkedArray, country: pa.ChunkedArray) -> pa.ChunkedArray:
+    postal = pc.utf8_trim_whitespace(postal)
+    postal = pc.if_else(pc.equal(postal, ''), pa.scalar(None, postal.type), postal)
+    country = pc.utf8_lower(pc.utf8_trim_whitespace(country))
+    invalid = pc.is_in(pc.utf8_lower(postal), value_set=pa.array(PLACEHOLDERS))
+    for name, pattern in POSTAL_PATTERNS.items():
+        mismatch = pc.and_(pc.equal(country, name),
+                           pc.invert(pc.match_substring_regex(postal, pattern, ignore_case=True)))
+        invalid = pc.or_(invalid, pc.fill_null(mismatch, False))
+    return pc.and_(invalid, pc.is_valid(postal))
+
+
+def _masks(table: pa.Table) -> Dict[str, pa.ChunkedArray]:
+    """Uma máscara booleana (sem nulos) por regra"""
+    ids = table['id']
+    brewery_type = table['brewery_type']
+    latitude, longitude = table['latitude'], table['longitude']
+    website = table['website_url']
+
+    masks = {
+        'id_missing': pc.invert(_present(ids)),
+        'id_duplicate': _duplicates(ids),
+        'brewery_type_invalid': pc.and_(
+            _present(brewery_type),
+            pc.invert(pc.is_in(pc.utf8_lower(pc.utf8_trim_whitespace(brewery_type)),
+                               value_set=pa.array(BREWERY_TYPES)))),
+        'latitude_out_of_range': pc.or_(pc.less(latitude, -90.0), pc.greater(latitude, 90.0)),
+        'longitude_out_of_range': pc.or_(pc.less(longitude, -180.0), pc.greater(longitude, 180.0)),
+        'coordinates_zero': pc.and_(pc.equal(latitude, 0.0), pc.equal(longitude, 0.0)),
+        'postal_code_invalid': _postal_invalid(table['postal_code'], table['country']),
+        'website_url_invalid': pc.and_(
+            _present(website),
+            pc.invert(pc.match_substring_regex(pc.utf8_trim_whitespace(website), URL_PATTERN,
+                                               ignore_case=True))),
+    }
+    return {check: pc.fill_null(mask, False) for check, mask in masks.items()}
+
+
+def validate(table: pa.Table) -> Tuple[pa.Table, pa.Table, QualityReport]:
+    """
+    Aplica as regras de qualidade a uma tabela no BREWERY_SCHEMA (nomes da Bronze)
+
+    Args:
+        table: Registros lidos da Bronze, antes da limpeza
+
+    Returns:
+        Tupla com (linhas aprovadas, linhas reprovadas com a coluna
+        ``quality_errors``, relatório)
+    """
+    start = time.perf_counter()
+    report = QualityReport(rows=table.num_rows)
+    if table.num_rows == 0:
+        empty = table.append_column(ERRORS_COLUMN, pa.array([], pa.string()))
+        return table, empty, report
+
+    masks = _masks(table)
+    failed = None
+    for check, mask in masks.items():
+        report.failures[check] = pc.sum(mask).as_py() or 0
+        if CHECKS[check] == 'error':
+            failed = mask if failed is None else pc.or_(failed, mask)
+
+    # Nomes das regras violadas por linha, ex: "postal_code_invalid;id_duplicate"
+    # (cada regra vira "nome;" ou "", então o resultado tem uma entrada por linha)
+    names = [pc.if_else(mask, pa.scalar(f"{check};"), pa.scalar(""))
+             for check, mask in masks.items()]
+    errors = pc.utf8_rtrim(pc.binary_join_element_wise(*names, ""), characters=";")
+
+    quarantined = table.append_column(ERRORS_COLUMN, errors).filter(failed)
+    passed = table.filter(pc.invert(failed))
+
+    report.passed = passed.num_rows
+    report.quarantined = quarantined.num_rows
+    report.seconds = time.perf_counter() - start
+    logger.info(
+        f"Qualidade: {report.rows} registro(s), {report.quarantined} em quarentena, "
+        f"{report.seconds:.3f}s " + str({k: v for k, v in report.failures.items() if v})
+    )
+    return passed, quarantined, report
+
+
+def quarantine(failed: pa.Table, path: str) -> Optional[Path]:
+    """Grava as linhas reprovadas (não grava nada se não houver linhas)"""
+    if failed.num_rows == 0:
+        return None
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(failed, path, compression='snappy')
+    logger.warning(f"{failed.num_rows} registro(s) em quarentena -> {path}")
+    return path
+
+
+def write_report(report: QualityReport, path: str):
+    """Grava o relatório de qualidade em JSON"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
@@ -0,0 +1,380 @@
+# silver/schemas.py
+"""
+Registro de esquemas dos datasets da camada Silver, com versionamento.
+
+Cada dataset (``breweries``, ``brewery_counts``...) declara as versões do seu
+esquema. A compatibilidade de um arquivo é verificada só pelo rodapé do
+Parquet (``pq.read_schema``), sem ler os dados, e a leitura de arquivos de
+versões diferentes promove tudo para a versão mais recente: colunas antigas
+são renomeadas, tipos são convertidos e colunas novas ausentes viram nulas.
+
+Escritores que conhecem o registro gravam o dataset e a versão nos metadados
+do esquema (``stamp``); arquivos antigos, sem essa marca, recebem a versão
+mais antiga cujas colunas obrigatórias estão presentes.
+
+Exemplo:
+    from silver.schemas import check_file, read_as
+
+    result = check_file("data/silver/breweries_bycity.parquet", "breweries")
+    if result.ok:
+        table = read_as([result.path], "breweries")
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+DATASET_KEY = b"silver.dataset"
+VERSION_KEY = b"silver.schema_version"
+
+
+class SchemaError(ValueError):
+    """Arquivo incompatível com o esquema declarado do dataset"""
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """
+    Uma versão do esquema de um dataset Silver
+
+    Args:
+        name: Nome do dataset
+        version: Número da versão (maior = mais recente)
+        schema: Colunas e tipos da versão
+        required: Colunas obrigatórias (identificam a versão)
+        renames: Nomes antigos -> nomes atuais, aplicados na leitura
+    """
+    name: str
+    version: int
+    schema: pa.Schema
+    required: FrozenSet[str]
+    renames: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SchemaCheck:
+    """Resultado da verificação de um arquivo contra um dataset"""
+    path: str
+    dataset: str
+    version: Optional[int] = None
+    missing: List[str] = field(default_factory=list)
+    type_errors: List[str] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.version is not None and not self.missing and not self.type_errors
+
+
+REGISTRY: Dict[str, List[DatasetSchema]] = {}
+
+# Nomes da Bronze que a Silver renomeia (arquivos antigos ainda podem tê-los)
+BREWERY_RENAMES = {
+    'brewery_type': 'tipos_cervejaria',
+    'state_province': 'estado_provincia',
+    'postal_code': 'codigo_postal',
+    'website_url': 'site',
+}
+BREWERY_REQUIRED = frozenset({'id', 'name', 'tipos_cervejaria', 'city', 'estado_provincia', 'country'})
+
+_BREWERY_FIELDS_V1 = [
+    ('id', pa.string()),
+    ('name', pa.string()),
+    ('tipos_cervejaria', pa.string()),
+    ('address_1', pa.string()),
+    ('address_2', pa.string()),
+    ('address_3', pa.string()),
+    ('city', pa.string()),
+    ('estado_provincia', pa.string()),
+    ('codigo_postal', pa.string()),
+    ('country', pa.string()),
+    ('longitude', pa.float64()),
+    ('latitude', pa.float64()),
+    ('phone', pa.string()),
+    ('site', pa.string()),
+    ('state', pa.string()),
+    ('street', pa.string()),
+    ('location', pa.string()),
+    ('processed_at', pa.string()),
+]
+
+
+def register(dataset: DatasetSchema):
+    """Registra uma versão de esquema (versões mantidas em ordem crescente)"""
+    versions = REGISTRY.setdefault(dataset.name, [])
+    if any(v.version == dataset.version for v in versions):
+        raise ValueError(f"{dataset.name} v{dataset.version} já registrado")
+    versions.append(dataset)
+    versions.sort(key=lambda v: v.version)
+
+
+def get(name: str, version: Optional[int] = None) -> DatasetSchema:
+    """Esquema de um dataset (por padrão, a versão mais recente)"""
+    if name not in REGISTRY:
+        raise KeyError(f"Dataset não registrado: {name}")
+    versions = REGISTRY[name]
+    if version is None:
+        return versions[-1]
+    for v in versions:
+        if v.version == version:
+            return v
+    raise KeyError(f"{name} não tem a versão {version}")
+
+
+# Cervejarias: v1 = scripts pandas (created_at/updated_at como timestamp)
+register(DatasetSchema(
+    name="breweries", version=1,
+    schema=pa.schema(_BREWERY_FIELDS_V1 + [('created_at', pa.timestamp('ns')),
+                                           ('updated_at', pa.timestamp('ns'))]),
+    required=BREWERY_REQUIRED, renames=BREWERY_RENAMES,
+))
+# v2 = BreweriesSilverTransformer (Arrow: dictionary encoding, datas em texto ISO 8601)
+register(DatasetSchema(
+    name="breweries", version=2,
+    schema=pa.schema(
+        [(n, DICT_STRING if n in ('tipos_cervejaria', 'estado_provincia', 'country') else t)
+         for n, t in _BREWERY_FIELDS_V1]
+        + [('created_at', pa.string()), ('updated_at', pa.string()), ('source_file', pa.string())]
+    ),
+    required=BREWERY_REQUIRED, renames=BREWERY_RENAMES,
+))
+
+# Contagens do endpoint /meta (silver_metadata.py, silver_koreanmetadata.py, silver_micrometadata.py)
+register(DatasetSchema(
+    name="brewery_counts_by_state", version=1,
+    schema=pa.schema([('state', pa.string()), ('brewery_count', pa.int64()),
+                      ('processed_at', pa.string()), ('source_file', pa.string()),
+                      ('total_breweries', pa.float64())]),
+    required=frozenset({'state', 'brewery_count'}),
+))
+register(DatasetSchema(
+    name="brewery_counts_by_type", version=1,
+    schema=pa.schema([('brewery_type', pa.string()), ('count', pa.int64()),
+                      ('processed_at', pa.string()), ('source_file', pa.string()),
+                      ('total_breweries', pa.float64())]),
+    required=frozenset({'brewery_type', 'count'}),
+))
+# Contagens combinadas estado x tipo (entrada de union_states_types.py)
+register(DatasetSchema(
+    name="brewery_counts", version=1,
+    schema=pa.schema([('state', pa.string()), ('brewery_type', pa.string()),
+                      ('brewery_count', pa.int64()), ('processed_at', pa.string()),
+                      ('data_source', pa.string()), ('consolidated_at', pa.string())]),
+    required=frozenset({'state', 'brewery_count', 'brewery_type', 'processed_at'}),
+))
+# Saída de silver_raw2.py (coordenadas aninhadas)
+register(DatasetSchema(
+    name="breweries_processed", version=1,
+    schema=pa.schema([
+        ('id', pa.string()), ('name', pa.string()), ('brewery_type', pa.string()),
+        ('city', pa.string()), ('state', pa.string()), ('country', pa.string()),
+        ('coordinates', pa.struct([('latitude', pa.float64()), ('longitude', pa.float64())])),
+        ('website_url', pa.string()), ('updated_at', pa.string()),
+    ]),
+    required=frozenset({'id', 'coordinates'}),
+))
+
+
+def stamp(table: pa.Table, name: str, version: Optional[int] = None) -> pa.Table:
+    """Grava dataset e versão nos metadados do esquema (lidos depois só do rodapé)"""
+    dataset = get(name, version)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({DATASET_KEY: dataset.name.encode(), VERSION_KEY: str(dataset.version).encode()})
+    return table.replace_schema_metadata(metadata)
+
+
+def stamp_of(schema: pa.Schema) -> Optional[Tuple[str, int]]:
+    """Dataset e versão gravados por ``stamp`` (None em arquivos sem marca)"""
+    metadata = schema.metadata or {}
+    if DATASET_KEY not in metadata or VERSION_KEY not in metadata:
+        return None
+    return metadata[DATASET_KEY].decode(), int(metadata[VERSION_KEY])
+
+
+def _source_names(schema: pa.Schema, dataset: DatasetSchema) -> Dict[str, str]:
+    """Mapeia nome no dataset -> nome no arquivo (sem diferenciar maiúsculas, com renomeações)"""
+    mapping = {}
+    for name in schema.names:
+        target = name.lower()
+        target = dataset.renames.get(target, target)
+        mapping.setdefault(target, name)
+    return mapping
+
+
+def can_cast(source: pa.DataType, target: pa.DataType) -> bool:
+    """Promoções aceitas na leitura de versões antigas"""
+    if source == target or pa.types.is_null(source):
+        return True
+    if pa.types.is_dictionary(source):
+        return can_cast(source.value_type, target)
+    if pa.types.is_dictionary(target):
+        return can_cast(source, target.value_type)
+    if pa.types.is_string(target) or pa.types.is_large_string(target):
+        return (pa.types.is_string(source) or pa.types.is_large_string(source)
+                or pa.types.is_integer(source) or pa.types.is_temporal(source))
+    if pa.types.is_floating(target):
+        return (pa.types.is_floating(source) or pa.types.is_integer(source)
+                or pa.types.is_string(source) or pa.types.is_large_string(source))
+    if pa.types.is_integer(target):
+        return pa.types.is_integer(source) and source.bit_width <= target.bit_width
+    if pa.types.is_timestamp(target):
+        return pa.types.is_timestamp(source)
+    return False
+
+
+def _check_schema(schema: pa.Schema, dataset: DatasetSchema, path: str) -> SchemaCheck:
+    result = SchemaCheck(path=path, dataset=dataset.name, version=dataset.version)
+    names = _source_names(schema, dataset)
+    result.missing = sorted(dataset.required - set(names))
+    for target in dataset.schema:
+        source = names.get(target.name)
+        if source is not None and not can_cast(schema.field(source).type, target.type):
+            result.type_errors.append(f"{target.name}: {schema.field(source).type} -> {target.type}")
+    result.extra = sorted(set(names) - set(dataset.schema.names))
+    return result
+
+
+def check_file(path: str, name: str) -> SchemaCheck:
+    """
+    Verifica um Parquet contra um dataset lendo apenas o rodapé
+
+    Arquivos marcados com ``stamp`` são verificados contra a versão declarada;
+    os demais recebem a versão mais antiga que aceita o arquivo (colunas
+    obrigatórias presentes e tipos compatíveis). Se nenhuma servir, o
+    resultado traz os problemas da versão mais antiga com as colunas
+    obrigatórias presentes ou, sem nenhuma, as colunas que faltam para a
+    versão mais recente.
+    """
+    schema = pq.read_schema(path)
+    versions = REGISTRY[name]
+
+    stamped = stamp_of(schema)
+    if stamped is not None:
+        if stamped[0] != name:
+            return SchemaCheck(path=str(path), dataset=name,
+                               type_errors=[f"arquivo declarado como '{stamped[0]}'"])
+        return _check_schema(schema, get(name, stamped[1]), str(path))
+
+    results = [_check_schema(schema, dataset, str(path)) for dataset in versions]
+    for result in results:
+        if result.ok:
+            return result
+    result = next((r for r in results if not r.missing), results[-1])
+    result.version = None
+    return result
+
+
+def classify(path: str) -> Optional[Tuple[str, int]]:
+    """Identifica o dataset e a versão de um Parquet pelo rodapé (None se nenhum servir)"""
+    for name in REGISTRY:
+        result = check_file(path, name)
+        if result.ok:
+            return name, result.version
+    return None
+
+
+def validate(paths: Iterable[str], name: str) -> Tuple[List[str], List[SchemaCheck]]:
+    """
+    Separa os arquivos compatíveis com um dataset dos incompatíveis
+
+    Returns:
+        Tupla com (caminhos compatíveis, verificações dos incompatíveis)
+    """
+    compatible, rejected = [], []
+    for path in paths:
+        result = check_file(path, name)
+        if result.ok:
+            compatible.append(str(path))
+        else:
+            rejected.append(result)
+            logger.warning(
+                f"{Path(path).name} incompatível com '{name}': faltam {result.missing}, "
+                f"tipos {result.type_errors}")
+    return compatible, rejected
+
+
+def cast_column(column, target: pa.DataType):
+    """Converte uma coluna para o tipo do esquema (promoção de versões antigas)"""
+    source = column.type
+    if source == target:
+        return column
+    if pa.types.is_dictionary(source) and not pa.types.is_dictionary(target):
+        return cast_column(pc.cast(column, source.value_type), target)
+    if pa.types.is_timestamp(source) and pa.types.is_string(target):
+        # Truncado em segundos: o strftime do Arrow escreve as frações das unidades ms/us/ns
+        column = pc.cast(column, pa.timestamp("s", source.tz), safe=False)
+        return pc.strftime(column, format="%Y-%m-%dT%H:%M:%S")
+    if pa.types.is_temporal(source) and pa.types.is_string(target):
+        return pc.strftime(column, format="%Y-%m-%dT%H:%M:%S")
+    if pa.types.is_string(source) and pa.types.is_floating(target):
+        column = pc.if_else(pc.equal(pc.utf8_trim_whitespace(column), ''),
+                            pa.scalar(None, source), column)
+    if pa.types.is_dictionary(target) and not pa.types.is_dictionary(source):
+        return pc.dictionary_encode(cast_column(column, target.value_type))
+    return pc.cast(column, target)
+
+
+def conform(table: pa.Table, name: str, version: Optional[int] = None,
+            keep_extra: bool = False) -> pa.Table:
+    """
+    Converte uma tabela de qualquer versão para o esquema do dataset
+
+    Args:
+        table: Tabela lida de um arquivo do dataset
+        name: Nome do dataset
+        version: Versão de destino (padrão: a mais recente)
+        keep_extra: Mantém colunas que não estão no esquema
+    """
+    dataset = get(name, version)
+    names = _source_names(table.schema, dataset)
+    missing = dataset.required - set(names)
+    if missing:
+        raise SchemaError(f"Colunas obrigatórias ausentes para '{name}': {sorted(missing)}")
+
+    columns, fields = [], []
+    for target in dataset.schema:
+        source = names.get(target.name)
+        if source is None:
+            columns.append(pa.nulls(table.num_rows, target.type))
+        else:
+            columns.append(cast_column(table[source], target.type))
+        fields.append(target)
+
+    if keep_extra:
+        for extra in sorted(set(names) - set(dataset.schema.names)):
+            columns.append(table[names[extra]])
+            fields.append(table.schema.field(names[extra]).with_name(extra))
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+
+def read_as(paths: Iterable[str], name: str, version: Optional[int] = None,
+            keep_extra: bool = False) -> pa.Table:
+    """
+    Lê arquivos de versões diferentes de um dataset como uma única tabela
+
+    Só as colunas conhecidas pelo esquema são lidas do disco (a menos que
+    ``keep_extra`` seja usado).
+
+    Raises:
+        SchemaError: Se algum arquivo não tiver as colunas obrigatórias
+    """
+    dataset = get(name, version)
+    tables = []
+    for path in paths:
+        names = _source_names(pq.read_schema(path), dataset)
+        columns = None if keep_extra else [names[n] for n in dataset.schema.names if n in names]
+        try:
+            tables.append(conform(pq.read_table(path, columns=columns), name, version, keep_extra))
+        except SchemaError as e:
+            raise SchemaError(f"{path}: {e}") from e
+    if not tables:
+        return dataset.schema.empty_table()
+    return pa.concat_tables(tables, promote_options="permissive" if keep_extra else "none")
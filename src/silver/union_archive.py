@@ -1,18 +1,57 @@
+# silver/union_archive.py
+"""
+Consolida os Parquets da camada Silver em ``breweries_consolidated/``.
+
+Em vez de concatenar todos os arquivos (a mesma cervejaria extraída por
+cidade, estado, busca e random aparecia várias vezes), os registros são
+mesclados por ``id`` com ``silver.upsert``: fica a versão mais recente e só
+os buckets afetados são regravados. A leitura é feita em lotes
+(``pyarrow.dataset``), com esquemas unificados entre os arquivos, sem carregar
+a Silver inteira em memória. O ledger da tabela (``_ledger.db``) guarda os
+arquivos já mesclados, que são ignorados nas próximas execuções enquanto não
+mudarem.
+
+Uso (a partir de ``src/``):
+    python -m silver.union_archive
+"""
 import os
-import pandas as pd
 from glob import glob
+from typing import List
+
+from silver.ledger import ProcessedFileLedger
+from silver.schemas import validate
+from silver.upsert import LEDGER_FILE, upsert_files
 
 # Caminho para a pasta Silver (onde estão os Parquets)
 silver_path = r"C:\Users\55349\brewery-data-pipeline\data\silver"
 
-# Listar todos os arquivos .parquet (incluindo subpastas se particionado)
-parquet_files = glob(os.path.join(silver_path, "**/*.parquet"), recursive=True)
+# Tabela consolidada (um Parquet por bucket de id)
+consolidated_path = os.path.join(silver_path, "breweries_consolidated")
+
+# Datasets derivados da própria consolidação (e a quarentena), que não devem ser relidos
+DERIVED = ["breweries_consolidated", "breweries_partitioned", "quarantine"]
+
+
+def list_silver_files(silver_path: str) -> List[str]:
+    """Lista os Parquets da Silver (incluindo subpastas), sem os datasets derivados"""
+    parquet_files = glob(os.path.join(silver_path, "**/*.parquet"), recursive=True)
+    return sorted(
+        f for f in parquet_files
+        if not any(part.startswith(name) for part in os.path.relpath(f, silver_path).split(os.sep)
+                   for name in DERIVED)
+    )
 
-print(f"Arquivos Parquet encontrados: {parquet_files}")
 
-# Listar e ler arquivos
-parquet_files = glob(os.path.join(silver_path, "**/*.parquet"), recursive=True)
-combined_df = pd.concat([pd.read_parquet(f) for f in parquet_files], ignore_index=True)
+if __name__ == "__main__":
+    parquet_files = list_silver_files(silver_path)
+    print(f"Arquivos Parquet encontrados: {len(parquet_files)}")
 
-# Salvar consolidado
-combined_df.to_parquet(os.path.join(silver_path, "breweries_consolidated.parquet"))
\ No newline at end of file
+    # Apenas arquivos compatíveis com o esquema de cervejarias entram (verificação pelo rodapé);
+    # metadados agregados e arquivos quebrados ficam de fora antes de chegar à Gold
+    compatible, rejected = validate(parquet_files, "breweries")
+    print(f"Compatíveis: {len(compatible)} | Ignorados: {len(rejected)}")
+    with ProcessedFileLedger(os.path.join(consolidated_path, LEDGER_FILE)) as ledger:
+        stats = upsert_files(compatible, consolidated_path, ledger=ledger)
+    print(f"Arquivos mesclados: {stats['files']} | Já mesclados: {stats['skipped']}")
+    print(f"Consolidado salvo em: {consolidated_path} "
+          f"({stats['rows_after']} linhas nos {stats['buckets']} bucket(s) regravados)")
@@ -3,6 +3,8 @@ from pathlib import Path
 import os
 import glob
 
+from silver.schemas import check_file, read_as
+
 def consolidate_brewery_data(input_paths, output_path):
     """
     Consolida arquivos de cervejarias com estrutura similar (estado + tipo)
@@ -21,24 +23,19 @@ def consolidate_brewery_data(input_paths, output_path):
         dfs = []
         
         for file_path in existing_files:
-            df = pd.read_parquet(file_path)
-            
-            # Padronizar nomes de colunas (case insensitive)
-            df.columns = df.columns.str.lower()
-            
-            # Verificar se tem as colunas essenciais
-            required_cols = {'state', 'brewery_count', 'brewery_type', 'processed_at'}
-            if not required_cols.issubset(df.columns):
+            # Verificar o esquema pelo rodapé do Parquet, sem carregar o arquivo
+            check = check_file(file_path, "brewery_counts")
+            if not check.ok:
                 print(f"\n⚠️ Arquivo ignorado: {Path(file_path).name}")
-                print("Motivo: Faltam colunas essenciais")
-                print("Colunas encontradas:", df.columns.tolist())
+                print("Motivo: Faltam colunas essenciais ou tipos incompatíveis")
+                print("Colunas faltando:", check.missing, "| Tipos:", check.type_errors)
                 continue
             
-            print(f"\n✅ Arquivo compatível: {Path(file_path).name}")
-            print("Colunas:", df.columns.tolist())
+            print(f"\n✅ Arquivo compatível: {Path(file_path).name} (versão {check.version})")
             
-            # Selecionar apenas as colunas relevantes
-            standardized_df = df[['state', 'brewery_count', 'brewery_type', 'processed_at']].copy()
+            # Ler apenas as colunas do esquema (nomes padronizados e tipos promovidos)
+            table = read_as([file_path], "brewery_counts")
+            standardized_df = table.select(['state', 'brewery_count', 'brewery_type', 'processed_at']).to_pandas()
             
             # Adicionar origem dos dados
             standardized_df['data_source'] = Path(file_path).stem
@@ -0,0 +1,421 @@
+# silver/upsert.py
+"""
+Upsert (merge) da tabela Silver consolidada, com chave no ``id`` da cervejaria.
+
+A tabela consolidada é um diretório com um arquivo Parquet por bucket de
+``hash(id)``:
+
+    data/silver/breweries_consolidated/
+    ├── _metadata.json
+    ├── _ledger.db
+    ├── bucket-00.parquet
+    ├── ...
+    └── bucket-15.parquet
+
+Ao receber novos registros, apenas os buckets que contêm esses IDs são lidos,
+deduplicados (fica a versão mais recente por ``updated_at`` e depois
+``processed_at``, comparados como ``timestamp[us, UTC]`` e não como texto) e
+regravados. A tabela cresce com o número de cervejarias,
+não com o número de extrações.
+
+Para consolidar muitos arquivos (``upsert_files``), os registros são lidos em
+lotes com ``pyarrow.dataset``, roteados para arquivos temporários por bucket e
+mesclados um bucket por vez: a memória usada é a de um bucket, não a da
+Silver inteira. Com um ledger (``silver.ledger``, em ``_ledger.db`` dentro
+da tabela), arquivos já mesclados e inalterados são ignorados.
+
+Antes da mescla, cada lote passa por ``silver.schemas.conform`` do dataset
+(``breweries``): nomes antigos da Bronze (``brewery_type``,
+``state_province``...) viram os nomes atuais e os tipos são promovidos para a
+versão mais recente. Os buckets recebem a marca dessa versão
+(``silver.schemas.stamp``).
+
+Leitura (DuckDB):
+    SELECT * FROM read_parquet('data/silver/breweries_consolidated/*.parquet', union_by_name=true)
+"""
+import json
+import shutil
+import tempfile
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from silver.ledger import ProcessedFileLedger
+from silver.parquet_layout import CONSOLIDATED_LAYOUT, write_table
+from silver.schemas import check_file, conform as conform_dataset, stamp, stamp_of
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+CONSOLIDATED_DIR = "data/silver/breweries_consolidated"
+BUCKETS = 16
+KEY = "id"
+VERSION_COLUMNS = ["updated_at", "processed_at"]   # ordem de prioridade para "mais recente"
+DATASET = "breweries"                               # esquema do registro aplicado às entradas
+METADATA_FILE = "_metadata.json"
+LEDGER_FILE = "_ledger.db"                          # arquivos já mesclados na tabela
+BATCH_SIZE = 64_000                                 # linhas por lote na leitura em streaming
+VERSION_TYPE = pa.timestamp("us", "UTC")            # tipo usado para comparar as colunas de versão
+
+
+def bucket_of(key: str, buckets: int = BUCKETS) -> int:
+    """Bucket estável (independe do processo/execução) de um ID"""
+    return zlib.crc32(key.encode("utf-8")) % buckets
+
+
+def bucket_path(target_dir: Path, bucket: int) -> Path:
+    return Path(target_dir) / f"bucket-{bucket:02d}.parquet"
+
+
+def _normalize(table: pa.Table) -> pa.Table:
+    """
+    Prepara uma tabela para ser unificada com outras
+
+    Colunas dictionary voltam ao tipo dos valores e timestamps (arquivos
+    antigos gerados com ``pd.read_json``) viram texto ISO 8601, o mesmo
+    formato de ``updated_at`` na API, para comparar versões entre arquivos.
+    """
+    for i, field in enumerate(table.schema):
+        if field.name == KEY and not pa.types.is_string(field.type):
+            table = table.set_column(i, field.name, pc.cast(table[field.name], pa.string()))
+        elif pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, pc.cast(table[field.name], field.type.value_type))
+        elif pa.types.is_timestamp(field.type):
+            seconds = pc.cast(table[field.name], pa.timestamp("s", field.type.tz), safe=False)
+            table = table.set_column(i, field.name, pc.strftime(seconds, format="%Y-%m-%dT%H:%M:%S"))
+    return table
+
+
+def concat(tables: List[pa.Table]) -> pa.Table:
+    """Concatena tabelas com esquemas diferentes (colunas ausentes viram nulas)"""
+    tables = [_normalize(t) for t in tables]
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def _normalize_field(field: pa.Field) -> pa.Field:
+    """Tipo que a coluna terá após _normalize (sem ler os dados)"""
+    if field.name == KEY or pa.types.is_timestamp(field.type):
+        return pa.field(field.name, pa.string())
+    if pa.types.is_dictionary(field.type):
+        return pa.field(field.name, field.type.value_type)
+    return pa.field(field.name, field.type)
+
+
+def _to_dataset(table: pa.Table, dataset: Optional[str]) -> pa.Table:
+    """Aplica as renomeações e tipos do registro (None mantém a tabela como está)"""
+    if dataset is None:
+        return table
+    return conform_dataset(table, dataset, keep_extra=True)
+
+
+def unified_schema(paths: Iterable[str], dataset: Optional[str] = None) -> pa.Schema:
+    """
+    Esquema comum a vários Parquets, lido apenas dos rodapés
+
+    Com ``dataset``, cada esquema passa antes pelas renomeações do registro.
+    Colunas de índice do pandas e metadados de esquema são descartados.
+    """
+    schemas = []
+    for path in paths:
+        schema = _to_dataset(pq.read_schema(path).empty_table(), dataset).schema
+        schemas.append(pa.schema([_normalize_field(f) for f in schema
+                                  if not f.name.startswith("__index_level_")]))
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Ajusta a tabela ao esquema (colunas ausentes viram nulas, tipos convertidos)"""
+    table = _normalize(table)
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            column = table[field.name]
+            columns.append(column if column.type == field.type else pc.cast(column, field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def dataset_of(schemas: Iterable[pa.Schema]) -> Optional[str]:
+    """Dataset declarado pelas entradas (None se nenhuma tiver marca ou se divergirem)"""
+    names = {stamped[0] for stamped in map(stamp_of, schemas) if stamped is not None}
+    return names.pop() if len(names) == 1 else None
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Interpreta um texto ISO 8601 (sem fuso = UTC); inválido vira None"""
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def version_timestamps(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Converte uma coluna de versão para ``timestamp[us, UTC]``
+
+    Os arquivos trazem ``updated_at``/``processed_at`` em formatos mistos
+    (``2025-01-01``, ``2025-01-01 10:00:00``, ``2025-01-01T10:00:00.123Z``,
+    com offset ``-03:00``, timestamps do pandas...); comparados como texto,
+    ``"2025-01-01 23:00"`` ficaria antes de ``"2025-01-01T01:00"``. Valores
+    sem fuso são tratados como UTC e valores inválidos viram nulos.
+    """
+    if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+        if getattr(column.type, "tz", None) is None:
+            column = pc.cast(column, pa.timestamp("us"), safe=False)
+            return pc.assume_timezone(column, "UTC")
+        return pc.cast(column, VERSION_TYPE, safe=False)
+    if not pa.types.is_string(column.type) and not pa.types.is_large_string(column.type):
+        return pa.chunked_array([pa.nulls(len(column), VERSION_TYPE)])
+
+    text = pc.utf8_trim_whitespace(column)
+    text = pc.replace_substring_regex(text, pattern=r"^(\d{4}-\d{2}-\d{2})$", replacement=r"\1T00:00:00")
+    has_offset = pc.match_substring_regex(text, pattern=r"(Z|[+-]\d{2}:?\d{2})$")
+    text = pc.if_else(has_offset, text, pc.binary_join_element_wise(text, "Z", ""))
+    try:
+        return pc.cast(text, VERSION_TYPE)
+    except pa.ArrowInvalid:
+        # Algum valor fora do ISO 8601 aceito pelo Arrow: converte valor a valor
+        return pa.chunked_array([pa.array([_parse_iso(v) for v in column.to_pylist()], VERSION_TYPE)])
+
+
+def latest_per_key(table: pa.Table, key: str = KEY) -> pa.Table:
+    """
+    Mantém uma linha por chave: a de maior updated_at e, no empate, maior processed_at
+
+    As colunas de versão são comparadas como ``timestamp[us, UTC]`` (ver
+    version_timestamps); a tabela devolvida mantém os valores originais.
+
+    Args:
+        table: Tabela com a coluna de chave e, opcionalmente, as colunas de versão
+
+    Returns:
+        Tabela deduplicada, ordenada pela chave
+    """
+    if table.num_rows == 0:
+        return table
+    columns = table.column_names
+    sort_keys = [(key, "ascending")]
+    for column in VERSION_COLUMNS:
+        if column in columns:
+            table = table.append_column(f"__version_{column}", version_timestamps(table[column]))
+            sort_keys.append((f"__version_{column}", "descending"))
+    table = table.sort_by(sort_keys, null_placement="at_end").select(columns).combine_chunks()
+
+    keys = table[key]
+    first = pc.not_equal(keys.slice(1), keys.slice(0, table.num_rows - 1))
+    mask = pa.concat_arrays([pa.array([True])] + [chunk for chunk in first.chunks])
+    return table.filter(pc.fill_null(mask, True))
+
+
+def _check_metadata(target_dir: Path, buckets: int):
+    path = target_dir / METADATA_FILE
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        if metadata["buckets"] != buckets or metadata["key"] != KEY:
+            raise ValueError(
+                f"{target_dir} foi criado com {metadata['buckets']} buckets pela chave "
+                f"'{metadata['key']}'; use os mesmos parâmetros")
+        return
+    target_dir.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"key": KEY, "buckets": buckets, "version_columns": VERSION_COLUMNS}, f, indent=2)
+
+
+def _write_atomic(table: pa.Table, path: Path):
+    # Ordenado por id, com Bloom filter: buscas por id/CEP pulam row groups
+    write_table(table, path, CONSOLIDATED_LAYOUT)
+
+
+def _bucket_ids(table: pa.Table, buckets: int) -> pa.Array:
+    return pa.array([bucket_of(str(k), buckets) for k in table[KEY].to_pylist()], pa.int32())
+
+
+def _merge_bucket(target_dir: Path, bucket: int, new_rows: pa.Table,
+                  dataset: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Mescla novos registros em um bucket e o regrava
+
+    Args:
+        dataset: Dataset do registro (o bucket existente é ajustado a ele e
+            recebe a sua marca); None mantém a marca das entradas
+
+    Returns:
+        Tupla com (linhas antes, linhas depois)
+    """
+    path = bucket_path(target_dir, bucket)
+    parts = [new_rows]
+    before = 0
+    if path.exists():
+        existing = _to_dataset(pq.read_table(path), dataset)
+        before = existing.num_rows
+        parts.append(existing)   # em empate de versão, o registro novo vence
+
+    merged = latest_per_key(concat(parts))
+    dataset = dataset or dataset_of(part.schema for part in parts)
+    if dataset is not None:
+        merged = stamp(merged, dataset)
+    _write_atomic(merged, path)
+    return before, merged.num_rows
+
+
+def upsert(tables: Iterable[pa.Table], target_dir: str = CONSOLIDATED_DIR,
+           buckets: int = BUCKETS, dataset: Optional[str] = DATASET) -> Dict[str, int]:
+    """
+    Mescla novos registros na tabela consolidada
+
+    Args:
+        tables: Tabelas Silver com a coluna ``id`` (esquemas podem variar)
+        target_dir: Diretório da tabela consolidada
+        buckets: Número de buckets (fixo após a criação da tabela)
+        dataset: Dataset do registro aplicado às tabelas (None: sem ajuste)
+
+    Returns:
+        Estatísticas: registros recebidos, buckets regravados, linhas antes e depois
+    """
+    target_dir = Path(target_dir)
+    _check_metadata(target_dir, buckets)
+
+    tables = [_to_dataset(t, dataset) for t in tables if t.num_rows]
+    stats = {"input_rows": sum(t.num_rows for t in tables), "buckets": 0, "rows_before": 0, "rows_after": 0}
+    if not tables:
+        return stats
+
+    incoming = concat(tables)
+    incoming = incoming.filter(pc.is_valid(incoming[KEY]))
+    bucket_ids = _bucket_ids(incoming, buckets)
+
+    for bucket in sorted(set(bucket_ids.to_pylist())):
+        before, after = _merge_bucket(target_dir, bucket, incoming.filter(pc.equal(bucket_ids, bucket)),
+                                      dataset)
+        stats["buckets"] += 1
+        stats["rows_before"] += before
+        stats["rows_after"] += after
+
+    logger.info(
+        f"Upsert: {stats['input_rows']} registro(s) recebidos, {stats['buckets']} bucket(s) "
+        f"regravados ({stats['rows_before']} -> {stats['rows_after']} linhas)"
+    )
+    return stats
+
+
+def upsert_files(paths: Iterable[str], target_dir: str = CONSOLIDATED_DIR,
+                 buckets: int = BUCKETS, batch_size: int = BATCH_SIZE,
+                 ledger: Optional[ProcessedFileLedger] = None,
+                 dataset: Optional[str] = DATASET) -> Dict[str, int]:
+    """
+    Mescla vários Parquets na tabela consolidada em memória limitada
+
+    Os arquivos são lidos em lotes com ``pyarrow.dataset``, ajustados ao
+    dataset do registro e a um esquema unificado; cada lote é dividido por bucket e gravado em um
+    ``ParquetWriter`` temporário por bucket. Depois cada bucket é mesclado
+    isoladamente, então o pico de memória é de um bucket, e não da soma dos
+    arquivos.
+
+    Args:
+        paths: Parquets Silver (esquemas e versões podem variar; arquivos sem
+            ``id`` ou incompatíveis com o dataset são ignorados)
+        target_dir: Diretório da tabela consolidada
+        buckets: Número de buckets (fixo após a criação da tabela)
+        batch_size: Linhas por lote de leitura
+        ledger: Ledger dos arquivos já mesclados (ex: ``_ledger.db`` da
+            tabela); arquivos ``done`` e inalterados são ignorados e os
+            demais são marcados ``done`` só depois de todos os buckets
+            regravados
+        dataset: Dataset do registro (renomeações e tipos aplicados a cada
+            lote); None une as colunas como estão nos arquivos
+
+    Returns:
+        Estatísticas: arquivos mesclados e ignorados, registros recebidos,
+        buckets regravados, linhas antes e depois
+    """
+    target_dir = Path(target_dir)
+    _check_metadata(target_dir, buckets)
+    paths = [str(p) for p in paths]
+    stats = {"files": 0, "skipped": 0, "input_rows": 0, "buckets": 0, "rows_before": 0, "rows_after": 0}
+    if ledger is not None:
+        pending = ledger.pending(paths)
+        stats["skipped"] = len(paths) - len(pending)
+        paths = pending
+    schemas = {path: pq.read_schema(path) for path in paths}
+    paths = [path for path in paths if KEY in schemas[path].names]
+    if dataset is not None:
+        checks = {path: check_file(path, dataset) for path in paths}
+        for path, check in checks.items():
+            if not check.ok:
+                logger.warning(f"{path} ignorado: incompatível com '{dataset}' "
+                               f"(faltam {check.missing}, tipos {check.type_errors})")
+        paths = [path for path in paths if checks[path].ok]
+    stats["files"] = len(paths)
+    if not paths:
+        return stats
+
+    schema = unified_schema(paths, dataset)
+    staging_dir = Path(tempfile.mkdtemp(prefix="_staging_", dir=target_dir))
+    writers: Dict[int, pq.ParquetWriter] = {}
+    file_rows = dict.fromkeys(paths, 0)
+    if ledger is not None:
+        ledger.mark_running(paths)
+    try:
+        for path in paths:
+            for batch in ds.dataset(path, format="parquet").to_batches(batch_size=batch_size):
+                table = _conform(_to_dataset(pa.Table.from_batches([batch]), dataset), schema)
+                table = table.filter(pc.is_valid(table[KEY]))
+                if table.num_rows == 0:
+                    continue
+                stats["input_rows"] += table.num_rows
+                file_rows[path] += table.num_rows
+                bucket_ids = _bucket_ids(table, buckets)
+                for bucket in set(bucket_ids.to_pylist()):
+                    if bucket not in writers:
+                        writers[bucket] = pq.ParquetWriter(staging_dir / f"bucket-{bucket:02d}.parquet", schema)
+                    writers[bucket].write_table(table.filter(pc.equal(bucket_ids, bucket)))
+
+        for writer in writers.values():
+            writer.close()
+
+        for bucket in sorted(writers):
+            staged = latest_per_key(pq.read_table(staging_dir / f"bucket-{bucket:02d}.parquet"))
+            before, after = _merge_bucket(target_dir, bucket, staged, dataset)
+            stats["buckets"] += 1
+            stats["rows_before"] += before
+            stats["rows_after"] += after
+    except Exception as e:
+        if ledger is not None:
+            for path in paths:
+                ledger.mark_failed(path, str(e))
+        raise
+    finally:
+        for writer in writers.values():
+            if writer.is_open:
+                writer.close()
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    if ledger is not None:
+        for path in paths:
+            ledger.mark_done(path, file_rows[path], str(target_dir))
+
+    logger.info(
+        f"Upsert de {len(paths)} arquivo(s) ({stats['skipped']} já mesclado(s)): "
+        f"{stats['input_rows']} registro(s), "
+        f"{stats['buckets']} bucket(s) regravados ({stats['rows_before']} -> {stats['rows_after']} linhas)"
+    )
+    return stats
+
+
+def read_consolidated(target_dir: str = CONSOLIDATED_DIR,
+                      columns: Optional[List[str]] = None) -> pa.Table:
+    """Lê a tabela consolidada inteira (todos os buckets)"""
+    paths = sorted(Path(target_dir).glob("bucket-*.parquet"))
+    if not paths:
+        return pa.table({})
+    return concat([pq.read_table(p, columns=columns) for p in paths])
@@ -0,0 +1,4 @@
+# Scripts de verificação manual com nome de teste, não testes do pytest:
+# test_bronze.py chama funções que não importa e os outros dois leem arquivos
+# em caminhos locais fixos (C:\Users\...) já na importação
+collect_ignore = ["test_bronze.py", "test_silver_transformer.py", "test_etlsilver.py"]
@@ -1,8 +1,8 @@
 # silver_to_sqlite.py
-import sqlite3
-import pandas as pd
+from functools import partial
 from glob import glob
-from pathlib import Path
+
+from gold.sqlite_export import export_tables, parquet_reader, table_names
 
 # Configurações
 SILVER_PATH = r"C:\Users\55349\brewery-data-pipeline\data\silver"
@@ -13,23 +13,16 @@ def main():
     parquet_files = glob(f"{SILVER_PATH}/**/*.parquet", recursive=True)
     print(f" Encontrados {len(parquet_files)} arquivos Parquet")
     
-    # 2. Criar conexão com o SQLite
-    conn = sqlite3.connect(DB_PATH)
-    
-    # 3. Processar cada arquivo e criar tabelas no SQLite
-    for file_path in parquet_files:
-        # Extrair nome da tabela do caminho do arquivo
-        table_name = Path(file_path).stem.lower()
-        
-        # Ler arquivo Parquet
-        df = pd.read_parquet(file_path)
-        
-        # Salvar no SQLite (substitui se já existir)
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-        print(f" Tabela '{table_name}' criada com {len(df)} registros")
-    
-    # 4. Fechar conexão e finalizar
-    conn.close()
+    # 2. Um leitor Arrow em lotes por arquivo (tabela = caminho relativo à Silver,
+    #    ex: breweries_parts_part_00000, para partes de pastas diferentes não colidirem)
+    readers = {name: partial(parquet_reader, file_path)
+               for name, file_path in table_names(parquet_files, SILVER_PATH).items()}
+
+    # 3. Gravar todas as tabelas no SQLite em uma única transação (substitui as existentes)
+    stats = export_tables(DB_PATH, readers)
+    for table_name, rows in stats.items():
+        print(f" Tabela '{table_name}' criada com {rows} registros")
+
     print(f"\n Banco de dados criado em: {DB_PATH}")
     print("Você agora pode abrir este arquivo no SQLite para fazer suas consultas e criar a camada Gold.")
 
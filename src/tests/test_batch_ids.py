@@ -0,0 +1,37 @@
+from bronze import batch_ids
+from bronze.writer import iter_records
+from utils import http_client
+from tests.test_http_client import FakeResponse, session  # noqa: F401 (fixture)
+
+
+def test_chunk_ids_respects_count_and_url_limits():
+    assert list(batch_ids.chunk_ids(["a", "b", "", "c"], chunk_size=2)) == [["a", "b"], ["c"]]
+    chunks = list(batch_ids.chunk_ids(["x" * 40] * 5, chunk_size=50, max_url_length=150))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_lookup_keeps_input_order_and_reports_missing(session):
+    session(FakeResponse(200, [{"id": "b"}, {"id": "a"}]))
+    missing = []
+
+    found = list(batch_ids.lookup_breweries(["a", "zz", "b"], missing=missing, use_cache=False))
+
+    assert [brewery["id"] for brewery in found] == ["a", "b"]
+    assert missing == ["zz"]
+
+
+def test_refresh_bypasses_response_cache(session, tmp_path, monkeypatch):
+    http_client.configure_cache(directory=str(tmp_path / "cache"))
+    monkeypatch.setattr(batch_ids, "OUTPUT_DIR", str(tmp_path / "bronze"))
+    ids_path = tmp_path / "ids.txt"
+    ids_path.write_text("a\n", encoding="utf-8")
+    fake = session(FakeResponse(200, [{"id": "a", "name": "Antes"}], headers={"ETag": '"v1"'}),
+                   FakeResponse(200, [{"id": "a", "name": "Depois"}], headers={"ETag": '"v2"'}))
+
+    first = list(iter_records(batch_ids.run_extraction(str(ids_path), compression=None)))
+    second = list(iter_records(batch_ids.run_extraction(str(ids_path), compression=None)))
+
+    assert len(fake.calls) == 2
+    assert "If-None-Match" not in fake.calls[1]["headers"]
+    assert first == [{"id": "a", "name": "Antes"}]
+    assert second == [{"id": "a", "name": "Depois"}]
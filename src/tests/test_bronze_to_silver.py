@@ -0,0 +1,143 @@
+import json
+
+import pyarrow.parquet as pq
+
+from bronze.writer import NDJSONWriter
+from bronze_to_silver import BreweriesSilverTransformer, list_bronze_files
+from silver.ledger import STATUS_DONE, STATUS_FAILED, ProcessedFileLedger
+from silver.quality import QUARANTINE_DIR
+from silver.schemas import stamp_of
+from utils.storage import ObjectStore
+
+
+def _brewery(i, **overrides):
+    record = {
+        'id': f'brewery-{i}', 'name': f'Brewery {i}', 'brewery_type': 'micro',
+        'city': 'Portland', 'state_province': 'Oregon', 'postal_code': '97201',
+        'country': 'United States', 'longitude': -122.6, 'latitude': 45.5,
+        'phone': None, 'website_url': None,
+    }
+    record.update(overrides)
+    return record
+
+
+def _write_json(path, records):
+    path.write_text(json.dumps(records), encoding='utf-8')
+    return path
+
+
+def _write_ndjson(path, records):
+    with NDJSONWriter(path) as writer:
+        writer.write_records(records)
+    return path
+
+
+def test_process_many_in_parallel_with_ledger(tmp_path):
+    bronze = tmp_path / "bronze"
+    bronze.mkdir()
+    _write_json(bronze / "by_city_portland.json", [_brewery(i) for i in range(3)])
+    _write_json(bronze / "by_state_oregon.json", [_brewery(i) for i in range(3, 5)]
+                + [_brewery(99, brewery_type='spaceship')])
+    _write_ndjson(bronze / "search_ipa.ndjson", [_brewery(i) for i in range(5, 9)])
+    broken = bronze / "by_ids_broken.json"
+    broken.write_text("{not json", encoding='utf-8')
+
+    transformer = BreweriesSilverTransformer(str(tmp_path / "silver"))
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        report = transformer.process_many(str(bronze), "breweries_parts", max_workers=2, ledger=ledger)
+
+        assert len(report.parts) == 2
+        parts = [pq.read_table(part) for part in report.parts]
+        assert sum(part.num_rows for part in parts) == 9
+        assert all(stamp_of(part.schema) == ("breweries", 2) for part in parts)
+        assert report.totals["rows"] == 10          # lidos, antes da quarentena
+        assert report.totals["failed"] == 1
+        assert report.quality.quarantined == 1
+        assert len(list((tmp_path / "silver" / QUARANTINE_DIR).rglob("*.parquet"))) == 1
+
+        assert ledger.summary() == {STATUS_DONE: 3, STATUS_FAILED: 1}
+        assert ledger.get(str(broken))["error"]
+        assert ledger.get(str(bronze / "search_ipa.ndjson"))["rows"] == 4
+        assert ledger.get(str(bronze / "search_ipa.ndjson"))["part"] in report.parts
+
+        # Segunda execução: só o arquivo com falha volta a ser processado
+        _write_json(broken, [_brewery(100)])
+        again = transformer.process_many(str(bronze), "breweries_parts", max_workers=2, ledger=ledger)
+
+        assert [f.path for f in again.files] == [str(broken)]
+        assert again.parts == [str(tmp_path / "silver" / "breweries_parts" / "part-00002.parquet")]
+        assert ledger.summary() == {STATUS_DONE: 4}
+
+
+def test_list_bronze_files_requires_ndjson_manifest(tmp_path):
+    complete = _write_ndjson(tmp_path / "breweries_full.ndjson", [_brewery(1)])
+    legacy = _write_json(tmp_path / "by_city_portland.json", [_brewery(2)])
+    # Interrompido antes do manifesto (ex: gravado por uma versão antiga)
+    (tmp_path / "breweries_partial.ndjson").write_text(json.dumps(_brewery(3)) + "\n", encoding='utf-8')
+    (tmp_path / "breweries_crash.ndjson.tmp").write_text("{", encoding='utf-8')
+
+    assert list_bronze_files(str(tmp_path)) == sorted([str(complete), str(legacy)])
+
+
+def test_object_store_runs_are_discovered_through_manifests(tmp_path):
+    store = ObjectStore(str(tmp_path / "store"))
+    first = store.write_manifest("by_city_portland", [_brewery(1), _brewery(2)])
+    second = store.write_manifest("by_state_oregon", [_brewery(2), _brewery(3)])
+
+    assert list_bronze_files(str(tmp_path / "store")) == sorted([str(first), str(second)])
+
+    transformer = BreweriesSilverTransformer(str(tmp_path / "silver"))
+    report = transformer.process_many(str(tmp_path / "store"), "breweries_parts", max_workers=1)
+
+    assert report.totals["rows"] == 4
+    assert sorted(pq.read_table(report.parts[0])["id"].to_pylist()) == [
+        "brewery-1", "brewery-2", "brewery-2", "brewery-3"]
+
+
+def _parts(silver):
+    return sorted(p.name for p in (silver / "breweries_parts").glob("*.parquet"))
+
+
+def _rows(silver):
+    return sorted(pq.ParquetFile(p).read()["id"].to_pylist() for p in (silver / "breweries_parts").glob("*.parquet"))
+
+
+def test_reprocessed_file_replaces_its_previous_part(tmp_path):
+    bronze, silver = tmp_path / "bronze", tmp_path / "silver"
+    bronze.mkdir()
+    portland = _write_json(bronze / "by_city_portland.json", [_brewery(i) for i in range(3)])
+    transformer = BreweriesSilverTransformer(str(silver))
+
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        transformer.process_many(str(bronze), "breweries_parts", max_workers=1, ledger=ledger)
+        _write_json(bronze / "by_city_bend.json", [_brewery(10)])
+        transformer.process_many(str(bronze), "breweries_parts", max_workers=1, ledger=ledger)
+        assert _parts(silver) == ["part-00000.parquet", "part-00001.parquet"]
+
+        _write_json(portland, [_brewery(i) for i in range(2)])
+        report = transformer.process_many(str(bronze), "breweries_parts", max_workers=1, ledger=ledger)
+
+        assert [f.path for f in report.files] == [str(portland)]
+        assert _parts(silver) == ["part-00001.parquet", "part-00002.parquet"]
+        assert sum(len(ids) for ids in _rows(silver)) == 3
+        assert ledger.get(str(portland))["part"].endswith("part-00002.parquet")
+
+
+def test_reprocessing_a_shared_part_brings_its_other_files(tmp_path):
+    bronze, silver = tmp_path / "bronze", tmp_path / "silver"
+    bronze.mkdir()
+    portland = _write_json(bronze / "by_city_portland.json", [_brewery(i) for i in range(3)])
+    bend = _write_json(bronze / "by_city_bend.json", [_brewery(10), _brewery(11)])
+    transformer = BreweriesSilverTransformer(str(silver))
+
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        transformer.process_many(str(bronze), "breweries_parts", max_workers=1, ledger=ledger)
+        assert _parts(silver) == ["part-00000.parquet"]
+
+        _write_json(portland, [_brewery(0)])
+        report = transformer.process_many(str(bronze), "breweries_parts", max_workers=1, ledger=ledger)
+
+        assert sorted(f.path for f in report.files) == sorted([str(portland), str(bend)])
+        assert _parts(silver) == ["part-00001.parquet"]
+        assert _rows(silver) == [["brewery-0", "brewery-10", "brewery-11"]]
+        assert ledger.summary() == {STATUS_DONE: 2}
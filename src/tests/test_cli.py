@@ -0,0 +1,77 @@
+import pytest
+
+from bronze import cli, extractor
+from bronze.writer import iter_records, read_manifest
+from utils import http_client
+from tests.test_http_client import FakeResponse, session  # noqa: F401 (fixture)
+
+JOBS = """
+[settings]
+max_in_flight = 4
+rate_limit = 0
+
+[[jobs]]
+kind = "by_city"
+values = ["austin", "denver"]
+per_page = 2
+
+[[jobs]]
+kind = "meta"
+"""
+
+
+def _api(url, params):
+    if url.endswith("/meta"):
+        return FakeResponse(200, {"total": 2})
+    if params.get("by_city") == "denver":
+        return FakeResponse(500)
+    return FakeResponse(200, [{"id": f"{params['by_city']}-{i}"} for i in range(params["per_page"])])
+
+
+@pytest.fixture
+def job_file(tmp_path, monkeypatch):
+    http_client.configure_cache(enabled=False)
+    for name in ("OUTPUT_DIR", "METADATA_DIR", "AUTOCOMPLETE_DIR"):
+        monkeypatch.setattr(extractor, name, str(tmp_path / name.lower()))
+    path = tmp_path / "jobs.toml"
+    path.write_text(JOBS, encoding="utf-8")
+    return path
+
+
+def test_expand_jobs_one_spec_per_value():
+    specs = cli.expand_jobs([{"kind": "by_city", "values": ["a", "b"]}, {"kind": "meta"}])
+    assert [(s.kind, s.value) for s in specs] == [("by_city", "a"), ("by_city", "b"), ("meta", None)]
+
+    with pytest.raises(ValueError, match="campos desconhecidos"):
+        cli.expand_jobs([{"kind": "by_city", "city": "austin"}])
+
+
+def test_main_runs_jobs_and_writes_summary(session, job_file, tmp_path):
+    fake = session(handler=_api)
+    summary = tmp_path / "last_run.ndjson"
+
+    code = cli.main([str(job_file), "--summary", str(summary)])
+
+    assert code == 1   # a consulta de denver falhou
+    rows = {row["spec"]: row for row in iter_records(summary)}
+    assert set(rows) == {"by_city=austin", "by_city=denver", "meta"}
+    assert rows["by_city=denver"]["error"] and rows["by_city=denver"]["path"] is None
+    assert list(iter_records(rows["by_city=austin"]["path"])) == [{"id": "austin-0"}, {"id": "austin-1"}]
+    assert list(iter_records(rows["meta"]["path"])) == [{"total": 2}]
+    assert read_manifest(summary)["params"]["failed"] == 1
+    assert sum(call["params"].get("by_city") == "denver" for call in fake.calls) == http_client.MAX_RETRIES + 1
+
+
+def test_incremental_queries_use_full_sweep_and_count_failures(session, job_file, monkeypatch):
+    session(handler=_api)
+    job_file.write_text('[[incremental]]\nby_state = "oregon"\n\n[[incremental]]\nby_state = "ohio"\n',
+                        encoding="utf-8")
+    calls = []
+
+    def run_incremental(params, full_sweep=False):
+        calls.append((params, full_sweep))
+        return None if params["by_state"] == "ohio" else {"changed": 0}
+    monkeypatch.setattr(cli, "run_incremental", run_incremental)
+
+    assert cli.main([str(job_file), "--full-sweep"]) == 1
+    assert calls == [({"by_state": "oregon"}, True), ({"by_state": "ohio"}, True)]
@@ -0,0 +1,91 @@
+import asyncio
+import random
+
+import requests
+
+from bronze import crawler
+from bronze.writer import iter_records, read_manifest
+from utils import http_client
+from tests.test_http_client import FakeResponse, session  # noqa: F401 (fixture)
+
+
+def _page(page, per_page=crawler.PER_PAGE):
+    start = (page - 1) * per_page
+    return [{"id": f"b{i}"} for i in range(start, start + per_page)]
+
+
+def _catalog(total, failures=None):
+    """Handler da API: meta com o total e páginas com IDs sequenciais
+
+    ``failures`` mapeia página -> respostas (ou exceções) devolvidas antes da página.
+    """
+    failures = {page: list(responses) for page, responses in (failures or {}).items()}
+
+    def handler(url, params):
+        if url.endswith("/meta"):
+            return FakeResponse(200, {"total": total})
+        if failures.get(params["page"]):
+            return failures[params["page"]].pop(0)
+        body = [b for b in _page(params["page"], params["per_page"]) if int(b["id"][1:]) < total]
+        return FakeResponse(200, body)
+    return handler
+
+
+def test_run_extraction_writes_every_page_once(session, tmp_path, monkeypatch):
+    http_client.configure_cache(enabled=False)
+    monkeypatch.setattr(crawler, "OUTPUT_DIR", str(tmp_path))
+    fake = session(handler=_catalog(450))
+
+    path = crawler.run_extraction(rate_limit=0, compression=None)
+
+    ids = [record["id"] for record in iter_records(path)]
+    assert sorted(ids, key=lambda i: int(i[1:])) == [f"b{i}" for i in range(450)]
+    assert sorted(call["params"]["page"] for call in fake.calls[1:]) == [1, 2, 3]
+    assert all(call["params"]["per_page"] == crawler.PER_PAGE for call in fake.calls[1:])
+    assert read_manifest(path)["params"] == {"per_page": crawler.PER_PAGE, "pages": 3}
+
+
+def test_crawl_pages_drops_records_that_moved_between_pages(session):
+    def handler(url, params):
+        # 'b199' escorregou para a página 2 durante a coleta
+        return FakeResponse(200, _page(1) if params["page"] == 1 else [{"id": "b199"}, {"id": "b200"}])
+    session(handler=handler)
+
+    breweries = asyncio.run(crawler.crawl_pages(2, use_cache=False, limiter=http_client.make_limiter(0)))
+
+    assert len(breweries) == 201 and breweries[-1] == {"id": "b200"}
+
+
+def test_pages_honor_retry_after_and_back_off_on_errors(session, tmp_path, monkeypatch):
+    http_client.configure_cache(enabled=False)
+    monkeypatch.setattr(crawler, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(http_client, "_backoff", lambda attempt: 0.25 * (attempt + 1))
+    sleeps = []
+    monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+    session(handler=_catalog(300, {
+        2: [FakeResponse(429, headers={"Retry-After": "7"}),
+            requests.exceptions.ConnectionError("reset"), FakeResponse(503)],
+    }))
+
+    path = crawler.run_extraction(rate_limit=0, max_in_flight=1, compression=None)
+
+    assert len(list(iter_records(path))) == 300
+    # Retry-After vence o backoff; sem ele, o atraso cresce a cada tentativa
+    assert sleeps == [7.0, 0.5, 0.75]
+
+
+def test_failed_page_leaves_no_partial_file(session, tmp_path, monkeypatch):
+    http_client.configure_cache(enabled=False)
+    monkeypatch.setattr(crawler, "OUTPUT_DIR", str(tmp_path))
+    session(handler=_catalog(300, {2: [FakeResponse(500)] * (http_client.MAX_RETRIES + 1)}))
+
+    assert crawler.run_extraction(rate_limit=0, compression=None) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_backoff_grows_exponentially_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+
+    delays = [http_client._backoff(attempt) for attempt in range(8)]
+
+    assert delays == [0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
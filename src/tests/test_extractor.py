@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from bronze import extractor
+from bronze.extractor import QuerySpec, output_path, run_extraction
+
+
+def test_output_dir_does_not_depend_on_cwd():
+    assert Path(extractor.OUTPUT_DIR).is_absolute()
+    assert Path(extractor.OUTPUT_DIR).parent == extractor.base_path / "data" / "bronze"
+
+
+def test_same_second_queries_get_unique_paths_within_one_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(extractor, "get_json", lambda url, params: [{"id": params["by_city"]}])
+    specs = [QuerySpec("by_city", "austin", name="same"), QuerySpec("by_city", "denver", name="same")]
+
+    results = run_extraction(specs)
+
+    assert all(r.ok for r in results)
+    assert len({r.path for r in results}) == 2
+
+
+def test_reservations_do_not_outlive_the_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor, "OUTPUT_DIR", str(tmp_path))
+    spec = QuerySpec("by_city", "austin")
+    reserved = set()
+
+    first = output_path(spec, "20250101_000000", reserved)
+    second = output_path(spec, "20250101_000000", reserved)
+
+    assert first != second and reserved == {first, second}
+    # Uma nova execução não herda os caminhos reservados (e nunca gravados) da anterior
+    assert output_path(spec, "20250101_000000") == first
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from bronze import geo_tiles
+from bronze.writer import NDJSONWriter, iter_records, read_manifest
+from utils import http_client
+from tests.test_http_client import FakeResponse, session  # noqa: F401 (fixture)
+
+
+def _brewery(brewery_id, lat, lon):
+    return {"id": brewery_id, "latitude": str(lat), "longitude": str(lon)}
+
+
+def _by_dist(breweries):
+    """Handler da API: as per_page cervejarias mais próximas do ponto, como by_dist"""
+    def handler(url, params):
+        lat, lon = (float(v) for v in params["by_dist"].split(","))
+        ordered = sorted(breweries, key=lambda b: geo_tiles.haversine_km(
+            lat, lon, float(b["latitude"]), float(b["longitude"])))
+        return FakeResponse(200, ordered[:params["per_page"]])
+    return handler
+
+
+@pytest.fixture
+def per_page(monkeypatch):
+    http_client.configure_cache(enabled=False)
+    monkeypatch.setattr(geo_tiles, "PER_PAGE", 3)
+    return 3
+
+
+def test_full_cell_is_split_until_every_brewery_is_found(session, per_page, tmp_path, monkeypatch):
+    monkeypatch.setattr(geo_tiles, "OUTPUT_DIR", str(tmp_path))
+    cluster = [_brewery(f"c{i}", 0.2 + 0.05 * i, 0.3) for i in range(5)]
+    breweries = cluster + [_brewery("far", 1.8, 1.8), _brewery("outside", 5.0, 5.0)]
+    fake = session(handler=_by_dist(breweries))
+
+    path = geo_tiles.run_extraction((0.0, 0.0, 2.0, 2.0), compression=None)
+
+    ids = [record["id"] for record in iter_records(path)]
+    assert sorted(ids) == sorted(["far"] + [b["id"] for b in cluster])
+    # Raiz cheia -> 4 quadrantes; só o quadrante do cluster continua sendo dividido
+    centers = [call["params"]["by_dist"] for call in fake.calls]
+    assert centers[0] == "1.0,1.0"
+    assert sorted(centers[1:5]) == ["0.5,0.5", "0.5,1.5", "1.5,0.5", "1.5,1.5"]
+    assert all(float(center.split(",")[0]) < 1 for center in centers[5:])
+    assert read_manifest(path)["record_count"] == 6
+
+
+def test_sparse_region_needs_a_single_request(session, per_page, tmp_path):
+    fake = session(handler=_by_dist([_brewery("a", 0.5, 0.5), _brewery("b", 1.5, 1.5)]))
+
+    with NDJSONWriter(tmp_path / "geo.ndjson") as writer:
+        stats = asyncio.run(geo_tiles.crawl_region((0.0, 0.0, 2.0, 2.0), writer))
+
+    assert stats == {"requests": 1, "cells": 1, "breweries": 2, "truncated": 0}
+    assert len(fake.calls) == 1
+
+
+def test_cells_still_full_at_max_depth_are_reported_as_truncated(session, per_page, tmp_path):
+    # Mais cervejarias no mesmo ponto do que cabem em uma página: nenhuma divisão resolve
+    session(handler=_by_dist([_brewery(f"s{i}", 0.5, 0.5) for i in range(per_page + 1)]))
+
+    with NDJSONWriter(tmp_path / "geo.ndjson") as writer:
+        stats = asyncio.run(geo_tiles.crawl_region((0.0, 0.0, 2.0, 2.0), writer, max_depth=2))
+
+    assert stats["truncated"] >= 1
+    assert stats["breweries"] == per_page
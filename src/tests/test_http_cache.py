@@ -0,0 +1,96 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.http_cache import ResponseCache, endpoint_of, normalize_request
+
+URL = "https://api.openbrewerydb.org/v1/breweries"
+
+
+def _index(directory):
+    path = directory / "index.json"
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def test_normalize_request_sorts_params():
+    assert normalize_request("HTTPS://API.example.com/v1/breweries/?b=2", {"a": 1, "c": None}) == \
+        normalize_request("https://api.example.com/v1/breweries", {"b": "2", "a": "1"})
+    assert endpoint_of(URL + "/meta") == "meta"
+    assert endpoint_of(URL, {"by_ids": "a,b"}) == "by_ids"
+
+
+def test_index_writes_are_batched(tmp_path):
+    cache = ResponseCache(str(tmp_path), flush_every=3)
+    keys = [cache.key_for(URL, {"page": page}) for page in range(3)]
+
+    cache.store(keys[0], URL, b"[1]", {"ETag": '"a"'})
+    cache.read(keys[0])
+    assert _index(tmp_path) == {}
+
+    cache.store(keys[1], URL, b"[2]", {})
+    assert set(_index(tmp_path)) == set(keys[:2])
+
+    cache.store(keys[2], URL, b"[3]", {})
+    assert set(_index(tmp_path)) == set(keys[:2])
+    cache.flush()
+    assert set(_index(tmp_path)) == set(keys)
+
+
+def test_entries_survive_reopen_after_flush(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key_for(URL, {"page": 1})
+    cache.store(key, URL, b"[1]", {"ETag": '"a"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    cache.flush()
+
+    reopened = ResponseCache(str(tmp_path))
+    entry = reopened.lookup(key)
+
+    assert reopened.read(key) == b"[1]"
+    assert reopened.validators(entry) == {
+        "If-None-Match": '"a"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def test_eviction_removes_lru_and_saves_index(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=10)
+    old, new, newest = (cache.key_for(URL, {"page": page}) for page in range(3))
+    cache.store(old, URL, b"12345", {})
+    cache.store(new, URL, b"12345", {})
+    cache.read(old)                     # old passa a ser o mais recente
+
+    cache.store(newest, URL, b"12345", {})
+
+    assert cache.lookup(new) is None
+    assert cache.lookup(old) is not None
+    assert set(_index(tmp_path)) == {old, newest}
+    assert not (tmp_path / f"{new}.body").exists()
+
+
+def test_lookup_drops_entries_without_body(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key_for(URL)
+    cache.store(key, URL, b"[]", {})
+    (tmp_path / f"{key}.body").unlink()
+
+    assert cache.lookup(key) is None
+
+
+def test_read_after_concurrent_eviction_is_a_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key_for(URL)
+    cache.store(key, URL, b"[]", {})
+    assert cache.lookup(key) is not None
+
+    (tmp_path / f"{key}.body").unlink()     # descartado por outra thread
+
+    assert cache.read(key) is None
+
+
+def test_concurrent_stores_of_same_key(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key_for(URL)
+    bodies = [json.dumps([i] * 100).encode() for i in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda body: cache.store(key, URL, body, {}), bodies))
+
+    assert (tmp_path / f"{key}.body").read_bytes() in bodies
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import requests
+
+from utils import http_client
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None, url="https://api.test/v1/breweries"):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.headers = headers or {}
+        self.url = url
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append({"url": url, "params": params, "headers": headers or {}})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class RoutingSession(FakeSession):
+    """Responde conforme URL e parâmetros (requisições concorrentes chegam em qualquer ordem)"""
+
+    def __init__(self, handler):
+        super().__init__([])
+        self.handler = handler
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self._lock:
+            self.calls.append({"url": url, "params": params, "headers": headers or {}})
+            response = self.handler(url, dict(params or {}))
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def install(*responses, handler=None):
+        fake = RoutingSession(handler) if handler is not None else FakeSession(responses)
+        monkeypatch.setattr(http_client, "_session", fake)
+        return fake
+    monkeypatch.setattr(http_client, "_backoff", lambda attempt: 0)
+    monkeypatch.setattr(http_client.time, "sleep", lambda seconds: None)
+    http_client.set_rate_limit(0)
+    yield install
+    http_client.set_rate_limit(http_client.RATE_LIMIT, http_client.BURST)
+    http_client.configure_cache()
+
+
+def test_request_retries_transient_errors(session):
+    fake = session(requests.exceptions.ConnectionError("reset"),
+                   FakeResponse(503, headers={"Retry-After": "1"}),
+                   FakeResponse(200, [{"id": "a"}]))
+
+    response = http_client.request("https://api.test/v1/breweries")
+
+    assert response.json() == [{"id": "a"}]
+    assert len(fake.calls) == 3
+
+
+def test_request_raises_after_max_retries(session):
+    session(FakeResponse(500), FakeResponse(500))
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        http_client.request("https://api.test/v1/breweries", max_retries=1)
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    assert http_client._retry_after(FakeResponse(429, headers={"Retry-After": "3"})) == 3.0
+    past = FakeResponse(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert http_client._retry_after(past) == 0.0
+    assert http_client._retry_after(FakeResponse(429)) is None
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+
+def test_request_uses_the_given_limiter(session):
+    session(FakeResponse(503), FakeResponse(200, []))
+    limiter = CountingLimiter()
+    shared = http_client._bucket
+
+    http_client.request("https://api.test/v1/breweries", limiter=limiter)
+
+    assert limiter.acquired == 2
+    assert http_client._bucket is shared
+
+
+def test_crawl_rate_limit_does_not_replace_shared_limiter(session):
+    from bronze.crawler import crawl_pages
+
+    fake = session(FakeResponse(200, [{"id": "a"}]), FakeResponse(200, [{"id": "b"}, {"id": "a"}]))
+    shared = http_client._bucket
+
+    breweries = asyncio.run(crawl_pages(2, {"by_state": "ohio"}, rate_limit=1000, max_in_flight=1,
+                                        use_cache=False))
+
+    assert [b["id"] for b in breweries] == ["a", "b"]
+    assert [call["params"]["page"] for call in fake.calls] == [1, 2]
+    assert http_client._bucket is shared
+
+
+def test_get_json_revalidates_with_etag(session, tmp_path, monkeypatch):
+    http_client.configure_cache(directory=str(tmp_path))
+    monkeypatch.setattr(http_client.ResponseCache, "is_fresh", staticmethod(lambda entry, ttl: False))
+    url, params = "https://api.test/v1/breweries", {"page": 1}
+    fake = session(FakeResponse(200, [{"id": "a"}], headers={"ETag": '"v1"'}),
+                   FakeResponse(304))
+
+    assert http_client.get_json(url, params) == [{"id": "a"}]
+    assert http_client.get_json(url, params) == [{"id": "a"}]
+    assert fake.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_get_json_serves_fresh_entries_from_cache(session, tmp_path):
+    http_client.configure_cache(directory=str(tmp_path))
+    fake = session(FakeResponse(200, [{"id": "a"}]))
+
+    for _ in range(3):
+        assert http_client.get_json("https://api.test/v1/breweries", {"page": 1}) == [{"id": "a"}]
+    assert len(fake.calls) == 1
+
+
+def test_get_json_refetches_when_body_is_evicted_after_lookup(session, tmp_path, monkeypatch):
+    http_client.configure_cache(directory=str(tmp_path))
+    url, params = "https://api.test/v1/breweries", {"page": 1}
+    fake = session(FakeResponse(200, [{"id": "a"}]), FakeResponse(200, [{"id": "b"}]))
+    assert http_client.get_json(url, params) == [{"id": "a"}]
+
+    cache = http_client.get_cache()
+    lookup = cache.lookup
+
+    def lookup_then_evict(key):
+        entry = lookup(key)
+        cache._body_path(key).unlink()
+        return entry
+    monkeypatch.setattr(cache, "lookup", lookup_then_evict)
+
+    assert http_client.get_json(url, params) == [{"id": "b"}]
+    assert len(fake.calls) == 2
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bronze import incremental
+from bronze.writer import iter_records
+
+
+class FakeAPI:
+    """Catálogo em memória ordenado por updated_at decrescente, como a API"""
+
+    def __init__(self, records):
+        self.records = list(records)
+        self.sweeps = 0
+
+    def get_json(self, url, params=None, use_cache=True):
+        ordered = sorted(self.records, key=lambda r: r["updated_at"], reverse=True)
+        start = (params["page"] - 1) * params["per_page"]
+        return ordered[start:start + params["per_page"]]
+
+    def fetch_total(self, params=None, use_cache=True):
+        return len(self.records)
+
+    async def crawl_pages(self, total_pages, params=None, use_cache=True):
+        self.sweeps += 1
+        return list(self.records)
+
+
+def _brewery(brewery_id, updated_at):
+    return {"id": brewery_id, "name": brewery_id.upper(), "updated_at": updated_at}
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    fake = FakeAPI([_brewery("a", "2025-01-01T00:00:00Z"), _brewery("b", "2025-01-02T00:00:00Z"),
+                    _brewery("c", "2025-01-02T00:00:00Z")])
+    monkeypatch.setattr(incremental, "get_json", fake.get_json)
+    monkeypatch.setattr(incremental, "fetch_total", fake.fetch_total)
+    monkeypatch.setattr(incremental, "crawl_pages", fake.crawl_pages)
+    monkeypatch.setattr(incremental, "OUTPUT_DIR", str(tmp_path / "bronze"))
+    return fake
+
+
+def _run(tmp_path, **kwargs):
+    return incremental.run_incremental({"by_state": "oregon"}, state_path=str(tmp_path / "state.json"), **kwargs)
+
+
+def test_records_at_the_watermark_are_not_emitted_again(api, tmp_path):
+    first = _run(tmp_path)
+    assert first["changed"] == 3 and first["swept"]
+
+    again = _run(tmp_path)
+    assert again["changed"] == 0 and again["delta_path"] is None
+
+    # Novo registro com o mesmo updated_at da marca d'água
+    api.records.append(_brewery("d", "2025-01-02T00:00:00Z"))
+    delta = _run(tmp_path)
+    assert delta["changed"] == 1
+    assert [record["id"] for record in iter_records(delta["delta_path"])] == ["d"]
+    assert _run(tmp_path)["changed"] == 0
+
+
+def test_delete_plus_insert_with_same_total_is_found_by_sweep(api, tmp_path):
+    _run(tmp_path)
+    # 'a' foi excluída e 'x' entrou na consulta sem updated_at novo: o total não muda
+    api.records = [r for r in api.records if r["id"] != "a"] + [_brewery("x", "2024-06-01T00:00:00Z")]
+
+    recent = _run(tmp_path)
+    assert recent["deleted"] == 0 and not recent["swept"]
+
+    forced = _run(tmp_path, full_sweep=True)
+    assert forced["swept"] and forced["deleted"] == 1
+    assert list(iter_records(forced["tombstones_path"])) == ["a"]
+    state = incremental.load_state(str(tmp_path / "state.json"))["by_state=oregon"]
+    assert state["ids"] == ["b", "c", "x"]
+
+
+def test_sweep_runs_when_last_sweep_is_older_than_interval(api, tmp_path):
+    _run(tmp_path)
+    state_path = str(tmp_path / "state.json")
+    state = incremental.load_state(state_path)
+    stale = datetime.now(timezone.utc) - incremental.SWEEP_INTERVAL - timedelta(minutes=1)
+    state["by_state=oregon"]["last_sweep"] = stale.isoformat()
+    incremental.save_state(state, state_path)
+    api.records = [r for r in api.records if r["id"] != "b"] + [_brewery("x", "2024-06-01T00:00:00Z")]
+
+    summary = _run(tmp_path)
+
+    assert summary["swept"] and summary["deleted"] == 1
+    assert api.sweeps == 2
@@ -0,0 +1,68 @@
+import os
+
+from silver.ledger import STATUS_DONE, STATUS_FAILED, STATUS_RUNNING, ProcessedFileLedger
+
+
+def _touch(path, content):
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_pending_tracks_new_changed_and_failed_files(tmp_path):
+    done = _touch(tmp_path / "done.json", "[1]")
+    changed = _touch(tmp_path / "changed.json", "[2]")
+    failed = _touch(tmp_path / "failed.json", "[3]")
+    new = _touch(tmp_path / "new.json", "[4]")
+
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.mark_running([done, changed, failed])
+        ledger.mark_done(done, rows=1, part="part-00000.parquet")
+        ledger.mark_done(changed, rows=1)
+        ledger.mark_failed(failed, "JSON inválido")
+        _touch(tmp_path / "changed.json", "[2, 22]")
+
+        assert ledger.pending([done, changed, failed, new]) == [changed, failed, new]
+        assert ledger.get(done)["part"] == "part-00000.parquet"
+        assert ledger.get(failed)["error"] == "JSON inválido"
+        assert ledger.summary() == {STATUS_DONE: 2, STATUS_FAILED: 1}
+
+
+def test_touched_file_with_same_content_is_not_pending(tmp_path):
+    path = _touch(tmp_path / "a.json", "[1]")
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.mark_running([path])
+        ledger.mark_done(path, rows=1)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 60))
+
+        assert ledger.pending([path]) == []
+        assert ledger.get(path)["mtime"] == stat.st_mtime + 60
+
+
+def test_interrupted_run_is_resumed(tmp_path):
+    path = _touch(tmp_path / "a.json", "[1]")
+    db_path = str(tmp_path / "ledger.db")
+    with ProcessedFileLedger(db_path) as ledger:
+        ledger.mark_running([path])
+
+    with ProcessedFileLedger(db_path) as ledger:
+        assert ledger.get(path)["status"] == STATUS_RUNNING
+        assert ledger.pending([path]) == [path]
+
+
+def test_previous_part_is_kept_until_the_file_finishes(tmp_path):
+    a = _touch(tmp_path / "a.json", "[1]")
+    b = _touch(tmp_path / "b.json", "[2]")
+    c = _touch(tmp_path / "c.json", "[3]")
+    with ProcessedFileLedger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.mark_running([a, b, c])
+        for path in (a, b):
+            ledger.mark_done(path, rows=1, part="part-00000.parquet")
+        ledger.mark_done(c, rows=1, part="part-00001.parquet")
+
+        ledger.mark_running([a])
+
+        assert ledger.parts_of([a]) == ["part-00000.parquet"]
+        assert ledger.files_in_parts([a, b, c], ["part-00000.parquet"]) == [a, b]
+        ledger.mark_done(a, rows=1, part="part-00002.parquet")
+        assert ledger.parts_of([a, b]) == ["part-00000.parquet", "part-00002.parquet"]
@@ -0,0 +1,122 @@
+import duckdb
+import pytest
+
+from gold import modelationgold
+from gold.modelationgold import (
+    DIMENSIONS, ROLLUP_COLUMNS, ROLLUP_TABLE, JoinCardinalityError, merge_fact, stage_silver,
+    update_date_dimension, update_dimension, update_rollup,
+)
+
+
+def _brewery(i, city="Portland", state="Oregon", kind="micro", phone="555"):
+    return (f"b{i}", f"Brewery {i}", city, state, "United States", "97201", -122.6, 45.5, None,
+            kind, None, phone, "2024-01-01", "2024-02-01")
+
+
+@pytest.fixture
+def con(tmp_path, monkeypatch):
+    # Sem Parquets exportados: as tabelas da Gold nascem vazias no warehouse
+    monkeypatch.setattr(modelationgold, "gold_path", tmp_path)
+    con = duckdb.connect()
+    yield con
+    con.close()
+
+
+def _load_silver(con, rows):
+    con.execute("""
+        CREATE OR REPLACE TABLE silver_breweries (
+            id VARCHAR, name VARCHAR, city VARCHAR, estado_provincia VARCHAR, country VARCHAR,
+            codigo_postal VARCHAR, longitude DOUBLE, latitude DOUBLE, location VARCHAR,
+            tipos_cervejaria VARCHAR, site VARCHAR, phone VARCHAR, created_at VARCHAR, updated_at VARCHAR
+        )
+    """)
+    con.executemany(f"INSERT INTO silver_breweries VALUES ({', '.join(['?'] * 14)})", rows)
+
+
+def _run(con, rows):
+    _load_silver(con, rows)
+    stage_silver(con)
+    inserted = {table: update_dimension(con, table, dimension) for table, dimension in DIMENSIONS.items()}
+    update_date_dimension(con)
+    changed = merge_fact(con)
+    update_rollup(con)
+    return inserted, changed
+
+
+def _keys(con, table, key, column):
+    return dict(con.execute(f"SELECT {column}, {key} FROM {table}").fetchall())
+
+
+def _counts(con, key, *grouped):
+    """Contagens do rollup no grouping set das colunas dadas, indexadas por key"""
+    nivel = sum(1 << (len(ROLLUP_COLUMNS) - 1 - i) for i, c in enumerate(ROLLUP_COLUMNS) if c not in grouped)
+    return dict(con.execute(f"SELECT {key}, cervejarias FROM {ROLLUP_TABLE} WHERE nivel = ?", [nivel]).fetchall())
+
+
+def test_surrogate_keys_are_stable_and_only_new_members_are_inserted(con):
+    inserted, changed = _run(con, [_brewery(1), _brewery(2, city="Bend", kind="brewpub")])
+    assert inserted == {"dim_localizacao": 2, "dim_tipo_cervejaria": 2, "dim_status": 1}
+    assert changed == 2
+    cities = _keys(con, "dim_localizacao", "localizacao_id", "cidade")
+    kinds = _keys(con, "dim_tipo_cervejaria", "tipo_id", "tipo")
+
+    inserted, changed = _run(con, [_brewery(1), _brewery(2, city="Bend", kind="brewpub"),
+                                   _brewery(3, city="Austin", state="Texas", kind="micro")])
+
+    assert inserted == {"dim_localizacao": 1, "dim_tipo_cervejaria": 0, "dim_status": 0}
+    assert changed == 1
+    new_cities = _keys(con, "dim_localizacao", "localizacao_id", "cidade")
+    assert {city: new_cities[city] for city in cities} == cities
+    assert new_cities["Austin"] == max(cities.values()) + 1
+    assert _keys(con, "dim_tipo_cervejaria", "tipo_id", "tipo") == kinds
+    fact = dict(con.execute("SELECT id, localizacao_id FROM fato_cervejarias").fetchall())
+    assert fact == {"b1": cities["Portland"], "b2": cities["Bend"], "b3": new_cities["Austin"]}
+
+
+def test_unchanged_rows_are_not_rewritten(con):
+    _run(con, [_brewery(1), _brewery(2)])
+    loaded = con.execute("SELECT id, data_carga FROM fato_cervejarias ORDER BY id").fetchall()
+
+    _, changed = _run(con, [_brewery(1), _brewery(2)])
+
+    assert changed == 0
+    assert con.execute("SELECT id, data_carga FROM fato_cervejarias ORDER BY id").fetchall() == loaded
+
+
+def test_fan_out_join_raises(con):
+    _run(con, [_brewery(1)])
+    # Membro duplicado pela chave natural: a ligação com a fato multiplicaria linhas
+    con.execute("INSERT INTO dim_tipo_cervejaria SELECT tipo_id + 100, tipo, site FROM dim_tipo_cervejaria")
+
+    _load_silver(con, [_brewery(1, phone="N/A")])
+    stage_silver(con)
+    with pytest.raises(JoinCardinalityError, match="dim_tipo_cervejaria"):
+        merge_fact(con)
+
+
+def test_rollup_applies_update_and_delete_deltas(con):
+    _run(con, [_brewery(1), _brewery(2), _brewery(3, city="Bend", kind="brewpub")])
+    assert _counts(con, "cidade", "pais", "estado", "cidade") == {"Portland": 2, "Bend": 1}
+    assert _counts(con, "tipo", "tipo") == {"micro": 2, "brewpub": 1}
+
+    # Atualização: b2 muda de cidade e de tipo
+    _, changed = _run(con, [_brewery(1), _brewery(2, city="Bend", kind="brewpub"),
+                            _brewery(3, city="Bend", kind="brewpub")])
+    assert changed == 1
+    assert _counts(con, "cidade", "pais", "estado", "cidade") == {"Portland": 1, "Bend": 2}
+    assert _counts(con, "tipo", "tipo") == {"micro": 1, "brewpub": 2}
+
+    # Exclusão: b1 sai da Silver; o grupo de Portland zera e é removido
+    _, changed = _run(con, [_brewery(2, city="Bend", kind="brewpub"), _brewery(3, city="Bend", kind="brewpub")])
+    assert changed == 1
+    assert con.execute("SELECT id FROM fato_cervejarias ORDER BY id").fetchall() == [("b2",), ("b3",)]
+    assert _counts(con, "cidade", "pais", "estado", "cidade") == {"Bend": 2}
+    assert _counts(con, "tipo", "tipo") == {"brewpub": 2}
+    assert _counts(con, "'total'") == {"total": 2}
+
+    # O rollup incremental bate com um rollup recalculado do zero
+    incremental = con.execute(f"SELECT * FROM {ROLLUP_TABLE} ORDER BY ALL").fetchall()
+    con.execute(f"DROP TABLE {ROLLUP_TABLE}")
+    update_rollup(con)
+    assert con.execute(f"SELECT * FROM {ROLLUP_TABLE} ORDER BY ALL").fetchall() == incremental
+    assert con.execute(f"SELECT DISTINCT typeof(cervejarias) FROM {ROLLUP_TABLE}").fetchall() == [("BIGINT",)]
@@ -0,0 +1,73 @@
+import dataclasses
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from bronze_to_silver import BreweriesSilverTransformer, conform
+from silver.parquet_layout import BREWERY_LAYOUT, describe, lookup, sort_table, write_table
+from silver.schemas import stamp_of
+
+RECORDS = [
+    {'id': 'd', 'name': 'D', 'city': 'Portland', 'state_province': 'Oregon',
+     'country': 'United States', 'postal_code': '97201'},
+    {'id': 'b', 'name': 'B', 'city': 'Dublin', 'state_province': 'Dublin',
+     'country': 'Ireland', 'postal_code': 'D02 X285'},
+    {'id': 'c', 'name': 'C', 'city': 'Bend', 'state_province': 'Oregon',
+     'country': 'United States', 'postal_code': '97701'},
+    {'id': 'a', 'name': 'A', 'city': 'Portland', 'state_province': 'Oregon',
+     'country': 'United States', 'postal_code': '97209'},
+]
+EXPECTED_ORDER = ['b', 'c', 'a', 'd']
+
+
+def _silver_table():
+    return BreweriesSilverTransformer.clean(conform(pa.Table.from_pylist(RECORDS)))
+
+
+def test_sort_table_handles_dictionary_columns():
+    table = _silver_table()
+    assert pa.types.is_dictionary(table['country'].type)
+
+    result = sort_table(table, BREWERY_LAYOUT.sort_by)
+
+    assert result['id'].to_pylist() == EXPECTED_ORDER
+    assert result.schema == table.schema
+
+
+@pytest.mark.parametrize("spec", [
+    BREWERY_LAYOUT,
+    dataclasses.replace(BREWERY_LAYOUT, bloom_filter_columns=()),
+], ids=["duckdb", "pyarrow"])
+def test_write_table_round_trip_is_sorted(tmp_path, spec):
+    path = write_table(_silver_table(), tmp_path / "breweries.parquet", spec)
+
+    result = pq.read_table(path)
+    assert result['id'].to_pylist() == EXPECTED_ORDER
+    assert stamp_of(result.schema) == stamp_of(_silver_table().schema)
+    assert sum(group["rows"] for group in describe(path)) == len(RECORDS)
+    assert list(tmp_path.iterdir()) == [path]
+    assert lookup(str(path), 'codigo_postal', '97701')['id'].to_pylist() == ['c']
+
+
+@pytest.mark.parametrize("spec, indexed", [
+    (BREWERY_LAYOUT, False),
+    (dataclasses.replace(BREWERY_LAYOUT, bloom_filter_columns=()), True),
+], ids=["duckdb", "pyarrow"])
+def test_page_index_and_sorting_columns_only_with_pyarrow(tmp_path, spec, indexed):
+    path = write_table(_silver_table(), tmp_path / "breweries.parquet", spec)
+
+    row_group = pq.ParquetFile(path).metadata.row_group(0)
+    assert row_group.column(0).has_offset_index is indexed
+    assert bool(row_group.sorting_columns) is indexed
+    assert pq.read_table(path)['id'].to_pylist() == EXPECTED_ORDER
+
+
+def test_duckdb_writer_quotes_path_and_metadata(tmp_path):
+    table = _silver_table()
+    table = table.replace_schema_metadata({**table.schema.metadata, b"silver.note": b"it's fine"})
+
+    path = write_table(table, tmp_path / "o'brien" / "breweries.parquet", BREWERY_LAYOUT)
+
+    assert pq.read_schema(path).metadata[b"silver.note"] == b"it's fine"
+    assert pq.read_table(path)['id'].to_pylist() == EXPECTED_ORDER
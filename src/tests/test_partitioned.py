@@ -0,0 +1,81 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from silver.partitioned import PARTITION_COLS, append, compact, overwrite_partitions, read
+
+
+def _table(ids, state="Oregon", city="Portland"):
+    return pa.table({
+        'id': ids,
+        'nome': [f"Brewery {i}" for i in ids],
+        'estado_provincia': pa.array([state] * len(ids)).dictionary_encode(),
+        'city': [city] * len(ids),
+    })
+
+
+def _ids(table):
+    return sorted(table['id'].to_pylist())
+
+
+def test_append_and_read_with_partition_filter(tmp_path):
+    append(_table(['a', 'b']), str(tmp_path))
+    append(_table(['c'], state="California", city="San Diego"), str(tmp_path))
+
+    assert _ids(read(base_dir=str(tmp_path))) == ['a', 'b', 'c']
+    san_diego = read({"estado_provincia": "California", "city": "San Diego"}, base_dir=str(tmp_path))
+    assert _ids(san_diego) == ['c']
+
+
+def test_overwrite_partitions_keeps_other_partitions(tmp_path):
+    append(_table(['a', 'b']), str(tmp_path))
+    append(_table(['c'], state="California", city="San Diego"), str(tmp_path))
+
+    overwrite_partitions(_table(['x']), str(tmp_path))
+
+    assert _ids(read(base_dir=str(tmp_path))) == ['c', 'x']
+
+
+def test_write_compact_read_round_trip(tmp_path):
+    for ids in (['a'], ['b'], ['c']):
+        append(_table(ids), str(tmp_path))
+    append(_table(['d'], state="California", city="San Diego"), str(tmp_path))
+
+    stats = compact(str(tmp_path))
+
+    assert stats == {"partitions": 1, "files_before": 3, "files_after": 1}
+    files = list(tmp_path.rglob("*.parquet"))
+    assert len(files) == 2
+    for f in files:
+        assert not set(PARTITION_COLS) & set(pq.ParquetFile(f).schema_arrow.names)
+
+    result = read(base_dir=str(tmp_path))
+    assert _ids(result) == ['a', 'b', 'c', 'd']
+    portland = read([("city", "=", "Portland")], columns=["id", "estado_provincia"], base_dir=str(tmp_path))
+    assert _ids(portland) == ['a', 'b', 'c']
+    assert set(portland['estado_provincia'].to_pylist()) == {"Oregon"}
+
+
+def test_compact_skips_partitions_without_small_files(tmp_path):
+    for ids in (['a'], ['b']):
+        append(_table(ids), str(tmp_path))
+    before = sorted(tmp_path.rglob("*.parquet"))
+
+    assert compact(str(tmp_path), target_file_bytes=1)["partitions"] == 0
+    assert sorted(tmp_path.rglob("*.parquet")) == before
+
+    stats = compact(str(tmp_path), target_file_bytes=1, max_files=1)
+    assert stats == {"partitions": 1, "files_before": 2, "files_after": 1}
+
+
+def test_compact_rewrites_only_small_files(tmp_path):
+    append(_table([f"big-{i}" for i in range(2000)]), str(tmp_path))
+    big = next(tmp_path.rglob("*.parquet"))
+    for ids in (['a'], ['b']):
+        append(_table(ids), str(tmp_path))
+
+    stats = compact(str(tmp_path), target_file_bytes=big.stat().st_size)
+
+    assert stats == {"partitions": 1, "files_before": 3, "files_after": 2}
+    assert big.exists()
+    assert len(_ids(read(base_dir=str(tmp_path)))) == 2002
+    assert compact(str(tmp_path), target_file_bytes=big.stat().st_size)["partitions"] == 0
@@ -0,0 +1,86 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bronze_to_silver import conform
+from silver.quality import ERRORS_COLUMN, quarantine, validate
+
+
+def _record(**overrides):
+    record = {
+        'id': 'stone-brewing-escondido',
+        'name': 'Stone Brewing',
+        'brewery_type': 'regional',
+        'city': 'Escondido',
+        'state_province': 'California',
+        'postal_code': '92029-1234',
+        'country': 'United States',
+        'longitude': -117.12,
+        'latitude': 33.11,
+        'phone': '7604947000',
+        'website_url': 'https://www.stonebrewing.com',
+    }
+    record.update(overrides)
+    return record
+
+
+def _table(records):
+    return conform(pa.Table.from_pylist(records))
+
+
+def test_validate_splits_valid_and_invalid_rows():
+    table = _table([
+        _record(),
+        _record(id='nulls-are-not-failures', brewery_type=None, postal_code=None,
+                website_url=None, latitude=None, longitude=None),
+        _record(id='empty-postal', postal_code='  '),
+        _record(id='bad-type', brewery_type='spaceship'),
+        _record(id='bad-postal', postal_code='nan'),
+        _record(id='bad-url-and-coords', website_url='stonebrewing', latitude=123.0),
+        _record(id=None),
+        _record(),   # id repetido: só aviso
+    ])
+
+    passed, failed, report = validate(table)
+
+    assert passed.num_rows + failed.num_rows == table.num_rows
+    assert passed['id'].to_pylist() == [
+        'stone-brewing-escondido', 'nulls-are-not-failures', 'empty-postal', 'stone-brewing-escondido']
+    errors = dict(zip(failed['id'].to_pylist(), failed[ERRORS_COLUMN].to_pylist()))
+    assert errors == {
+        'bad-type': 'brewery_type_invalid',
+        'bad-postal': 'postal_code_invalid',
+        'bad-url-and-coords': 'latitude_out_of_range;website_url_invalid',
+        None: 'id_missing',
+    }
+    assert report.quarantined == 4
+    assert report.passed == 4
+    assert report.failures['id_duplicate'] == 1
+
+
+def test_ireland_eircode_with_or_without_space():
+    table = _table([
+        _record(id=code, country='Ireland', postal_code=code)
+        for code in ['D02 X285', 'D02X285', 'd6w 1234', 'T12 AB34', 'D02-X285', '12345']
+    ])
+
+    passed, failed, _ = validate(table)
+
+    assert passed['id'].to_pylist() == ['D02 X285', 'D02X285', 'd6w 1234', 'T12 AB34']
+    assert failed['id'].to_pylist() == ['D02-X285', '12345']
+
+
+def test_validate_clean_table_quarantines_nothing(tmp_path):
+    passed, failed, report = validate(_table([_record(), _record(id='other')]))
+
+    assert passed.num_rows == 2
+    assert failed.num_rows == 0
+    assert failed.column_names[-1] == ERRORS_COLUMN
+    assert quarantine(failed, tmp_path / "q.parquet") is None
+
+
+def test_quarantine_writes_failed_rows(tmp_path):
+    _, failed, _ = validate(_table([_record(), _record(id='bad', brewery_type='x')]))
+
+    path = quarantine(failed, tmp_path / "quarantine" / "run.parquet")
+
+    assert pq.read_table(path)[ERRORS_COLUMN].to_pylist() == ['brewery_type_invalid']
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from silver.schemas import (DatasetSchema, SchemaError, can_cast, check_file, classify, conform, get,
+                            read_as, register, stamp, stamp_of, validate)
+
+
+def _legacy(updated_at):
+    """Arquivo sem marca, com os nomes da Bronze (como os scripts pandas gravavam)"""
+    return pa.table({
+        'id': ['a'], 'name': ['A'], 'brewery_type': ['micro'], 'city': ['Portland'],
+        'state_province': ['Oregon'], 'country': ['United States'], 'updated_at': updated_at,
+    })
+
+
+def _write(path, table):
+    pq.write_table(table, path)
+    return str(path)
+
+
+def test_get_returns_latest_or_requested_version():
+    assert get("breweries").version == 2
+    assert get("breweries", 1).version == 1
+    with pytest.raises(KeyError):
+        get("breweries", 99)
+    with pytest.raises(KeyError):
+        get("unknown")
+
+
+def test_register_rejects_duplicate_versions():
+    with pytest.raises(ValueError):
+        register(DatasetSchema("breweries", 1, pa.schema([]), frozenset()))
+
+
+def test_stamp_round_trip():
+    table = stamp(pa.table({'id': ['a']}), "breweries")
+
+    assert stamp_of(table.schema) == ("breweries", 2)
+    assert stamp_of(pa.schema([])) is None
+
+
+def test_unstamped_files_get_the_oldest_matching_version(tmp_path):
+    v1 = _write(tmp_path / "v1.parquet", _legacy(pa.array([datetime(2024, 1, 1)], pa.timestamp('ns'))))
+    v2 = _write(tmp_path / "v2.parquet", _legacy(['2024-01-01T00:00:00']))
+
+    assert check_file(v1, "breweries").version == 1
+    result = check_file(v2, "breweries")
+    assert result.ok and result.version == 2
+    assert classify(v2) == ("breweries", 2)
+
+
+def test_incompatible_files_report_the_problem(tmp_path):
+    bad_type = _write(tmp_path / "bad_type.parquet", _legacy([1.5]))
+    missing = _write(tmp_path / "missing.parquet", pa.table({'id': ['a']}))
+
+    result = check_file(bad_type, "breweries")
+    assert not result.ok and result.version is None
+    assert result.type_errors == ["updated_at: double -> timestamp[ns]"]
+    assert check_file(missing, "breweries").missing == sorted(
+        {'name', 'tipos_cervejaria', 'city', 'estado_provincia', 'country'})
+
+    compatible, rejected = validate([bad_type, missing], "breweries")
+    assert compatible == [] and [r.path for r in rejected] == [bad_type, missing]
+
+
+def test_stamped_file_is_checked_against_its_declared_dataset(tmp_path):
+    path = _write(tmp_path / "counts.parquet",
+                  stamp(pa.table({'state': ['Oregon'], 'brewery_count': [3]}), "brewery_counts_by_state"))
+
+    assert check_file(path, "brewery_counts_by_state").ok
+    assert check_file(path, "breweries").type_errors == ["arquivo declarado como 'brewery_counts_by_state'"]
+
+
+def test_conform_applies_renames_and_types():
+    table = conform(_legacy(pa.array([datetime(2024, 1, 1, 12, 30)], pa.timestamp('ns'))), "breweries")
+
+    assert table.schema == get("breweries").schema
+    assert table['tipos_cervejaria'].to_pylist() == ['micro']
+    assert table['estado_provincia'].to_pylist() == ['Oregon']
+    assert table['updated_at'].to_pylist() == ['2024-01-01T12:30:00']
+    assert table['site'].null_count == 1
+    with pytest.raises(SchemaError):
+        conform(pa.table({'id': ['a']}), "breweries")
+
+
+def test_read_as_promotes_mixed_versions(tmp_path):
+    v1 = _write(tmp_path / "v1.parquet", _legacy(pa.array([datetime(2024, 1, 1)], pa.timestamp('ns'))))
+    v2 = _write(tmp_path / "v2.parquet", stamp(conform(_legacy(['2025-01-01T00:00:00']), "breweries"),
+                                               "breweries"))
+
+    table = read_as([v1, v2], "breweries")
+
+    assert table.num_rows == 2
+    assert table['updated_at'].to_pylist() == ['2024-01-01T00:00:00', '2025-01-01T00:00:00']
+
+
+def test_can_cast_promotions():
+    assert can_cast(pa.int32(), pa.int64())
+    assert not can_cast(pa.int64(), pa.int32())
+    assert can_cast(pa.string(), pa.float64())
+    assert can_cast(pa.timestamp('ns'), pa.string())
+    assert not can_cast(pa.string(), pa.timestamp('ns'))
+    assert can_cast(pa.dictionary(pa.int32(), pa.string()), pa.string())
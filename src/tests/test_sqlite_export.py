@@ -0,0 +1,91 @@
+import sqlite3
+from datetime import datetime
+from functools import partial
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from gold.sqlite_export import duckdb_reader, export_tables, parquet_reader, sqlite_type, table_names
+
+
+def _rows(db_path, sql):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def test_sqlite_type_affinity():
+    assert sqlite_type(pa.dictionary(pa.int32(), pa.string())) == "TEXT"
+    assert sqlite_type(pa.int64()) == "INTEGER"
+    assert sqlite_type(pa.bool_()) == "INTEGER"
+    assert sqlite_type(pa.float64()) == "REAL"
+    assert sqlite_type(pa.decimal128(38, 0)) == "INTEGER"
+    assert sqlite_type(pa.decimal128(10, 2)) == "REAL"
+    assert sqlite_type(pa.timestamp("us")) == "TEXT"
+
+
+def test_duckdb_hugeint_sums_export_as_integers(tmp_path):
+    db_path = str(tmp_path / "gold.db")
+    con = duckdb.connect()
+    con.execute("CREATE TABLE agg AS SELECT 'OR' AS estado, SUM(x) AS total FROM range(4) t(x)")
+
+    export_tables(db_path, {"agg": partial(duckdb_reader, con, "agg")})
+
+    assert _rows(db_path, "SELECT type FROM pragma_table_info('agg') WHERE name = 'total'") == [("INTEGER",)]
+    assert _rows(db_path, "SELECT total, typeof(total) FROM agg") == [(6, "integer")]
+    con.close()
+
+
+def test_export_converts_columns_and_creates_indexes(tmp_path):
+    db_path = str(tmp_path / "gold.db")
+    table = pa.table({
+        'id': [1, 2],
+        'estado': pa.array(['Oregon', 'Ohio']).dictionary_encode(),
+        'ativo': [True, False],
+        'criado_em': pa.array([datetime(2025, 1, 1), None], pa.timestamp('us')),
+        'tags': [['ipa'], None],
+    })
+
+    stats = export_tables(db_path, {"dim": table}, indexes={"dim": ["id", "estado, ativo"]})
+
+    assert stats == {"dim": 2}
+    assert _rows(db_path, "SELECT * FROM dim ORDER BY id") == [
+        (1, 'Oregon', 1, '2025-01-01 00:00:00.000000', '["ipa"]'),
+        (2, 'Ohio', 0, None, None),
+    ]
+    indexes = {name for (name,) in _rows(db_path, "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert indexes == {"idx_dim_id", "idx_dim_estado_ativo"}
+
+
+def test_export_replaces_tables_from_lazy_readers(tmp_path):
+    db_path = str(tmp_path / "gold.db")
+    con = duckdb.connect()
+    con.execute("CREATE TABLE a AS SELECT range AS id FROM range(5)")
+    con.execute("CREATE TABLE b AS SELECT range AS id FROM range(3)")
+    pq.write_table(pa.table({'id': [7]}), tmp_path / "c.parquet")
+    export_tables(db_path, {"a": pa.table({'old': [1]})})
+
+    stats = export_tables(db_path, {
+        "a": partial(duckdb_reader, con, "a", 2),
+        "b": partial(duckdb_reader, con, "b"),
+        "c": partial(parquet_reader, str(tmp_path / "c.parquet")),
+    })
+
+    assert stats == {"a": 5, "b": 3, "c": 1}
+    assert _rows(db_path, "SELECT SUM(id) FROM a") == [(10,)]
+    assert [column[1] for column in _rows(db_path, "PRAGMA table_info(a)")] == ["id"]   # tabela antiga substituída
+
+
+def test_table_names_use_relative_path_and_resolve_collisions(tmp_path):
+    root = tmp_path / "silver"
+    paths = [str(root / "parts_a" / "part-00000.parquet"), str(root / "parts_b" / "part-00000.parquet"),
+             str(root / "a-b.parquet"), str(root / "a_b.parquet")]
+
+    names = table_names(paths, str(root))
+
+    assert names == {
+        "parts_a_part_00000": paths[0],
+        "parts_b_part_00000": paths[1],
+        "a_b": paths[2],
+        "a_b_2": paths[3],
+    }
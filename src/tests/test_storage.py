@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.storage import ObjectStore, hash_record, store_of_manifest
+
+RECORD = {"id": "a", "name": "Brewery A", "city": "Portland"}
+
+
+def test_put_is_content_addressed(tmp_path):
+    store = ObjectStore(str(tmp_path))
+
+    digest, created = store.put(RECORD)
+    again, created_again = store.put(dict(reversed(list(RECORD.items()))))
+
+    assert (digest, created) == (hash_record(RECORD), True)
+    assert (again, created_again) == (digest, False)
+    assert store.get(digest) == RECORD
+
+
+def test_concurrent_puts_of_same_object(tmp_path):
+    store = ObjectStore(str(tmp_path))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: store.put(RECORD), range(64)))
+
+    assert {digest for digest, _ in results} == {hash_record(RECORD)}
+    assert store.get(hash_record(RECORD)) == RECORD
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_concurrent_manifests_get_unique_names(tmp_path):
+    store = ObjectStore(str(tmp_path))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = list(pool.map(lambda i: store.write_manifest("by_city", [RECORD, {"id": i}]), range(16)))
+
+    assert len(set(paths)) == 16
+    manifests = [store.read_manifest(path) for path in paths]
+    assert sorted(m["objects"][1] for m in manifests) == sorted(hash_record({"id": i}) for i in range(16))
+    assert 17 <= sum(m["new_count"] for m in manifests) <= 32
+
+
+def test_iter_records_only_new(tmp_path):
+    store = ObjectStore(str(tmp_path))
+    store.write_manifest("by_city", [RECORD])
+    path = store.write_manifest("by_city", [RECORD, {"id": "b"}])
+
+    manifest = store.read_manifest(path)
+
+    assert store.latest_manifest("by_city") == path
+    assert list(store.iter_records(manifest, only_new=True)) == [{"id": "b"}]
+    assert store.known_hashes([manifest]) == {hash_record(RECORD), hash_record({"id": "b"})}
+
+
+def test_latest_manifest_matches_exact_run_and_sorts_by_timestamp(tmp_path):
+    store = ObjectStore(str(tmp_path))
+    for name in ["by_city_20250101_090000.json", "by_city_20250101_090000_2.json",
+                 "by_city_20250101_090000_10.json", "by_city_san_diego_20250202_120000.json",
+                 "by_city_notes.json"]:
+        (store.manifests_dir / name).write_text("{}", encoding="utf-8")
+
+    assert store.latest_manifest("by_city").name == "by_city_20250101_090000_10.json"
+    assert store.latest_manifest("by_city_san_diego").name == "by_city_san_diego_20250202_120000.json"
+    assert store.latest_manifest("by_state") is None
+    assert [p.name for p in store.manifests()][-1] == "by_city_san_diego_20250202_120000.json"
+
+
+def test_store_of_manifest(tmp_path):
+    store = ObjectStore(str(tmp_path / "store"))
+    path = store.write_manifest("by_city", [RECORD])
+
+    assert store_of_manifest(path).root == store.root
+    assert store_of_manifest(tmp_path / "by_city.json") is None
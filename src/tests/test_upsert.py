@@ -0,0 +1,127 @@
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from silver.ledger import STATUS_DONE, ProcessedFileLedger
+from silver.schemas import check_file, stamp, stamp_of
+from silver.upsert import (LEDGER_FILE, bucket_of, latest_per_key, read_consolidated, upsert,
+                           upsert_files)
+
+
+def _breweries(rows, processed_at="2025-01-01 00:00:00"):
+    table = pa.table({
+        'id': [r[0] for r in rows],
+        'name': [r[1] for r in rows],
+        'tipos_cervejaria': pa.array(['micro'] * len(rows)).dictionary_encode(),
+        'city': ['Portland'] * len(rows),
+        'estado_provincia': pa.array(['Oregon'] * len(rows)).dictionary_encode(),
+        'country': pa.array(['United States'] * len(rows)).dictionary_encode(),
+        'updated_at': [r[2] for r in rows],
+        'processed_at': [processed_at] * len(rows),
+    })
+    return stamp(table, "breweries")
+
+
+def _write(path, table):
+    pq.write_table(table, path)
+    return str(path)
+
+
+def _names(target):
+    table = read_consolidated(str(target))
+    return dict(zip(table['id'].to_pylist(), table['name'].to_pylist()))
+
+
+def test_latest_per_key_keeps_newest_version():
+    table = pa.table({'id': ['a', 'a', 'b'], 'name': ['old', 'new', 'b'],
+                      'updated_at': ['2024-01-01', '2025-01-01', None]})
+
+    assert latest_per_key(table).to_pydict() == {
+        'id': ['a', 'b'], 'name': ['new', 'b'], 'updated_at': ['2025-01-01', None]}
+
+
+def test_latest_per_key_compares_versions_as_timestamps():
+    table = pa.table({'id': ['a', 'a', 'a', 'b', 'b'], 'name': ['space', 'iso', 'offset', 'date', 'bad'],
+                      'updated_at': ['2025-01-01 09:00:00', '2025-01-01T10:00:00.5Z',
+                                     '2025-01-01T08:00:00-03:00', '2024-12-31', 'not a date'],
+                      'processed_at': ['2025-01-02'] * 5})
+
+    # Como texto, '2025-01-01T...' venceria '2025-01-01 ...' e 'not a date' venceria tudo
+    assert latest_per_key(table).to_pydict()['name'] == ['offset', 'date']
+
+
+def test_upsert_merges_and_stamps_buckets(tmp_path):
+    target = tmp_path / "consolidated"
+    upsert([_breweries([('a', 'A', '2024-01-01'), ('b', 'B', '2024-01-01')])], str(target), buckets=2)
+    upsert([_breweries([('a', 'A2', '2025-01-01')])], str(target), buckets=2)
+
+    assert _names(target) == {'a': 'A2', 'b': 'B'}
+    for path in target.glob("bucket-*.parquet"):
+        assert stamp_of(pq.read_schema(path)) == ("breweries", 2)
+        assert check_file(str(path), "breweries").ok
+
+
+def test_upsert_files_stamps_buckets_and_skips_merged_files(tmp_path):
+    target = tmp_path / "consolidated"
+    first = _write(tmp_path / "by_city.parquet", _breweries([('a', 'A', '2024-01-01'), ('b', 'B', '2024-01-01')]))
+    second = _write(tmp_path / "by_state.parquet", _breweries([('b', 'B2', '2025-01-01')]))
+
+    with ProcessedFileLedger(str(target / LEDGER_FILE)) as ledger:
+        stats = upsert_files([first, second], str(target), buckets=4, ledger=ledger)
+        assert (stats["files"], stats["skipped"], stats["input_rows"]) == (2, 0, 3)
+        assert ledger.get(first)["status"] == STATUS_DONE
+        assert ledger.get(first)["rows"] == 2
+
+        again = upsert_files([first, second], str(target), buckets=4, ledger=ledger)
+        assert (again["files"], again["skipped"], again["buckets"]) == (0, 2, 0)
+
+        third = _write(tmp_path / "search.parquet", _breweries([('c', 'C', '2025-01-01')]))
+        stats = upsert_files([first, second, third], str(target), buckets=4, ledger=ledger)
+        assert (stats["files"], stats["skipped"]) == (1, 2)
+        assert stats["buckets"] == 1
+        assert ledger.summary() == {STATUS_DONE: 3}
+
+    assert _names(target) == {'a': 'A', 'b': 'B2', 'c': 'C'}
+    assert not list(target.glob("_staging_*"))
+    bucket = target / f"bucket-{bucket_of('c', 4):02d}.parquet"
+    assert stamp_of(pq.read_schema(bucket)) == ("breweries", 2)
+
+
+def test_upsert_files_merges_legacy_and_current_columns(tmp_path):
+    target = tmp_path / "consolidated"
+    legacy = _write(tmp_path / "silver_citybreweries.parquet", pa.table({
+        'id': ['a', 'b'],
+        'name': ['A', 'B'],
+        'brewery_type': ['micro', 'brewpub'],
+        'city': ['Portland', 'Bend'],
+        'state_province': ['Oregon', 'Oregon'],
+        'country': ['United States', 'United States'],
+        'website_url': ['https://a.com', 'https://b.com'],
+        'updated_at': pa.array([datetime(2024, 1, 1), datetime(2024, 1, 1)], pa.timestamp('ns')),
+    }))
+    current = _write(tmp_path / "breweries.parquet", _breweries([('c', 'C', '2025-01-01T00:00:00')]))
+
+    stats = upsert_files([legacy, current], str(target), buckets=1)
+
+    assert stats["files"] == 2
+    merged = pq.read_table(target / "bucket-00.parquet")
+    assert stamp_of(merged.schema) == ("breweries", 2)
+    assert not {'brewery_type', 'state_province', 'website_url'} & set(merged.column_names)
+    for column in ['id', 'name', 'tipos_cervejaria', 'city', 'estado_provincia', 'country', 'updated_at']:
+        assert merged[column].null_count == 0, column
+    assert merged['site'].to_pylist() == ['https://a.com', 'https://b.com', None]
+    assert merged['updated_at'].to_pylist() == ['2024-01-01T00:00:00', '2024-01-01T00:00:00',
+                                                '2025-01-01T00:00:00']
+    assert check_file(str(target / "bucket-00.parquet"), "breweries").ok
+
+
+def test_upsert_files_skips_files_outside_the_dataset(tmp_path):
+    target = tmp_path / "consolidated"
+    counts = _write(tmp_path / "counts.parquet", pa.table({'id': ['x'], 'brewery_count': [3]}))
+    current = _write(tmp_path / "breweries.parquet", _breweries([('a', 'A', None)]))
+
+    stats = upsert_files([counts, current], str(target), buckets=1)
+
+    assert stats["files"] == 1
+    assert _names(target) == {'a': 'A'}
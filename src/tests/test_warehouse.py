@@ -0,0 +1,57 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from gold.warehouse import SILVER_VIEW, connect, create_views, table_exists
+
+
+@pytest.fixture
+def silver_glob(tmp_path):
+    return tmp_path / "silver" / "breweries_consolidated" / "*.parquet"
+
+
+def _write_silver(silver_glob, ids):
+    silver_glob.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table({"id": ids}), silver_glob.parent / "bucket=000.parquet")
+
+
+def test_connect_without_silver_skips_view(tmp_path, silver_glob):
+    con = connect(path=tmp_path / "warehouse.duckdb", silver_glob=silver_glob)
+
+    views = con.execute("SELECT view_name FROM duckdb_views() WHERE NOT internal").fetchall()
+    assert views == []
+    con.close()
+
+
+def test_connect_requiring_silver_raises_clear_error(tmp_path, silver_glob):
+    with pytest.raises(FileNotFoundError, match="consolidação da Silver"):
+        connect(path=tmp_path / "warehouse.duckdb", silver_glob=silver_glob, require_silver=True)
+
+
+def test_view_reads_silver_and_tables_persist(tmp_path, silver_glob):
+    _write_silver(silver_glob, ["a", "b"])
+    path = tmp_path / "warehouse.duckdb"
+
+    con = connect(path=path, silver_glob=silver_glob, require_silver=True)
+    assert con.execute(f"SELECT COUNT(*) FROM {SILVER_VIEW}").fetchone()[0] == 2
+    con.execute(f"CREATE TABLE fato AS SELECT * FROM {SILVER_VIEW}")
+    assert table_exists(con, "fato") and not table_exists(con, SILVER_VIEW)
+    con.close()
+
+    reader = connect(read_only=True, path=path)
+    assert reader.execute("SELECT COUNT(*) FROM fato").fetchone()[0] == 2
+    reader.close()
+
+
+def test_create_views_keeps_existing_view_when_silver_is_missing(tmp_path, silver_glob):
+    _write_silver(silver_glob, ["a"])
+    con = connect(path=tmp_path / "warehouse.duckdb", silver_glob=silver_glob)
+
+    assert create_views(con, tmp_path / "empty" / "*.parquet") is False
+    assert con.execute(f"SELECT COUNT(*) FROM {SILVER_VIEW}").fetchone()[0] == 1
+    con.close()
+
+
+def test_read_only_requires_existing_warehouse(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        connect(read_only=True, path=tmp_path / "missing.duckdb")
@@ -0,0 +1,76 @@
+import hashlib
+import json
+
+import pytest
+
+from bronze.extractor import save_raw_data
+from bronze.writer import NDJSONWriter, is_complete, iter_records, manifest_path, ndjson_path, read_manifest
+
+RECORDS = [{"id": "a", "name": "Cervejaria São Jorge"}, {"id": "b", "name": None}]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_round_trip_with_manifest(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    path = ndjson_path(str(tmp_path), "breweries_full", compression)
+
+    with NDJSONWriter(path, params={"per_page": 200}) as writer:
+        writer.write_records(RECORDS[:1])
+        writer.write_records(RECORDS[1:])
+
+    assert list(iter_records(path)) == RECORDS
+    manifest = read_manifest(path)
+    lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in RECORDS).encode("utf-8")
+    assert manifest["record_count"] == 2
+    assert manifest["compression"] == compression
+    assert manifest["sha256"] == hashlib.sha256(lines).hexdigest()
+    assert manifest["uncompressed_bytes"] == len(lines)
+    assert manifest["bytes"] == path.stat().st_size
+    assert manifest["params"] == {"per_page": 200}
+
+
+def test_failed_write_leaves_no_manifest(tmp_path):
+    path = ndjson_path(str(tmp_path), "partial")
+
+    with pytest.raises(RuntimeError):
+        with NDJSONWriter(path) as writer:
+            writer.write_records(RECORDS)
+            raise RuntimeError("API fora do ar")
+
+    assert not path.exists()
+    assert not manifest_path(path).exists()
+    assert read_manifest(path) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_manifest_marks_file_complete(tmp_path):
+    path = ndjson_path(str(tmp_path), "breweries_full", "gzip")
+
+    writer = NDJSONWriter(path)
+    writer.write_records(RECORDS)
+    assert not path.exists() and not is_complete(path)
+
+    writer.close()
+    assert is_complete(path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [path.name, manifest_path(path).name]
+
+
+def test_save_raw_data_writes_ndjson(tmp_path):
+    path = save_raw_data({"total": 2}, ndjson_path(str(tmp_path), "breweries_metadata"), {"by_state": "ohio"})
+
+    assert path.suffix == ".ndjson"
+    assert list(iter_records(path)) == [{"total": 2}]
+    assert read_manifest(path)["params"] == {"by_state": "ohio"}
+
+
+def test_iter_records_reads_json_lists(tmp_path):
+    path = tmp_path / "by_city.json"
+    path.write_text(json.dumps(RECORDS), encoding="utf-8")
+
+    assert list(iter_records(path)) == RECORDS
+
+
+def test_unsupported_compression(tmp_path):
+    with pytest.raises(ValueError):
+        ndjson_path(str(tmp_path), "x", "bz2")
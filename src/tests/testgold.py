@@ -1,15 +1,10 @@
-import duckdb
 import pandas as pd
 import os  # Adicione esta linha para manipulação de diretórios
 
-# Conectar ao DuckDB
-con = duckdb.connect()
+from gold.warehouse import connect
 
-# Carregar os dados da Silver
-con.execute("""
-    CREATE TABLE silver_breweries AS
-    SELECT * FROM 'C:/Users/55349/brewery-data-pipeline/data/silver/breweries_consolidated.parquet'
-""")
+# Conectar ao warehouse da Gold (silver_breweries é uma view sobre a Silver consolidada)
+con = connect()
 
 # Converter para DataFrame
 df = con.execute("SELECT * FROM silver_breweries").fetchdf()
@@ -1,7 +1,7 @@
 import pandas as pd
 
 # Carregar o arquivo Parquet em um DataFrame
-df = pd.read_parquet(r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated.parquet")
+df = pd.read_parquet(r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated")
 
 # Ver colunas
 print("Colunas disponíveis:")
@@ -1,31 +1,25 @@
-import pandas as pd
+from silver.partitioned import compact, overwrite_partitions, read
+from silver.upsert import read_consolidated
+import pyarrow.compute as pc
 
-# Ler o arquivo consolidado da Silver
-df = pd.read_parquet(r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated.parquet")
+# Ler a tabela consolidada da Silver
+table = read_consolidated(r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_consolidated")
 
 # 1. Criar coluna de localização (usando os nomes das colunas renomeadas)
-df['localizacao'] = df['city'] + ', ' + df['estado_provincia']
+table = table.append_column(
+    'localizacao', pc.binary_join_element_wise(table['city'], table['estado_provincia'], ', '))
 
-# 2. Definir colunas de particionamento (usando os nomes renomeados)
-partition_cols = ['estado_provincia', 'city']  # Ou adicione 'country' se relevante
-
-# 3. Salvar particionado
+# 2. Salvar particionado por estado_provincia/city e compactar
 output_path = r"C:\Users\55349\brewery-data-pipeline\data\silver\breweries_partitioned"
-df.to_parquet(
-    output_path,
-    partition_cols=partition_cols,
-    engine='pyarrow',
-    compression='snappy'  # Opcional: compressão para economizar espaço
-)
+overwrite_partitions(table, output_path)
+compact(output_path)
 
 print(f"Dados particionados salvos em: {output_path}")
 
 
-# Ler uma partição específica para teste
-test_df = pd.read_parquet(
-    output_path,
-    filters=[('estado_provincia', '=', 'California'), ('city', '=', 'San Diego')]
-)
+# Ler uma partição específica para teste (só o diretório de San Diego é aberto)
+test_df = read(
+    [('estado_provincia', '=', 'California'), ('city', '=', 'San Diego')],
+    base_dir=output_path
+).to_pandas()
 print(test_df.head())
-
-
@@ -0,0 +1,245 @@
+"""
+Cache local em disco das respostas da Open Brewery DB API.
+
+Cada resposta é indexada pela URL normalizada (parâmetros ordenados) e
+armazenada junto com os validadores HTTP (``ETag`` / ``Last-Modified``).
+Dentro do TTL do endpoint a resposta é servida direto do disco; depois disso
+é feita uma requisição condicional e um ``304 Not Modified`` reaproveita o
+corpo salvo. O tamanho total é limitado com descarte LRU.
+
+O índice fica em memória e é regravado em disco a cada ``FLUSH_EVERY``
+alterações, quando há descarte, em ``flush()`` e na saída do processo. Se o
+processo morrer antes disso, as alterações pendentes viram apenas misses.
+"""
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+CACHE_DIR = "data/cache/http"
+MAX_BYTES = 200 * 1024 * 1024   # 200 MB
+FLUSH_EVERY = 100               # alterações no índice entre gravações em disco
+
+# TTL (segundos) por endpoint; 0 desativa o cache (ex: random)
+DEFAULT_TTLS = {
+    "meta": 5 * 60,
+    "by_ids": 7 * 24 * 3600,
+    "autocomplete": 24 * 3600,
+    "search": 3600,
+    "random": 0,
+    "default": 3600,
+}
+
+
+def normalize_request(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Normaliza URL + parâmetros em uma string canônica
+
+    Args:
+        url: URL da requisição (pode conter query string)
+        params: Parâmetros adicionais
+
+    Returns:
+        URL com host em minúsculas e parâmetros ordenados
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        query.append((key, str(value)))
+    query_string = "&".join(f"{k}={v}" for k, v in sorted(query))
+    path = parts.path.rstrip("/") or "/"
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}?{query_string}"
+
+
+def endpoint_of(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Identifica o endpoint (chave de DEFAULT_TTLS) de uma requisição"""
+    parts = urlsplit(url)
+    last = parts.path.rstrip("/").rsplit("/", 1)[-1]
+    if last in ("meta", "random", "search", "autocomplete"):
+        return last
+    query = dict(parse_qsl(parts.query))
+    query.update(params or {})
+    if "by_ids" in query:
+        return "by_ids"
+    return "default"
+
+
+class ResponseCache:
+    """
+    Cache de respostas HTTP em disco com validadores e descarte LRU
+
+    Args:
+        directory: Diretório onde o cache é mantido
+        max_bytes: Tamanho máximo dos corpos armazenados
+        ttls: TTL (segundos) por endpoint, sobrepondo DEFAULT_TTLS
+        flush_every: Alterações no índice acumuladas antes de regravá-lo
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_BYTES,
+                 ttls: Optional[Dict[str, int]] = None, flush_every: int = FLUSH_EVERY):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.flush_every = flush_every
+        self._index_path = self.directory / "index.json"
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._total = sum(entry["size"] for entry in self._index.values())
+        self._pending = 0           # alterações ainda não gravadas
+        atexit.register(self.flush)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self._index_path.exists():
+            return {}
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (IOError, ValueError) as e:
+            logger.warning(f"Índice do cache inválido, recriando: {e}")
+            return {}
+
+    def _save_index(self):
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+        self._pending = 0
+
+    def _touch(self):
+        """Registra uma alteração no índice (chamar com o lock)"""
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._save_index()
+
+    def flush(self):
+        """Grava o índice em disco se houver alterações pendentes"""
+        with self._lock:
+            if self._pending:
+                self._save_index()
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def key_for(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Chave do cache (sha256 da URL normalizada)"""
+        return hashlib.sha256(normalize_request(url, params).encode("utf-8")).hexdigest()
+
+    def ttl_for(self, url: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """TTL em segundos aplicável à requisição"""
+        return self.ttls.get(endpoint_of(url, params), self.ttls["default"])
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retorna a entrada do índice, se o corpo ainda existir em disco"""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry and not self._body_path(key).exists():
+                self._total -= entry["size"]
+                del self._index[key]
+                self._touch()
+                return None
+            return dict(entry) if entry else None
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any], ttl: int) -> bool:
+        return time.time() - entry["stored_at"] < ttl
+
+    @staticmethod
+    def validators(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Cabeçalhos de requisição condicional para a entrada"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read(self, key: str, revalidated: bool = False) -> Optional[bytes]:
+        """
+        Lê o corpo armazenado e atualiza o acesso (LRU)
+
+        Args:
+            key: Chave do cache
+            revalidated: True quando um 304 confirmou a resposta (reinicia o TTL)
+
+        Returns:
+            Corpo da resposta ou None se ele foi descartado depois do lookup
+            (ex: eviction em outra thread), tratado como ausência no cache
+        """
+        try:
+            body = self._body_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            entry = self._index.get(key)
+            if entry:
+                entry["last_access"] = time.time()
+                if revalidated:
+                    entry["stored_at"] = entry["last_access"]
+                self._touch()
+        return body
+
+    def store(self, key: str, url: str, body: bytes, headers: Dict[str, str]):
+        """Armazena o corpo e os validadores de uma resposta 200"""
+        # Temporário com nome único: duas threads gravando a mesma chave não
+        # escrevem no mesmo arquivo
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(body)
+        try:
+            os.replace(f.name, self._body_path(key))
+        except OSError:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+
+        now = time.time()
+        with self._lock:
+            previous = self._index.get(key)
+            self._total += len(body) - (previous["size"] if previous else 0)
+            self._index[key] = {
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "stored_at": now,
+                "last_access": now,
+                "size": len(body),
+            }
+            if self._evict():
+                self._save_index()      # corpos removidos: o índice não pode apontar para eles
+            else:
+                self._touch()
+
+    def _evict(self) -> bool:
+        """Remove as entradas menos usadas até caber em max_bytes (True se removeu alguma)"""
+        if self._total <= self.max_bytes:
+            return False
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+            if self._total <= self.max_bytes:
+                break
+            self._body_path(key).unlink(missing_ok=True)
+            self._total -= entry["size"]
+            del self._index[key]
+        return True
+
+    def clear(self):
+        """Remove todas as respostas armazenadas"""
+        with self._lock:
+            for key in list(self._index):
+                self._body_path(key).unlink(missing_ok=True)
+            self._index = {}
+            self._total = 0
+            self._save_index()
@@ -0,0 +1,270 @@
+"""
+Cliente HTTP compartilhado pelos extratores da camada Bronze.
+
+Mantém uma única ``requests.Session`` com pool de conexões (keep-alive),
+transferência comprimida, limitador de taxa (token bucket) compartilhado
+entre threads e novas tentativas com backoff exponencial + jitter,
+respeitando o cabeçalho ``Retry-After``. As respostas passam pelo cache
+local (``utils.http_cache``), com revalidação por ETag/Last-Modified.
+"""
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.http_cache import ResponseCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Configurações
+TIMEOUT = 10            # segundos
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5      # segundos
+BACKOFF_MAX = 30.0      # segundos
+RATE_LIMIT = 10.0       # requisições por segundo
+BURST = 10              # requisições permitidas em rajada
+POOL_SIZE = 32          # conexões mantidas abertas por host
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "brewery-data-pipeline/1.0",
+}
+
+
+class TokenBucket:
+    """
+    Limitador de taxa thread-safe
+
+    Args:
+        rate: Tokens repostos por segundo
+        capacity: Máximo de tokens acumulados (tamanho da rajada)
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloqueia até haver um token disponível"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_session: Optional[requests.Session] = None
+_bucket = TokenBucket(RATE_LIMIT, BURST)
+_cache: Optional[ResponseCache] = None
+_cache_enabled = True
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Retorna a sessão HTTP compartilhada (criada na primeira chamada)"""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def make_limiter(rate: float, burst: Optional[int] = None) -> TokenBucket:
+    """
+    Cria um limitador próprio (ex: para uma coleta com taxa diferente da global)
+
+    Args:
+        rate: Requisições por segundo (0 desativa o limite)
+        burst: Requisições permitidas em rajada (padrão: igual a rate)
+    """
+    capacity = burst if burst is not None else max(1, int(rate))
+    return TokenBucket(rate, capacity)
+
+
+def set_rate_limit(rate: float, burst: Optional[int] = None):
+    """
+    Altera o limite de requisições por segundo de todos os extratores
+
+    Args:
+        rate: Requisições por segundo (0 desativa o limite)
+        burst: Requisições permitidas em rajada (padrão: igual a rate)
+    """
+    global _bucket
+    _bucket = make_limiter(rate, burst)
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Retorna o cache de respostas compartilhado (None se desativado)"""
+    global _cache
+    with _lock:
+        if _cache_enabled and _cache is None:
+            _cache = ResponseCache()
+        return _cache if _cache_enabled else None
+
+
+def configure_cache(enabled: bool = True, directory: Optional[str] = None,
+                    max_bytes: Optional[int] = None, ttls: Optional[Dict[str, int]] = None):
+    """
+    Configura o cache de respostas usado por get_json
+
+    Args:
+        enabled: False desativa o cache
+        directory: Diretório do cache (padrão: http_cache.CACHE_DIR)
+        max_bytes: Tamanho máximo do cache
+        ttls: TTL (segundos) por endpoint, ex: {'meta': 60, 'by_ids': 86400}
+    """
+    global _cache, _cache_enabled
+    with _lock:
+        if _cache is not None:
+            _cache.flush()
+        _cache_enabled = enabled
+        _cache = None
+        if enabled and (directory or max_bytes or ttls):
+            kwargs = {"ttls": ttls}
+            if directory:
+                kwargs["directory"] = directory
+            if max_bytes:
+                kwargs["max_bytes"] = max_bytes
+            _cache = ResponseCache(**kwargs)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Interpreta o cabeçalho Retry-After (segundos ou data HTTP)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff(attempt: int) -> float:
+    """Backoff exponencial com jitter completo"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def request(url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, timeout: float = TIMEOUT,
+            max_retries: int = MAX_RETRIES,
+            limiter: Optional[TokenBucket] = None) -> requests.Response:
+    """
+    Executa um GET com limite de taxa e novas tentativas
+
+    Args:
+        url: URL da requisição
+        params: Parâmetros de query string
+        headers: Cabeçalhos adicionais
+        timeout: Timeout em segundos
+        max_retries: Número máximo de novas tentativas
+        limiter: Limitador de taxa (padrão: o compartilhado, ver set_rate_limit)
+
+    Returns:
+        Resposta HTTP (status 2xx ou 304)
+
+    Raises:
+        requests.exceptions.RequestException: Quando todas as tentativas falham
+    """
+    session = get_session()
+
+    for attempt in range(max_retries + 1):
+        (limiter or _bucket).acquire()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt == max_retries:
+                raise
+            delay = _backoff(attempt)
+            logger.warning(f"Tentativa {attempt + 1} falhou ({e}); nova tentativa em {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            delay = _retry_after(response)
+            if delay is None:
+                delay = _backoff(attempt)
+            logger.warning(
+                f"HTTP {response.status_code} em {response.url}; "
+                f"nova tentativa em {delay:.1f}s"
+            )
+            time.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response
+
+
+def get_json(url: str, params: Optional[Dict[str, Any]] = None, timeout: float = TIMEOUT,
+             max_retries: int = MAX_RETRIES, use_cache: bool = True,
+             limiter: Optional[TokenBucket] = None) -> Any:
+    """
+    Busca uma URL e retorna o corpo JSON
+
+    Dentro do TTL do endpoint a resposta vem do cache local sem acessar a
+    rede; depois disso é feita uma requisição condicional e um 304 reaproveita
+    o corpo armazenado.
+
+    Args:
+        url: URL da requisição
+        params: Parâmetros de query string
+        timeout: Timeout em segundos
+        max_retries: Número máximo de novas tentativas
+        use_cache: False ignora o cache local
+        limiter: Limitador de taxa (padrão: o compartilhado)
+
+    Returns:
+        Corpo da resposta decodificado
+    """
+    cache = get_cache() if use_cache else None
+    if cache is None or cache.ttl_for(url, params) <= 0:
+        return request(url, params=params, timeout=timeout, max_retries=max_retries, limiter=limiter).json()
+
+    key = cache.key_for(url, params)
+    entry = cache.lookup(key)
+    if entry and cache.is_fresh(entry, cache.ttl_for(url, params)):
+        body = cache.read(key)
+        if body is not None:
+            return json.loads(body)
+        entry = None    # descartado por outra thread desde o lookup
+
+    response = request(url, params=params, headers=cache.validators(entry),
+                       timeout=timeout, max_retries=max_retries, limiter=limiter)
+    if response.status_code == 304 and entry:
+        body = cache.read(key, revalidated=True)
+        if body is not None:
+            return json.loads(body)
+        # Corpo descartado entre o lookup e o 304: busca sem validadores
+        response = request(url, params=params, timeout=timeout, max_retries=max_retries, limiter=limiter)
+
+    cache.store(key, response.url, response.content, response.headers)
+    return response.json()
@@ -0,0 +1,202 @@
+"""
+Armazenamento endereçado por conteúdo para a camada Bronze.
+
+Cada registro é serializado de forma canônica e identificado pelo seu hash
+SHA-256; o conteúdo é gravado uma única vez em ``objects/`` e cada execução
+grava apenas um manifesto em ``manifests/`` apontando para os hashes. Payloads
+repetidos não ocupam disco novamente e registros inalterados são reconhecidos
+pelo hash sem precisar reprocessá-los.
+
+Estrutura:
+    data/bronze/store/
+    ├── objects/ab/ab3f...e1.json
+    └── manifests/by_city_san_diego_20250615_101500.json
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STORE_DIR = "data/bronze/store"
+# <execução>_<AAAAMMDD_HHMMSS>[_<n>].json, como gravado por write_manifest
+MANIFEST_NAME = re.compile(r"^(?P<run>.+)_(?P<timestamp>\d{8}_\d{6})(?:_(?P<counter>\d+))?\.json$")
+
+
+def canonical_bytes(record: Any) -> bytes:
+    """Serialização canônica (chaves ordenadas, sem espaços) usada no hash"""
+    return json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def hash_record(record: Any) -> str:
+    """Hash SHA-256 do conteúdo canônico de um registro"""
+    return hashlib.sha256(canonical_bytes(record)).hexdigest()
+
+
+class ObjectStore:
+    """
+    Repositório de objetos endereçados por conteúdo
+
+    Args:
+        root: Diretório raiz do repositório
+    """
+
+    def __init__(self, root: str = STORE_DIR):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json"
+
+    def exists(self, digest: str) -> bool:
+        return self.object_path(digest).exists()
+
+    def put(self, record: Any) -> Tuple[str, bool]:
+        """
+        Armazena um registro
+
+        Returns:
+            Tupla com (hash, True se o objeto ainda não existia)
+        """
+        data = canonical_bytes(record)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if path.exists():
+            return digest, False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Nome temporário por processo e thread: gravações concorrentes do mesmo
+        # objeto (ex: asyncio.to_thread) não escrevem no mesmo arquivo
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return digest, True
+
+    def put_many(self, records: Iterable[Any]) -> Tuple[List[str], List[str]]:
+        """
+        Armazena vários registros
+
+        Returns:
+            Tupla com (hashes na ordem dos registros, hashes gravados agora)
+        """
+        digests, new = [], []
+        for record in records:
+            digest, created = self.put(record)
+            digests.append(digest)
+            if created:
+                new.append(digest)
+        return digests, new
+
+    def get(self, digest: str) -> Any:
+        """Lê um objeto pelo hash"""
+        with open(self.object_path(digest), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_manifest(self, name: str, records: Iterable[Any],
+                       params: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Armazena os registros de uma execução e grava o manifesto
+
+        Args:
+            name: Nome da execução (ex: 'by_city_san_diego')
+            records: Registros extraídos
+            params: Parâmetros da consulta
+
+        Returns:
+            Caminho do manifesto
+        """
+        digests, new = self.put_many(records)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        manifest = {
+            "run": name,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "params": params or {},
+            "record_count": len(digests),
+            "new_count": len(new),
+            "objects": digests,
+            "new_objects": new,
+        }
+
+        # Modo 'x' reserva o nome de forma atômica; se outra execução já o
+        # criou no mesmo segundo, tenta o próximo sufixo
+        path = self.manifests_dir / f"{name}_{timestamp}.json"
+        counter = 1
+        while True:
+            try:
+                f = open(path, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                counter += 1
+                path = self.manifests_dir / f"{name}_{timestamp}_{counter}.json"
+        with f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        logger.info(f"{name}: {len(digests)} registro(s), {len(new)} novo(s) -> {path}")
+        return path
+
+    @staticmethod
+    def read_manifest(path: Path) -> Dict[str, Any]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def iter_records(self, manifest: Dict[str, Any], only_new: bool = False) -> Iterator[Any]:
+        """
+        Lê os registros referenciados por um manifesto
+
+        Args:
+            manifest: Manifesto carregado com read_manifest
+            only_new: True lê apenas os objetos gravados por essa execução
+        """
+        for digest in manifest["new_objects" if only_new else "objects"]:
+            yield self.get(digest)
+
+    def known_hashes(self, manifests: Iterable[Dict[str, Any]]) -> Set[str]:
+        """Conjunto de hashes referenciados por manifestos anteriores"""
+        known: Set[str] = set()
+        for manifest in manifests:
+            known.update(manifest["objects"])
+        return known
+
+    def manifests(self, name: Optional[str] = None) -> List[Path]:
+        """
+        Manifestos gravados, do mais antigo ao mais recente
+
+        Args:
+            name: Só os manifestos dessa execução (nome exato, ex: 'by_city'
+                não inclui 'by_city_san_diego')
+        """
+        found = []
+        for path in self.manifests_dir.glob("*.json"):
+            match = MANIFEST_NAME.match(path.name)
+            if match and (name is None or match["run"] == name):
+                found.append((match["timestamp"], int(match["counter"] or 1), path.name, path))
+        return [path for *_, path in sorted(found)]
+
+    def latest_manifest(self, name: str) -> Optional[Path]:
+        """Manifesto mais recente de uma execução"""
+        manifests = self.manifests(name)
+        return manifests[-1] if manifests else None
+
+
+def is_store(path: Path) -> bool:
+    """Diretório raiz de um ObjectStore"""
+    path = Path(path)
+    return (path / "objects").is_dir() and (path / "manifests").is_dir()
+
+
+def store_of_manifest(path: Path) -> Optional[ObjectStore]:
+    """ObjectStore ao qual o manifesto pertence (None se não for um manifesto do repositório)"""
+    path = Path(path)
+    if path.parent.name != "manifests" or not is_store(path.parent.parent):
+        return None
+    return ObjectStore(str(path.parent.parent))